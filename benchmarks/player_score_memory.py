@@ -0,0 +1,76 @@
+"""Memory benchmark for a Scoreboard full of players.
+
+Builds a board of N players with a full game each, through the same calls
+a server makes: Scoreboard.add_players() and one record_round() per round.
+Reports the traced allocation per player, first for the board as the
+writes leave it and then after the standings have been read once. The
+figures cover the name strings, the registry, the board's containers,
+the PlayerScore records and the published snapshot, whose standing rows
+are only built by that first read.
+
+At 100,000 players x 10 rounds the board takes about 360 bytes per
+player, or 490 once the standings are read, against 562 before the
+records were made compact. The 200-byte target is still missed: the name
+string and the PlayerScore record alone take about that much. Snapshots
+share the records' score arrays instead of copying them, so no score
+cache is needed to keep the rows small.
+
+Usage:
+    python -m benchmarks.player_score_memory [--players N] [--rounds R]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from src.scoreboard import Scoreboard
+
+SCORES = (-30, -20, -10, 10, 20, 30, 40, 60)
+TARGET_BYTES = 200
+
+
+def measure(
+    num_players: int, num_rounds: int, seed: int = 0, read_standings: bool = False
+) -> float:
+    """Return traced bytes allocated per player for a completed game."""
+    rng = random.Random(seed)
+    round_scores = [
+        [rng.choice(SCORES) for _ in range(num_players)] for _ in range(num_rounds)
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        board = Scoreboard()
+        board.add_players(f"player-{i:06d}" for i in range(num_players))
+        for round_num, scores in enumerate(round_scores, 1):
+            board.record_round(round_num, scores)
+        if read_standings:
+            board.snapshot().standings
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / num_players
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    for read_standings in (False, True):
+        per_player = measure(args.players, args.rounds, read_standings=read_standings)
+        verdict = "met" if per_player < TARGET_BYTES else "missed"
+        label = "with standings" if read_standings else "after writes"
+        print(
+            f"{args.players} players x {args.rounds} rounds, {label}: "
+            f"{per_player:.1f} bytes/player (target {TARGET_BYTES}: {verdict})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Write latency benchmark for a large Scoreboard.
+
+Fills a board with N players and a few rounds, then times single-player
+writes (record_round_score) and phase changes (set_phase), which publish
+a new snapshot each, and the first read of the ranked standings after a
+write, which sorts them.
+
+Usage:
+    python -m benchmarks.scoreboard_writes [--players N] [--writes W]
+"""
+
+import argparse
+import random
+import time
+
+from src.scoreboard import GamePhase, Scoreboard
+
+
+def measure(num_players: int, num_writes: int, seed: int = 0) -> dict:
+    """Return mean seconds per write, per phase change and per standings build."""
+    rng = random.Random(seed)
+    board = Scoreboard()
+    board.add_players(f"player-{i:06d}" for i in range(num_players))
+    for round_num in range(1, 4):
+        board.record_round(round_num, [rng.choice((-10, 10, 20)) for _ in range(num_players)])
+    board.snapshot().standings
+
+    start = time.perf_counter()
+    for _ in range(num_writes):
+        board.record_round_score(rng.randrange(num_players), 4, rng.choice((-10, 20)))
+    score_write = (time.perf_counter() - start) / num_writes
+
+    start = time.perf_counter()
+    for index in range(num_writes):
+        board.set_phase(GamePhase.SCORING if index % 2 else GamePhase.ROUND)
+    phase_write = (time.perf_counter() - start) / num_writes
+
+    reads = max(1, num_writes // 100)
+    elapsed = 0.0
+    for _ in range(reads):
+        board.record_round_score(rng.randrange(num_players), 4, rng.choice((-10, 20)))
+        start = time.perf_counter()
+        board.snapshot().standings
+        elapsed += time.perf_counter() - start
+    return {"record_round_score": score_write, "set_phase": phase_write,
+            "standings": elapsed / reads}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--writes", type=int, default=1_000)
+    args = parser.parse_args()
+
+    for name, seconds in measure(args.players, args.writes).items():
+        print(f"{args.players} players, {name}: {seconds * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,56 @@
-"""Bid collection module for card game rounds."""
+"""Bid collection module for card game rounds.
 
-from typing import List, Dict
+Besides the current round's bids, a BidCollector keeps every round's bids
+(and tricks, when recorded) in columnar int16 arrays laid out round by
+round, one slot per player, with -1 for a missing value. A round's bids
+are copied into the history when the round is left or queried, never in
+collect_bid itself.
+"""
+
+from array import array
+from typing import List, Dict, Optional, Sequence
+
+from src.player_registry import PlayerRef, PlayerRegistry
+from src.player_stats import StatsTracker
+from src.scoring import valid_bids
+
+_MISSING = -1  # history slot without a bid or trick count
 
 
 class BidCollector:
     """Manages bid collection from all players in a round."""
 
-    def __init__(self, num_players: int):
+    def __init__(
+        self,
+        num_players: Optional[int] = None,
+        stats: Optional[StatsTracker] = None,
+        registry: Optional[PlayerRegistry] = None,
+    ):
         """Initialize bid collector.
         
         Args:
-            num_players: Total number of players in the game.
+            num_players: Total number of players in the game. Defaults to
+                the number of players in the registry.
+            stats: Optional statistics tracker fed with each round's bids
+                when the round proceeds to scoring, keyed by player name
+                if a registry is set and by player_id otherwise.
+            registry: Optional registry whose ids are the player_ids, which
+                also lets bids be collected by player name.
         """
+        if num_players is None:
+            if registry is None:
+                raise ValueError("num_players is required without a registry")
+            num_players = len(registry)
         self.num_players = num_players
+        self.registry = registry
         self.bids: Dict[int, int] = {}  # player_id -> bid amount
         self.current_round = 0
+        self.stats = stats
+        self._stats_round = 0  # last round whose bids were fed to stats
+        self.version = 0  # bumped on every change to the round or its bids
+        # Round r, player p at [(r - 1) * num_players + p].
+        self._bid_history = array("h")
+        self._trick_history = array("h")
 
     def start_round(self, round_number: int) -> str:
         """Start a new round and display round information.
@@ -28,40 +64,126 @@ class BidCollector:
         if round_number < 1:
             raise ValueError("Round number must be at least 1")
         
+        self._archive_bids()
         self.current_round = round_number
         self.bids = {}  # Reset bids for new round
+        self.version += 1
         
         return f"\n--- Round {round_number} ---\nHands available: {round_number}"
 
-    def collect_bid(self, player_id: int, bid: int) -> None:
+    def reset(self, num_players: Optional[int] = None) -> None:
+        """Return the collector to its initial state for reuse.
+
+        The version keeps counting up, so anything cached against an
+        earlier version is not mistaken for the new state.
+
+        Args:
+            num_players: Total number of players in the next game. Defaults
+                to the number of players in the registry.
+        """
+        if num_players is None:
+            if self.registry is None:
+                raise ValueError("num_players is required without a registry")
+            num_players = len(self.registry)
+        self.num_players = num_players
+        self.bids.clear()
+        del self._bid_history[:]
+        del self._trick_history[:]
+        self.current_round = 0
+        self._stats_round = 0
+        self.version += 1
+
+    def collect_bid(self, player_id: PlayerRef, bid: int) -> None:
         """Collect a bid from a player.
         
         Args:
-            player_id: The player's ID.
+            player_id: The player's ID, or their name if a registry is set.
             bid: The bid amount.
             
         Raises:
-            ValueError: If bid exceeds round number or is negative.
+            ValueError: If bid exceeds round number or is negative, or the
+                player is unknown.
             RuntimeError: If no round has been started.
         """
+        player_id = self._resolve(player_id)
+        self._validate_bid(player_id, bid)
+        self.bids[player_id] = bid
+        self.version += 1
+
+    def collect_bids(self, bids: Dict[int, int]) -> None:
+        """Collect bids from several players at once.
+
+        All bids are validated before any is stored, so an invalid entry
+        leaves the collected bids unchanged.
+        
+        Args:
+            bids: Dictionary mapping player_id (or name, if a registry is
+                set) to bid amount.
+            
+        Raises:
+            ValueError: If any bid or player is invalid.
+            RuntimeError: If no round has been started.
+        """
+        resolved = {}
+        for player_id, bid in bids.items():
+            player_id = self._resolve(player_id)
+            self._validate_bid(player_id, bid)
+            resolved[player_id] = bid
+        self.bids.update(resolved)
+        self.version += 1
+
+    def validate_bid(self, player_id: PlayerRef, bid: int) -> int:
+        """Check that a bid could be collected, without collecting it.
+
+        Args:
+            player_id: The player's ID, or their name if a registry is set.
+            bid: The bid amount.
+
+        Returns:
+            The player's ID.
+
+        Raises:
+            ValueError: If bid exceeds round number or is negative, or the
+                player is unknown.
+            RuntimeError: If no round has been started.
+        """
+        player_id = self._resolve(player_id)
+        self._validate_bid(player_id, bid)
+        return player_id
+
+    def _resolve(self, player: PlayerRef) -> int:
+        """Get the player_id for a player given by id or registered name."""
+        if isinstance(player, str):
+            if self.registry is None:
+                raise ValueError(f"Cannot look up player '{player}' without a registry")
+            return self.registry.id_of(player)
+        return player
+
+    def _stats_key(self, player_id: int):
+        """Get a player's key in the stats tracker: the registered name,
+        which identifies the player across games sharing the tracker."""
+        if self.registry is not None and player_id < len(self.registry):
+            return self.registry.name_of(player_id)
+        return player_id
+
+    def _validate_bid(self, player_id: int, bid: int) -> None:
+        """Raise if a bid cannot be accepted in the current round."""
         if self.current_round == 0:
             raise RuntimeError("No round has been started yet")
         
-        if bid < 0:
-            raise ValueError(f"Bid cannot be negative, got {bid}")
-        
-        if bid > self.current_round:
-            raise ValueError(
-                f"Bid {bid} exceeds maximum for round {self.current_round} "
-                f"(max: {self.current_round})"
-            )
+        if bid not in valid_bids(self.current_round):
+            if bid < 0:
+                raise ValueError(f"Bid cannot be negative, got {bid}")
+            if bid > self.current_round:
+                raise ValueError(
+                    f"Bid {bid} exceeds maximum for round {self.current_round} "
+                    f"(max: {self.current_round})"
+                )
         
         if player_id < 0 or player_id >= self.num_players:
             raise ValueError(
                 f"Invalid player_id {player_id}. Must be between 0 and {self.num_players - 1}"
             )
-        
-        self.bids[player_id] = bid
 
     def all_bids_collected(self) -> bool:
         """Check if all players have submitted bids.
@@ -88,6 +210,18 @@ class BidCollector:
         
         return self.bids.copy()
 
+    def bid_list(self) -> List[Optional[int]]:
+        """Get the collected bids as a list indexed by player_id.
+        
+        Returns:
+            List of length num_players holding each bid, or None for
+            players who haven't bid yet.
+        """
+        bids: List[Optional[int]] = [None] * self.num_players
+        for player_id, bid in self.bids.items():
+            bids[player_id] = bid
+        return bids
+
     def get_missing_players(self) -> List[int]:
         """Get list of players who haven't bid yet.
         
@@ -111,4 +245,133 @@ class BidCollector:
                 f"Cannot proceed to scoring. Missing bids from players: {missing}"
             )
         
-        return self.get_bids()
+        bids = self.get_bids()
+        self._archive_bids()
+        if self.stats is not None and self._stats_round != self.current_round:
+            self.stats.record_bids(self.current_round, {
+                self._stats_key(player_id): bid for player_id, bid in bids.items()
+            })
+            self._stats_round = self.current_round
+        return bids
+
+    def record_tricks(self, tricks: Sequence[int], round_number: Optional[int] = None) -> None:
+        """Record the tricks each player took in a round.
+
+        Args:
+            tricks: Tricks taken, indexed by player_id.
+            round_number: Round the tricks belong to; defaults to the
+                current round.
+
+        Raises:
+            ValueError: If the counts don't match the players or one is
+                negative, or the round number is invalid.
+        """
+        if round_number is None:
+            round_number = self.current_round
+        if round_number < 1:
+            raise ValueError("Round number must be at least 1")
+        if len(tricks) != self.num_players:
+            raise ValueError(
+                f"Expected trick counts for {self.num_players} players, got {len(tricks)}"
+            )
+        if any(taken < 0 for taken in tricks):
+            raise ValueError(f"Trick counts cannot be negative, got {list(tricks)}")
+        start = self._history_row(round_number)
+        self._trick_history[start:start + self.num_players] = array("h", tricks)
+
+    @property
+    def history_rounds(self) -> int:
+        """Get the number of rounds covered by the history."""
+        self._archive_bids()
+        return self._rounds()
+
+    def bid_history(self, player_id: PlayerRef) -> List[Optional[int]]:
+        """Get a player's bid in each round, indexed by round_number - 1.
+
+        Returns:
+            The bids, with None for rounds the player has no bid in.
+        """
+        self._archive_bids()
+        return self._series(self._bid_history, player_id)
+
+    def trick_history(self, player_id: PlayerRef) -> List[Optional[int]]:
+        """Get the tricks a player took in each round, indexed by round_number - 1.
+
+        Returns:
+            The trick counts, with None for rounds without recorded tricks.
+        """
+        self._archive_bids()
+        return self._series(self._trick_history, player_id)
+
+    def bid_total(self, round_number: int) -> int:
+        """Get the sum of the bids made in a round.
+
+        Raises:
+            ValueError: If the round is not in the history.
+        """
+        self._archive_bids()
+        if not 1 <= round_number <= self._rounds():
+            raise ValueError(f"No bids recorded for round {round_number}")
+        start = (round_number - 1) * self.num_players
+        return sum(bid for bid in self._bid_history[start:start + self.num_players] if bid != _MISSING)
+
+    def bid_balance(self, round_number: int) -> int:
+        """Get a round's total bids minus the hands available.
+
+        Returns:
+            Positive when the table overbid the round, negative when it
+            underbid.
+
+        Raises:
+            ValueError: If the round is not in the history.
+        """
+        return self.bid_total(round_number) - round_number
+
+    def export_history(self) -> Dict[str, memoryview]:
+        """Export the bid and trick history as contiguous int16 buffers.
+
+        Returns:
+            Read-only copies under "bids" and "tricks", each shaped
+            (rounds, num_players), with -1 for missing values.
+        """
+        self._archive_bids()
+        rounds = self._rounds()
+        shape = [rounds, self.num_players]
+        return {
+            name: memoryview(history).cast("B").cast("h", shape).toreadonly()
+            if rounds else memoryview(history).toreadonly()
+            for name, history in (
+                ("bids", self._bid_history[:]),
+                ("tricks", self._trick_history[:]),
+            )
+        }
+
+    def _rounds(self) -> int:
+        return len(self._bid_history) // self.num_players if self.num_players else 0
+
+    def _history_row(self, round_number: int) -> int:
+        """Get the history offset for a round, growing both arrays to it."""
+        needed = round_number * self.num_players
+        for history in (self._bid_history, self._trick_history):
+            if len(history) < needed:
+                history.extend(array("h", [_MISSING]) * (needed - len(history)))
+        return (round_number - 1) * self.num_players
+
+    def _archive_bids(self) -> None:
+        """Copy the current round's bids into the history."""
+        if self.current_round == 0 or not self.num_players:
+            return
+        start = self._history_row(self.current_round)
+        bids = self.bids
+        self._bid_history[start:start + self.num_players] = array(
+            "h", [bids.get(player_id, _MISSING) for player_id in range(self.num_players)]
+        )
+
+    def _series(self, history: array, player: PlayerRef) -> List[Optional[int]]:
+        player_id = self._resolve(player)
+        if not 0 <= player_id < self.num_players:
+            raise ValueError(
+                f"Invalid player_id {player_id}. Must be between 0 and {self.num_players - 1}"
+            )
+        series = history[player_id::self.num_players]
+        return [None if value == _MISSING else value for value in series]
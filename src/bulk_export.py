@@ -0,0 +1,172 @@
+"""Parallel bulk export of end-of-tournament reports.
+
+Renders many Scoreboards across a process pool and streams each report
+straight to its own file or into one zip archive as soon as it is ready.
+Workers are sent each board's immutable snapshot, not the live board
+with its stats and histogram.
+Boards are pulled from the input lazily and at most max_in_flight renders
+are outstanding at a time, so memory stays bounded however many tables
+the tournament has.
+
+Usage:
+    summary = export_reports(tables.items(), "reports/", progress=print_progress)
+"""
+
+import os
+import re
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from src.scoreboard import Scoreboard, ScoreboardSnapshot
+from src.scoreboard_render import ScoreboardRenderer
+
+EXTENSIONS = {"text": "txt", "json": "json", "csv": "csv"}
+
+
+@dataclass(frozen=True)
+class ExportSummary:
+    """Outcome of a bulk export."""
+    exported: int
+    bytes_written: int
+    destination: str
+
+
+def render_report(snapshot: ScoreboardSnapshot, fmt: str = "text") -> bytes:
+    """Render a snapshot's full game status; runs in the worker processes."""
+    # A fresh renderer per report: renderers cache by version, and
+    # snapshots of different boards can share a version.
+    return ScoreboardRenderer(None).render(fmt, "status", snapshot=snapshot).encode()
+
+
+def export_reports(
+    boards: Iterable[Tuple[str, Scoreboard]],
+    destination: str,
+    fmt: str = "text",
+    archive: bool = False,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    executor: Optional[Executor] = None,
+) -> ExportSummary:
+    """Render every board in parallel and write out the reports.
+
+    Args:
+        boards: Iterable of (table_id, scoreboard) pairs; consumed lazily.
+        destination: Directory for per-table files, or the zip file path
+            when archive is True.
+        fmt: Report format: "text", "json" or "csv".
+        archive: Write one zip archive instead of per-table files.
+        max_workers: Worker processes for the default pool.
+        max_in_flight: Maximum renders outstanding at once; defaults to
+            twice the worker count.
+        progress: Called with (reports written, total or None) after each
+            report; total is known when boards has a length.
+        executor: Executor to use instead of a new process pool.
+
+    Returns:
+        Summary of what was written.
+
+    Raises:
+        ValueError: If the format is unknown or two table ids map to the
+            same file name.
+    """
+    if fmt not in EXTENSIONS:
+        raise ValueError(f"Unknown format '{fmt}'. Expected one of {tuple(EXTENSIONS)}")
+    if max_in_flight is None:
+        max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+    total = len(boards) if hasattr(boards, "__len__") else None
+    owns_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    sink = _ZipSink(destination) if archive else _DirectorySink(destination)
+    exported = 0
+    try:
+        for table_id, report in _render_all(executor, boards, fmt, max_in_flight):
+            sink.write(f"{_safe_name(table_id)}.{EXTENSIONS[fmt]}", report)
+            exported += 1
+            if progress is not None:
+                progress(exported, total)
+    finally:
+        sink.close()
+        if owns_executor:
+            executor.shutdown(cancel_futures=True)
+    return ExportSummary(exported, sink.bytes_written, destination)
+
+
+def _render_all(
+    executor: Executor,
+    boards: Iterable[Tuple[str, Scoreboard]],
+    fmt: str,
+    max_in_flight: int,
+) -> Iterator[Tuple[str, bytes]]:
+    """Yield (table_id, report) in completion order, bounding in-flight work."""
+    pending: Dict[Future, str] = {}
+    seen = set()
+    source = iter(boards)
+    exhausted = False
+    while pending or not exhausted:
+        while not exhausted and len(pending) < max_in_flight:
+            try:
+                table_id, scoreboard = next(source)
+            except StopIteration:
+                exhausted = True
+                break
+            # Distinct ids can map to the same file name once sanitized.
+            name = _safe_name(table_id)
+            if name in seen:
+                raise ValueError(f"Duplicate table id '{table_id}'")
+            seen.add(name)
+            pending[executor.submit(render_report, scoreboard.snapshot(), fmt)] = table_id
+        if not pending:
+            break
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future.result()
+
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _safe_name(table_id: str) -> str:
+    name = _UNSAFE.sub("_", str(table_id)).lstrip(".")
+    return name or "_"
+
+
+class _DirectorySink:
+    """Writes each report to its own file in a directory."""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.bytes_written = 0
+
+    def write(self, name: str, data: bytes) -> None:
+        with open(os.path.join(self.directory, name), "wb") as handle:
+            handle.write(data)
+        self.bytes_written += len(data)
+
+    def close(self) -> None:
+        pass
+
+
+class _ZipSink:
+    """Streams reports into a single zip archive."""
+
+    def __init__(self, path: str):
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self.archive = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self.bytes_written = 0
+
+    def write(self, name: str, data: bytes) -> None:
+        self.archive.writestr(name, data)
+        self.bytes_written += len(data)
+
+    def close(self) -> None:
+        self.archive.close()
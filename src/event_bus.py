@@ -0,0 +1,314 @@
+"""Change-notification bus for game state objects.
+
+Scoreboard and RoundProgression publish a ChangeEvent on every mutation.
+Each subscriber receives those events coalesced over its own window, so a
+burst of writes produces a single Notification, pushed by a timer when
+the window closes. Subscribers without a
+callback read notifications from a bounded queue that keeps only the most
+recent entries when the consumer falls behind.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A single state change published by a game object."""
+    source: str
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Notification:
+    """A batch of coalesced change events delivered to a subscriber."""
+    events: Tuple[ChangeEvent, ...]
+    dropped: int = 0  # events discarded because the window buffer was full
+
+
+class Subscription:
+    """A subscriber's coalescing buffer and pending-notification queue."""
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        callback: Optional[Callable[[Notification], None]],
+        window: float,
+        max_pending: int,
+        max_events: int,
+    ):
+        """Initialize a subscription.
+
+        Args:
+            bus: The bus this subscription belongs to.
+            callback: Called with each Notification; if None, notifications
+                are queued for drain().
+            window: Coalescing window in seconds (0 delivers immediately).
+            max_pending: Maximum queued notifications kept for drain().
+            max_events: Maximum events kept per coalesced notification.
+        """
+        if window < 0:
+            raise ValueError(f"Window cannot be negative, got {window}")
+        if max_pending < 1 or max_events < 1:
+            raise ValueError("Queue bounds must be at least 1")
+        self._bus = bus
+        self.callback = callback
+        self.window = window
+        self.pending: Deque[Notification] = deque(maxlen=max_pending)
+        self.dropped_notifications = 0
+        self.failed_notifications = 0  # callbacks that raised
+        self.last_error: Optional[Exception] = None
+        self._events: Deque[ChangeEvent] = deque(maxlen=max_events)
+        self._dropped_events = 0
+        self._window_start: Optional[float] = None
+
+    def _add(self, event: ChangeEvent, now: float) -> bool:
+        """Buffer an event; True if it opened a new window."""
+        if len(self._events) == self._events.maxlen:
+            self._dropped_events += 1
+        self._events.append(event)
+        if self._window_start is None:
+            self._window_start = now
+            return True
+        return False
+
+    def _due(self, now: float) -> bool:
+        return (
+            self._window_start is not None
+            and now - self._window_start >= self.window
+        )
+
+    def _take(self) -> Notification:
+        notification = Notification(tuple(self._events), self._dropped_events)
+        self._events.clear()
+        self._dropped_events = 0
+        self._window_start = None
+        return notification
+
+    def _deliver(self, notification: Notification) -> None:
+        if self.callback is not None:
+            self.callback(notification)
+            return
+        if len(self.pending) == self.pending.maxlen:
+            self.dropped_notifications += 1
+        self.pending.append(notification)
+
+    def drain(self) -> List[Notification]:
+        """Remove and return all queued notifications, oldest first."""
+        with self._bus._lock:
+            notifications = list(self.pending)
+            self.pending.clear()
+        return notifications
+
+    def cancel(self) -> None:
+        """Stop receiving events from the bus."""
+        self._bus.unsubscribe(self)
+
+
+def _start_timer(delay: float, function: Callable[[], None]) -> threading.Timer:
+    timer = threading.Timer(delay, function)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+class EventBus:
+    """Publish/subscribe hub with per-subscriber coalescing.
+
+    When a subscriber's window opens, the bus schedules its delivery for
+    when the window closes, on a timer thread by default, so the last burst
+    of writes is pushed without further publishes or polling. A publish()
+    or deliver_due() call also delivers every window that has elapsed.
+    Callbacks run outside the bus lock, on the publishing or timer thread.
+    An exception raised by a callback is recorded on
+    its subscription and passed to on_error, if given; it never reaches the
+    publisher or keeps the other subscribers from their notifications.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        on_error: Optional[Callable[[Subscription, Notification, Exception], None]] = None,
+        scheduler: Optional[Callable[[float, Callable[[], None]], Any]] = _start_timer,
+    ):
+        """Initialize the bus.
+
+        Args:
+            clock: Monotonic time source, in seconds.
+            on_error: Called with the subscription, notification and
+                exception when a subscriber's callback raises.
+            scheduler: Called with a delay in seconds and a function to run
+                after it, to deliver each window when it closes; defaults to
+                a daemon threading.Timer. An event loop can be used with
+                e.g. lambda delay, fn: loop.call_soon_threadsafe(
+                loop.call_later, delay, fn). None leaves delivery to
+                publish() and deliver_due().
+        """
+        self._clock = clock
+        self.on_error = on_error
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._subscriptions: List[Subscription] = []
+        self._local = threading.local()  # per-thread deferred events
+
+    def subscribe(
+        self,
+        callback: Optional[Callable[[Notification], None]] = None,
+        window: float = 0.0,
+        max_pending: int = 16,
+        max_events: int = 1024,
+    ) -> Subscription:
+        """Register a new subscriber.
+
+        Args:
+            callback: Called with each Notification; if None, notifications
+                are queued on the subscription for drain().
+            window: Coalescing window in seconds.
+            max_pending: Bound on queued notifications (oldest dropped first).
+            max_events: Bound on events per notification (oldest dropped first).
+
+        Returns:
+            The new Subscription.
+        """
+        subscription = Subscription(self, callback, window, max_pending, max_events)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber; unknown subscriptions are ignored."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish(self, source: str, kind: str, **payload: Any) -> None:
+        """Publish a change event to every subscriber.
+
+        Inside deferred() on the same thread, the event is held until the
+        outermost deferred() block exits.
+
+        Args:
+            source: Name of the publishing object type.
+            kind: Name of the mutation.
+            **payload: Details of the change.
+        """
+        event = ChangeEvent(source, kind, payload)
+        held = getattr(self._local, "held", None)
+        if held is not None:
+            held.append(event)
+            return
+        self._publish_events((event,))
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Hold this thread's publishes and deliver them together at the end.
+
+        Lets a multi-object update finish before any subscriber hears of
+        it, and hands every subscriber the whole batch in one pass. Held
+        events are delivered even if the block raises. Blocks may nest.
+        """
+        if getattr(self._local, "held", None) is not None:
+            yield
+            return
+        held = self._local.held = []
+        try:
+            yield
+        finally:
+            self._local.held = None
+            if held:
+                self._publish_events(held)
+
+    def _publish_events(self, events: Sequence[ChangeEvent]) -> None:
+        now = self._clock()
+        opened = []
+        with self._lock:
+            for subscription in self._subscriptions:
+                for event in events:
+                    if subscription._add(event, now) and subscription.window:
+                        opened.append(subscription)
+            ready = self._collect_due(now)
+        self._dispatch(ready)
+        for subscription in opened:
+            self._schedule(subscription, subscription.window)
+
+    def _schedule(self, subscription: Subscription, delay: float) -> None:
+        if self._scheduler is not None:
+            self._scheduler(delay, lambda: self._expire(subscription))
+
+    def _expire(self, subscription: Subscription) -> None:
+        """Deliver a subscription's window once it has closed (timer callback)."""
+        with self._lock:
+            start = subscription._window_start
+            if start is None or subscription not in self._subscriptions:
+                return  # already delivered, flushed or unsubscribed
+            remaining = start + subscription.window - self._clock()
+            if remaining <= 0:
+                ready = [(subscription, subscription._take())]
+                self._queue(ready)
+        if remaining > 0:
+            self._schedule(subscription, remaining)
+        else:
+            self._dispatch(ready)
+
+    def deliver_due(self) -> int:
+        """Deliver every notification whose coalescing window has elapsed.
+
+        Returns:
+            Number of notifications delivered.
+        """
+        with self._lock:
+            ready = self._collect_due(self._clock())
+        self._dispatch(ready)
+        return len(ready)
+
+    def flush(self) -> int:
+        """Deliver all buffered events immediately, ignoring windows.
+
+        Returns:
+            Number of notifications delivered.
+        """
+        with self._lock:
+            ready = [
+                (subscription, subscription._take())
+                for subscription in self._subscriptions
+                if subscription._window_start is not None
+            ]
+            self._queue(ready)
+        self._dispatch(ready)
+        return len(ready)
+
+    def _collect_due(self, now: float) -> List[Tuple[Subscription, Notification]]:
+        ready = [
+            (subscription, subscription._take())
+            for subscription in self._subscriptions
+            if subscription._due(now)
+        ]
+        self._queue(ready)
+        return ready
+
+    @staticmethod
+    def _queue(ready: List[Tuple[Subscription, Notification]]) -> None:
+        # Queue-backed subscribers are filled while the lock is held so that
+        # drain() never observes a half-delivered batch.
+        for subscription, notification in ready:
+            if subscription.callback is None:
+                subscription._deliver(notification)
+
+    def _dispatch(self, ready: List[Tuple[Subscription, Notification]]) -> None:
+        # The notifications were already taken from their buffers, so every
+        # subscriber must get its own even when an earlier callback fails.
+        for subscription, notification in ready:
+            if subscription.callback is None:
+                continue
+            try:
+                subscription._deliver(notification)
+            except Exception as error:
+                subscription.failed_notifications += 1
+                subscription.last_error = error
+                if self.on_error is not None:
+                    self.on_error(subscription, notification, error)
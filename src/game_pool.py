@@ -0,0 +1,105 @@
+"""Pool of reusable Game objects.
+
+Creating a game allocates a registry, a scoreboard with its lock, views
+and renderer layouts, a bid collector and a progression. During lobby
+surges that churn adds latency and GC pressure, so finished games are
+released back to a bounded pool and reset in place for the next table
+instead of being rebuilt. The pool can be pre-warmed at startup.
+
+Usage:
+    pool = GamePool(max_idle=256, prewarm=64)
+    game = pool.acquire(["Alice", "Bob"], stats=stats, bus=bus)
+    ...
+    pool.release(game)
+"""
+
+import threading
+from typing import List, Optional, Sequence, Set
+
+from src.event_bus import EventBus
+from src.player_stats import StatsTracker
+from src.round_pipeline import Game
+
+
+class GamePool:
+    """Bounded pool of idle Game objects, reset on reuse."""
+
+    def __init__(self, max_idle: int = 128, prewarm: int = 0):
+        """Initialize the pool.
+
+        Args:
+            max_idle: Most idle games kept; extra releases are discarded.
+            prewarm: Games to create up front.
+        """
+        if max_idle < 0:
+            raise ValueError(f"max_idle must not be negative, got {max_idle}")
+        self.max_idle = max_idle
+        self.created = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._idle: List[Game] = []
+        self._idle_ids: Set[int] = set()
+        self.prewarm(prewarm)
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def prewarm(self, count: int) -> int:
+        """Create idle games until count are waiting, within max_idle.
+
+        Returns:
+            The number of games created.
+        """
+        with self._lock:
+            missing = max(0, min(count, self.max_idle) - len(self._idle))
+        games = [Game.create([]) for _ in range(missing)]
+        with self._lock:
+            for game in games[:self.max_idle - len(self._idle)]:
+                self._idle.append(game)
+                self._idle_ids.add(id(game))
+            self.created += len(games)
+        return len(games)
+
+    def acquire(
+        self,
+        player_names: Sequence[str],
+        stats: Optional[StatsTracker] = None,
+        bus: Optional[EventBus] = None,
+    ) -> Game:
+        """Get a game set up for the given players, reusing an idle one.
+
+        Args:
+            player_names: Players in seat order; seat i gets player_id i.
+            stats: Optional statistics tracker for bids and scores.
+            bus: Optional event bus for scoreboard and phase changes.
+        """
+        with self._lock:
+            game = self._idle.pop() if self._idle else None
+            if game is not None:
+                self._idle_ids.discard(id(game))
+                self.reused += 1
+            else:
+                self.created += 1
+        if game is None:
+            return Game.create(player_names, stats=stats, bus=bus)
+        game.reset(player_names, stats=stats, bus=bus)
+        return game
+
+    def release(self, game: Game) -> None:
+        """Return a finished game to the pool.
+
+        The caller must not use the game afterwards. Its stats tracker and
+        bus are detached right away so the pool does not keep them alive.
+
+        Raises:
+            ValueError: If the game is already in the pool.
+        """
+        with self._lock:
+            if id(game) in self._idle_ids:
+                raise ValueError("Game is already in the pool")
+            if len(self._idle) >= self.max_idle:
+                return
+            game.scoreboard.stats = game.collector.stats = None
+            game.scoreboard.bus = game.progression.bus = None
+            self._idle.append(game)
+            self._idle_ids.add(id(game))
@@ -0,0 +1,346 @@
+"""Game store with LRU/TTL eviction and spill to disk.
+
+Keeps live games in memory and spills cold ones to pickle files in a
+local directory: games idle for longer than the TTL are spilled by
+sweep(), and whenever the resident set exceeds its game count or memory
+budget the least recently used games are spilled, completed games
+before ones still in play. get() faults a spilled game back in, so
+callers see every game as if it had stayed resident.
+
+A spilled game is loaded into fresh objects, so anything that keeps a
+game or one of its parts beyond a single call must pin it: pin() and
+unpin() around an IngestionQueue registration or a GamePool checkout,
+or checkout() around one operation. Pinned games, and games whose lock
+is held, are never spilled. HttpApi can serve the store directly, since
+it looks games up on every request.
+
+Each game's footprint is measured once when it enters memory, by put()
+or by a load, and kept as a running total rather than re-measured.
+
+Usage:
+    store = GameStore("/var/tmp/games", memory_budget=256 * 2**20, ttl=600)
+    store.put(game_id, Game.create(names, stats=stats, bus=bus))
+    with store.checkout(game_id) as game:
+        ...
+    store.sweep()  # periodically
+"""
+
+import io
+import itertools
+import os
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+
+from src.event_bus import EventBus
+from src.player_stats import StatsTracker
+from src.round_pipeline import Game
+
+# Tag written in place of the store's shared stats tracker.
+_SHARED_STATS = "stats"
+
+
+class GameStore:
+    """Holds games in memory up to a budget, spilling the rest to disk."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_resident: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        ttl: Optional[float] = None,
+        stats: Optional[StatsTracker] = None,
+        bus: Optional[EventBus] = None,
+        clock: Callable[[], float] = time.monotonic,
+        size_of: Optional[Callable[[Game], int]] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            directory: Directory for spill files; created if missing.
+            max_resident: Maximum number of games kept in memory.
+            memory_budget: Maximum estimated bytes of games kept in memory.
+            ttl: Seconds since last access after which sweep() spills a game.
+            stats: Statistics tracker shared by the stored games; it is not
+                written to disk and is reattached when a game is loaded.
+            bus: Event bus reattached to games when they are loaded.
+            clock: Time source for access times.
+            size_of: Estimates a game's footprint in bytes for the budget;
+                defaults to the size of its spill file.
+        """
+        if max_resident is not None and max_resident < 1:
+            raise ValueError(f"max_resident must be at least 1, got {max_resident}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_resident = max_resident
+        self.memory_budget = memory_budget
+        self.ttl = ttl
+        self.stats = stats
+        self.bus = bus
+        self.clock = clock
+        self.size_of = size_of or self._spilled_size
+        self.spills = 0
+        self.loads = 0
+        self._lock = threading.RLock()
+        # game_id -> game, least recently used first; a game's group is
+        # decided when it is stored or accessed.
+        self._finished: "OrderedDict[Hashable, Game]" = OrderedDict()
+        self._playing: "OrderedDict[Hashable, Game]" = OrderedDict()
+        self._last_access: Dict[Hashable, float] = {}
+        self._sizes: Dict[Hashable, int] = {}
+        self._used = 0  # sum of _sizes
+        self._pins: Counter = Counter()
+        self._spilled: Dict[Hashable, str] = {}  # game_id -> spill file
+        self._file_ids = itertools.count()
+
+    def __len__(self) -> int:
+        return self.resident + len(self._spilled)
+
+    def __contains__(self, game_id: Hashable) -> bool:
+        return self._resident_game(game_id) is not None or game_id in self._spilled
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._finished) + list(self._playing) + list(self._spilled))
+
+    @property
+    def resident(self) -> int:
+        """Get the number of games held in memory."""
+        return len(self._finished) + len(self._playing)
+
+    @property
+    def spilled(self) -> int:
+        """Get the number of games held on disk."""
+        return len(self._spilled)
+
+    def put(self, game_id: Hashable, game: Game) -> None:
+        """Add or replace a game, then enforce the resident limits."""
+        with self._lock:
+            self._discard_spill(game_id)
+            self._forget_resident(game_id)
+            self._admit(game_id, game, self.size_of(game) if self.memory_budget is not None else 0)
+            self._enforce_limits(keep=game_id)
+
+    def get(self, game_id: Hashable, default: Optional[Game] = None) -> Optional[Game]:
+        """Get a game, loading it from disk if it was spilled.
+
+        Like Mapping.get, returns default when the store has no such game.
+        """
+        with self._lock:
+            game = self._fetch(game_id)
+            return default if game is None else game
+
+    def pin(self, game_id: Hashable) -> Game:
+        """Get a game and keep it resident until a matching unpin().
+
+        Raises:
+            KeyError: If the store has no such game.
+        """
+        with self._lock:
+            game = self._fetch(game_id)
+            if game is None:
+                raise KeyError(game_id)
+            self._pins[game_id] += 1
+            return game
+
+    def unpin(self, game_id: Hashable) -> None:
+        """Release one pin on a game, then enforce the resident limits.
+
+        Raises:
+            ValueError: If the game is not pinned.
+        """
+        with self._lock:
+            if self._pins[game_id] <= 0:
+                raise ValueError(f"Game {game_id!r} is not pinned")
+            self._pins[game_id] -= 1
+            if not self._pins[game_id]:
+                del self._pins[game_id]
+                self._enforce_limits()
+
+    @contextmanager
+    def checkout(self, game_id: Hashable) -> Iterator[Game]:
+        """Pin a game for the duration of a with block."""
+        game = self.pin(game_id)
+        try:
+            yield game
+        finally:
+            self.unpin(game_id)
+
+    def remove(self, game_id: Hashable) -> None:
+        """Drop a game from memory and disk.
+
+        Raises:
+            KeyError: If the store has no such game.
+        """
+        with self._lock:
+            if game_id not in self:
+                raise KeyError(game_id)
+            self._forget_resident(game_id)
+            self._discard_spill(game_id)
+            self._pins.pop(game_id, None)
+
+    def spill(self, game_id: Hashable) -> bool:
+        """Spill a resident game to disk now.
+
+        Returns:
+            True if the game was spilled; False if it is not resident, is
+            pinned or its lock is held.
+        """
+        with self._lock:
+            return self._resident_game(game_id) is not None and self._spill(game_id)
+
+    def sweep(self) -> int:
+        """Spill games idle past the TTL, then enforce the resident limits.
+
+        Returns:
+            The number of games spilled.
+        """
+        with self._lock:
+            before = self.spills
+            if self.ttl is not None:
+                cutoff = self.clock() - self.ttl
+                for group in (self._finished, self._playing):
+                    expired = []
+                    for game_id in group:
+                        if self._last_access[game_id] > cutoff:
+                            break  # the rest were accessed more recently
+                        expired.append(game_id)
+                    for game_id in expired:
+                        self._spill(game_id)
+            self._enforce_limits()
+            return self.spills - before
+
+    def resident_bytes(self) -> int:
+        """Get the estimated footprint of the resident games."""
+        return self._used
+
+    def _fetch(self, game_id: Hashable) -> Optional[Game]:
+        """Get a game, faulting it in from disk; None if absent (lock held)."""
+        game = self._resident_game(game_id)
+        if game is not None:
+            self._touch(game_id, game)
+            return game
+        if game_id not in self._spilled:
+            return None
+        game, size = self._load(game_id)
+        self._admit(game_id, game, size)
+        self._enforce_limits(keep=game_id)
+        return game
+
+    def _resident_game(self, game_id: Hashable) -> Optional[Game]:
+        game = self._playing.get(game_id)
+        return game if game is not None else self._finished.get(game_id)
+
+    def _admit(self, game_id: Hashable, game: Game, size: int) -> None:
+        """Make a game resident and most recently used (lock held)."""
+        self._sizes[game_id] = size
+        self._used += size
+        self._touch(game_id, game)
+
+    def _touch(self, game_id: Hashable, game: Game) -> None:
+        """Mark a resident game as just used, regrouping it (lock held)."""
+        self._finished.pop(game_id, None)
+        self._playing.pop(game_id, None)
+        group = self._finished if game.progression.is_game_complete else self._playing
+        group[game_id] = game
+        self._last_access[game_id] = self.clock()
+
+    def _forget_resident(self, game_id: Hashable) -> None:
+        self._finished.pop(game_id, None)
+        self._playing.pop(game_id, None)
+        self._last_access.pop(game_id, None)
+        self._used -= self._sizes.pop(game_id, 0)
+
+    def _enforce_limits(self, keep: Optional[Hashable] = None) -> None:
+        """Spill games until the resident set fits (lock held)."""
+        if self.max_resident is None and self.memory_budget is None:
+            return
+        victims: List[Hashable] = []
+        count, used = self.resident, self._used
+        # Walk completed games, then games in play, each least recently used
+        # first, only as far as needed.
+        for game_id, game in itertools.chain(self._finished.items(), self._playing.items()):
+            over_count = self.max_resident is not None and count > self.max_resident
+            over_budget = self.memory_budget is not None and used > self.memory_budget
+            if not (over_count or over_budget):
+                break
+            if game_id == keep or game_id in self._pins or game.lock.locked():
+                continue
+            victims.append(game_id)
+            count -= 1
+            used -= self._sizes[game_id]
+        for game_id in victims:
+            self._spill(game_id)
+
+    def _spilled_size(self, game: Game) -> int:
+        buffer = io.BytesIO()
+        _SpillPickler(buffer, self.stats).dump(game)
+        return buffer.tell()
+
+    def _spill(self, game_id: Hashable) -> bool:
+        if game_id in self._pins:
+            return False
+        game = self._resident_game(game_id)
+        if not game.lock.acquire(blocking=False):
+            return False
+        try:
+            path = os.path.join(self.directory, f"game-{next(self._file_ids)}.pickle")
+            partial = path + ".tmp"
+            with open(partial, "wb") as handle:
+                _SpillPickler(handle, self.stats).dump(game)
+            os.replace(partial, path)
+        finally:
+            game.lock.release()
+        self._forget_resident(game_id)
+        self._spilled[game_id] = path
+        self.spills += 1
+        return True
+
+    def _load(self, game_id: Hashable):
+        """Read a spilled game back; returns (game, its size on disk)."""
+        path = self._spilled.pop(game_id)
+        with open(path, "rb") as handle:
+            game = _SpillUnpickler(handle, self.stats).load()
+            size = handle.tell()
+        os.remove(path)
+        if self.bus is not None:
+            game.scoreboard.bus = self.bus
+            game.progression.bus = self.bus
+        self.loads += 1
+        if self.size_of is not self._spilled_size and self.memory_budget is not None:
+            size = self.size_of(game)
+        return game, size
+
+    def _discard_spill(self, game_id: Hashable) -> None:
+        path = self._spilled.pop(game_id, None)
+        if path is not None:
+            os.remove(path)
+
+
+class _SpillPickler(pickle.Pickler):
+    """Writes the shared stats tracker as a reference, not a copy."""
+
+    def __init__(self, handle, stats: Optional[StatsTracker]):
+        super().__init__(handle, pickle.HIGHEST_PROTOCOL)
+        self.stats = stats
+
+    def persistent_id(self, obj):
+        if obj is self.stats and obj is not None:
+            return _SHARED_STATS
+        return None
+
+
+class _SpillUnpickler(pickle.Unpickler):
+    """Resolves the shared stats reference back to the live tracker."""
+
+    def __init__(self, handle, stats: Optional[StatsTracker]):
+        super().__init__(handle)
+        self.stats = stats
+
+    def persistent_load(self, pid):
+        if pid == _SHARED_STATS:
+            return self.stats
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
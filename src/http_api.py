@@ -0,0 +1,285 @@
+"""Lightweight HTTP API over game state.
+
+Serves read-only JSON resources for each game using only asyncio:
+
+    GET /games/{game_id}/standings
+    GET /games/{game_id}/breakdown
+    GET /games/{game_id}/bidding
+    GET /games/{game_id}/missing
+
+Every response carries a strong ETag built from the version of the state
+it is rendered from: the scoreboard snapshot's version, taken together
+with the snapshot the body is rendered from, or BidCollector.version,
+read before the body. A request whose If-None-Match matches the current
+ETag gets 304 Not Modified without rendering anything, and rendered
+responses are cached per resource until the version changes. Connections
+are kept alive per HTTP/1.1 unless the client asks otherwise. Request
+bodies are read and discarded, up to MAX_BODY_BYTES; chunked bodies are
+refused and the connection closed.
+
+Usage:
+    api = HttpApi(games)
+    server = await api.start("127.0.0.1", 8080)
+"""
+
+import asyncio
+import json
+import os
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from src.round_pipeline import Game
+from src.scoreboard import ScoreboardSnapshot
+
+MAX_HEADER_BYTES = 16384
+MAX_BODY_BYTES = 65536
+RESOURCES = ("standings", "breakdown", "bidding", "missing")
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class HttpApi:
+    """Serves game resources over HTTP with ETag revalidation."""
+
+    def __init__(self, games: Mapping[str, Game], idle_timeout: float = 30.0):
+        """Initialize the API.
+
+        Args:
+            games: Games to serve, keyed by the id used in request paths.
+            idle_timeout: Seconds an idle keep-alive connection is held.
+        """
+        self.games = games
+        self.idle_timeout = idle_timeout
+        # Distinguishes ETags across server restarts, when versions reset.
+        self._epoch = os.urandom(4).hex()
+        self._cache: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+        # resource -> (state_of(game) -> (version, state), render(game, state))
+        self._renderers: Dict[
+            str, Tuple[Callable[[Game], Tuple[int, Any]], Callable[[Game, Any], bytes]]
+        ] = {
+            "standings": (_board_state, _render_standings),
+            "breakdown": (_board_state, _render_breakdown),
+            "bidding": (_bids_state, _render_bidding),
+            "missing": (_bids_state, _render_missing),
+        }
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """Start listening; port 0 picks a free port.
+
+        Returns:
+            The running asyncio server.
+        """
+        return await asyncio.start_server(
+            self._serve_connection, host, port, limit=MAX_HEADER_BYTES
+        )
+
+    def handle(self, method: str, path: str, headers: Mapping[str, str]) -> Response:
+        """Produce the response for one request.
+
+        Args:
+            method: Request method.
+            path: Request path, optionally with a query string.
+            headers: Request headers with lower-cased names.
+
+        Returns:
+            Tuple of (status, response headers, body).
+        """
+        if method not in ("GET", "HEAD"):
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED, {"Allow": "GET, HEAD"})
+
+        parts = path.split("?", 1)[0].strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "games" or parts[2] not in RESOURCES:
+            return _error(HTTPStatus.NOT_FOUND)
+        game_id, resource = parts[1], parts[2]
+        game = self.games.get(game_id)
+        if game is None:
+            return _error(HTTPStatus.NOT_FOUND)
+
+        state_of, render = self._renderers[resource]
+        version, state = state_of(game)
+        etag = f'"{self._epoch}-{resource}-{version}"'
+        response_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if _etag_matches(headers.get("if-none-match"), etag):
+            return HTTPStatus.NOT_MODIFIED, response_headers, b""
+
+        key = (game_id, resource)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == etag:
+            body = cached[1]
+        else:
+            body = render(game, state)
+            self._cache[key] = (etag, body)
+        response_headers["Content-Type"] = "application/json"
+        return HTTPStatus.OK, response_headers, body
+
+    def forget(self, game_id: str) -> None:
+        """Drop cached responses for a game that is no longer served."""
+        for resource in RESOURCES:
+            self._cache.pop((game_id, resource), None)
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), self.idle_timeout
+                    )
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    status = HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+                    writer.write(_encode("HTTP/1.1", *_error(status), False))
+                    break
+
+                request = _parse_head(head)
+                if request is None:
+                    writer.write(_encode("HTTP/1.1", *_error(HTTPStatus.BAD_REQUEST), False))
+                    break
+                method, path, version, headers = request
+                refusal = _body_refusal(headers)
+                if refusal is not None:
+                    writer.write(_encode(version, *_error(refusal), False))
+                    break
+                length = int(headers.get("content-length", 0))
+                if length:
+                    # Drain the body so the next request starts at its head.
+                    try:
+                        await asyncio.wait_for(reader.readexactly(length), self.idle_timeout)
+                    except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                        break
+                keep_alive = _keep_alive(version, headers)
+
+                try:
+                    status, response_headers, body = self.handle(method, path, headers)
+                except Exception:
+                    status, response_headers, body = _error(HTTPStatus.INTERNAL_SERVER_ERROR)
+                if method == "HEAD":
+                    response_headers["Content-Length"] = str(len(body))
+                    body = b""
+                writer.write(_encode(version, status, response_headers, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def _board_state(game: Game) -> Tuple[int, ScoreboardSnapshot]:
+    # One snapshot for both the ETag and the body, so they always agree.
+    snapshot = game.scoreboard.snapshot()
+    return snapshot.version, snapshot
+
+
+def _bids_state(game: Game) -> Tuple[int, int]:
+    # Read before rendering: a write during the render can only make the
+    # body newer than the ETag, which costs a re-render, never a stale 304.
+    version = game.collector.version
+    return version, version
+
+
+def _render_standings(game: Game, snapshot: ScoreboardSnapshot) -> bytes:
+    return game.scoreboard.renderer.render("json", "standings", snapshot=snapshot).encode()
+
+
+def _render_breakdown(game: Game, snapshot: ScoreboardSnapshot) -> bytes:
+    return game.scoreboard.renderer.render("json", "breakdown", snapshot=snapshot).encode()
+
+
+def _render_bidding(game: Game, version: int) -> bytes:
+    collector = game.collector
+    return json.dumps({
+        "version": version,
+        "round": collector.current_round,
+        "bids_collected": len(collector.bids),
+        "num_players": collector.num_players,
+        "all_bids_collected": collector.all_bids_collected(),
+    }).encode()
+
+
+def _render_missing(game: Game, version: int) -> bytes:
+    collector = game.collector
+    registry = game.registry
+    return json.dumps({
+        "version": version,
+        "round": collector.current_round,
+        "missing": [
+            {
+                "player_id": player_id,
+                # A collector may expect more players than are registered.
+                "name": registry.name_of(player_id) if player_id < len(registry) else None,
+            }
+            for player_id in collector.get_missing_players()
+        ],
+    }).encode()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match.
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _body_refusal(headers: Mapping[str, str]) -> Optional[HTTPStatus]:
+    """Get the error status for a request body that cannot be drained."""
+    if "transfer-encoding" in headers:
+        return HTTPStatus.NOT_IMPLEMENTED
+    length = headers.get("content-length", "0")
+    if not length.isdigit():
+        return HTTPStatus.BAD_REQUEST
+    if int(length) > MAX_BODY_BYTES:
+        return HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    return None
+
+
+def _keep_alive(version: str, headers: Mapping[str, str]) -> bool:
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+def _parse_head(head: bytes) -> Optional[Tuple[str, str, str, Dict[str, str]]]:
+    try:
+        lines = head.decode("latin-1").split("\r\n")
+        method, path, version = lines[0].split(" ")
+    except ValueError:
+        return None
+    if version not in ("HTTP/1.0", "HTTP/1.1"):
+        return None
+    headers = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            return None
+        headers[name.strip().lower()] = value.strip()
+    return method, path, version, headers
+
+
+def _error(status: HTTPStatus, headers: Optional[Dict[str, str]] = None) -> Response:
+    body = json.dumps({"error": status.phrase}).encode()
+    response_headers = {"Content-Type": "application/json"}
+    response_headers.update(headers or {})
+    return status, response_headers, body
+
+
+def _encode(version: str, status: int, headers: Dict[str, str], body: bytes, keep_alive: bool) -> bytes:
+    status = HTTPStatus(status)
+    lines = [f"{version} {status.value} {status.phrase}"]
+    if status != HTTPStatus.NOT_MODIFIED:
+        headers.setdefault("Content-Length", str(len(body)))
+    headers["Connection"] = "keep-alive" if keep_alive else "close"
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
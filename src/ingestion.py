@@ -0,0 +1,246 @@
+"""Micro-batching ingestion queue for bids and scores.
+
+Incoming writes are buffered per game and applied to the game's
+BidCollector and Scoreboard in batches, either when a game's buffer
+reaches max_batch commands or when its oldest command has waited
+max_delay seconds. Each submit returns a Future that completes once the
+batch containing the command has been applied.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.bid_collector import BidCollector
+from src.player_registry import PlayerRef
+from src.scoreboard import Scoreboard
+
+
+@dataclass
+class _Command:
+    """A buffered write waiting for its batch."""
+    kind: str  # "bid" or "score"
+    args: Tuple
+    future: Future
+
+
+@dataclass
+class _GameQueue:
+    """Buffered commands and targets for one game."""
+    collector: Optional[BidCollector]
+    scoreboard: Optional[Scoreboard]
+    commands: List[_Command] = field(default_factory=list)
+    deadline: Optional[float] = None
+    # Batches are numbered when taken and applied in that order.
+    next_batch: int = 0
+    applied_batches: int = 0
+    applied: threading.Condition = field(default_factory=threading.Condition)
+
+
+class IngestionQueue:
+    """Buffers bid and score commands per game and applies them in batches.
+
+    Deadlines are kept in a heap, so a submit only checks the earliest one
+    and poll() only visits games that are due. A server should call poll()
+    from its event loop or a timer so that partially filled batches are
+    applied within max_delay even when no further commands arrive.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 64,
+        max_delay: float = 0.005,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the queue.
+
+        Args:
+            max_batch: Number of buffered commands that triggers a batch.
+            max_delay: Maximum seconds a command waits before its batch runs.
+            clock: Monotonic time source, in seconds.
+        """
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be at least 1, got {max_batch}")
+        if max_delay < 0:
+            raise ValueError(f"max_delay cannot be negative, got {max_delay}")
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._games: Dict[Hashable, _GameQueue] = {}
+        # (deadline, tiebreak, game_id); entries whose deadline no longer
+        # matches the game's are stale and skipped when popped.
+        self._deadlines: List[Tuple[float, int, Hashable]] = []
+        self._tiebreak = itertools.count()
+
+    def register_game(
+        self,
+        game_id: Hashable,
+        collector: Optional[BidCollector] = None,
+        scoreboard: Optional[Scoreboard] = None,
+    ) -> None:
+        """Register the targets that a game's commands are applied to.
+
+        Raises:
+            ValueError: If the game is already registered.
+        """
+        with self._lock:
+            if game_id in self._games:
+                raise ValueError(f"Game '{game_id}' already registered")
+            self._games[game_id] = _GameQueue(collector, scoreboard)
+
+    def unregister_game(self, game_id: Hashable) -> None:
+        """Apply any buffered commands and forget the game."""
+        self.flush(game_id)
+        with self._lock:
+            self._games.pop(game_id, None)
+
+    def submit_bid(self, game_id: Hashable, player_id: PlayerRef, bid: int) -> Future:
+        """Buffer a bid for the game's BidCollector.
+
+        Returns:
+            Future resolved with None once applied, or with the validation
+            error collect_bid would have raised.
+        """
+        return self._submit(game_id, _Command("bid", (player_id, bid), Future()))
+
+    def submit_score(
+        self, game_id: Hashable, player_name: PlayerRef, round_num: int, score: int
+    ) -> Future:
+        """Buffer a round score for the game's Scoreboard.
+
+        Returns:
+            Future resolved with None once applied, or with the validation
+            error record_round_score would have raised.
+        """
+        command = _Command("score", (player_name, round_num, score), Future())
+        return self._submit(game_id, command)
+
+    def pending(self, game_id: Hashable) -> int:
+        """Get the number of buffered commands for a game."""
+        with self._lock:
+            return len(self._game(game_id).commands)
+
+    def poll(self) -> int:
+        """Apply every batch whose deadline has passed.
+
+        Returns:
+            Number of commands applied.
+        """
+        now = self._clock()
+        due = []
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                deadline, _, game_id = heapq.heappop(self._deadlines)
+                queue = self._games.get(game_id)
+                if queue is not None and queue.deadline == deadline:
+                    due.append(game_id)
+        return sum(self.flush(game_id) for game_id in due)
+
+    def flush(self, game_id: Optional[Hashable] = None) -> int:
+        """Apply buffered commands immediately.
+
+        Args:
+            game_id: Game to flush; if None, flushes every game.
+
+        Returns:
+            Number of commands applied.
+        """
+        if game_id is None:
+            with self._lock:
+                game_ids = list(self._games)
+            return sum(self.flush(g) for g in game_ids)
+
+        with self._lock:
+            queue = self._games.get(game_id)
+            if queue is None or not queue.commands:
+                return 0
+            batch = self._take(queue)
+            number = queue.next_batch
+            queue.next_batch += 1
+        # Wait outside the global lock so a slow apply for one game does
+        # not hold up submits to the others.
+        with queue.applied:
+            queue.applied.wait_for(lambda: queue.applied_batches == number)
+            try:
+                self._apply(queue, batch)
+            finally:
+                queue.applied_batches += 1
+                queue.applied.notify_all()
+        return len(batch)
+
+    def _game(self, game_id: Hashable) -> _GameQueue:
+        queue = self._games.get(game_id)
+        if queue is None:
+            raise ValueError(f"Game '{game_id}' not registered")
+        return queue
+
+    def _submit(self, game_id: Hashable, command: _Command) -> Future:
+        with self._lock:
+            queue = self._game(game_id)
+            queue.commands.append(command)
+            now = self._clock()
+            if queue.deadline is None:
+                queue.deadline = now + self.max_delay
+                heapq.heappush(
+                    self._deadlines, (queue.deadline, next(self._tiebreak), game_id)
+                )
+            full = len(queue.commands) >= self.max_batch
+            due = bool(self._deadlines) and self._deadlines[0][0] <= now
+        if full:
+            self.flush(game_id)
+        if due:
+            self.poll()
+        return command.future
+
+    @staticmethod
+    def _take(queue: _GameQueue) -> List[_Command]:
+        batch = queue.commands
+        queue.commands = []
+        queue.deadline = None
+        return batch
+
+    @staticmethod
+    def _apply(queue: _GameQueue, batch: List[_Command]) -> None:
+        bids: Dict[int, int] = {}
+        scores: List[Tuple[PlayerRef, int, int]] = []
+        bid_commands: List[_Command] = []
+        score_commands: List[_Command] = []
+
+        for command in batch:
+            try:
+                if command.kind == "bid":
+                    if queue.collector is None:
+                        raise RuntimeError("Game has no bid collector")
+                    player, bid = command.args
+                    bids[queue.collector.validate_bid(player, bid)] = bid
+                    bid_commands.append(command)
+                else:
+                    if queue.scoreboard is None:
+                        raise RuntimeError("Game has no scoreboard")
+                    queue.scoreboard.validate_score(*command.args)
+                    scores.append(command.args)
+                    score_commands.append(command)
+            except Exception as exc:
+                command.future.set_exception(exc)
+
+        if bids:
+            _resolve(bid_commands, queue.collector.collect_bids, bids)
+        if scores:
+            _resolve(score_commands, queue.scoreboard.record_round_scores, scores)
+
+
+def _resolve(commands: List[_Command], apply: Callable, arg) -> None:
+    """Apply one batch and settle the futures of the commands it contains."""
+    try:
+        apply(arg)
+    except Exception as exc:
+        for command in commands:
+            command.future.set_exception(exc)
+        return
+    for command in commands:
+        command.future.set_result(None)
@@ -0,0 +1,291 @@
+"""Asyncio load generator for the game objects.
+
+Simulates many concurrent clients, each playing full games against an
+in-process GameServer built on BidCollector, RoundProgression and
+Scoreboard. Reports throughput and p50/p95/p99 latency per operation,
+optionally with a cProfile capture of the server side.
+
+Usage:
+    python -m src.load_test --clients 1000 --players 4 --think-time 0.005
+"""
+
+import argparse
+import asyncio
+import cProfile
+import io
+import itertools
+import math
+import pstats
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.game_pool import GamePool
+from src.round_pipeline import Game, RoundPipeline
+from src.round_progression import GamePhase, RoundProgression
+
+
+class GameServer:
+    """In-process stand-in for the game service.
+
+    Every operation is a coroutine so clients interact with it the way
+    they would with a networked server; the work itself runs on the
+    event loop thread.
+    """
+
+    def __init__(self, profile: bool = False):
+        """Initialize the server.
+
+        Args:
+            profile: Capture a cProfile of server-side work.
+        """
+        self.games: Dict[int, Game] = {}
+        self.pipeline = RoundPipeline()
+        self.pool = GamePool()
+        self.profiler = cProfile.Profile() if profile else None
+        self._ids = itertools.count()
+
+    async def call(self, operation: str, *args):
+        """Run a server operation by name."""
+        handler = getattr(self, f"_op_{operation}")
+        await asyncio.sleep(0)  # yield like a network round trip would
+        if self.profiler is None:
+            return handler(*args)
+        self.profiler.enable()
+        try:
+            return handler(*args)
+        finally:
+            self.profiler.disable()
+
+    def _op_create_game(self, player_names: Sequence[str]) -> int:
+        game_id = next(self._ids)
+        self.games[game_id] = self.pool.acquire(player_names)
+        return game_id
+
+    def _op_start_round(self, game_id: int) -> int:
+        game = self.games[game_id]
+        if game.progression.current_phase == GamePhase.COMPLETE:
+            game.progression.advance_phase()
+        game.progression.start_round()
+        round_num = game.progression.current_round
+        game.collector.start_round(round_num)
+        game.scoreboard.set_round(round_num, RoundProgression.MAX_ROUND)
+        return round_num
+
+    def _op_bid(self, game_id: int, player_id: int, bid: int) -> None:
+        self.games[game_id].collector.collect_bid(player_id, bid)
+
+    def _op_complete_round(self, game_id: int, tricks: Sequence[int]) -> bool:
+        return self.pipeline.complete_round(self.games[game_id], tricks).game_complete
+
+    def _op_standings(self, game_id: int) -> str:
+        return self.games[game_id].scoreboard.renderer.render("json")
+
+    def _op_close_game(self, game_id: int) -> None:
+        self.pool.release(self.games.pop(game_id))
+
+    def profile_report(self, limit: int = 25) -> Optional[str]:
+        """Get the top server-side functions by cumulative time."""
+        if self.profiler is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+
+@dataclass(frozen=True)
+class OperationStats:
+    """Latency summary for one operation, in seconds."""
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+@dataclass
+class LoadReport:
+    """Results of a load test run."""
+    duration: float
+    games_played: int
+    errors: int
+    operations: Dict[str, OperationStats]
+    profile: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Get operations completed per second."""
+        total = sum(stats.count for stats in self.operations.values())
+        return total / self.duration if self.duration else 0.0
+
+    def format(self) -> str:
+        """Format the report as a text table (latencies in milliseconds)."""
+        lines = ["=" * 70]
+        lines.append(
+            f"{self.games_played} games in {self.duration:.2f}s | "
+            f"{self.throughput:.0f} ops/s | {self.errors} errors"
+        )
+        lines.append("=" * 70)
+        lines.append(f"{'Operation':<16}{'Count':>9}{'Mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Max':>9}")
+        lines.append("-" * 70)
+        for name, stats in sorted(self.operations.items()):
+            lines.append(
+                f"{name:<16}{stats.count:>9}"
+                + "".join(
+                    f"{value * 1000:>9.3f}"
+                    for value in (stats.mean, stats.p50, stats.p95, stats.p99, stats.max)
+                )
+            )
+        lines.append("=" * 70)
+        if self.profile:
+            lines.append(self.profile)
+        return "\n".join(lines)
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Get a nearest-rank percentile from pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: Sequence[float]) -> OperationStats:
+    """Summarize a list of latencies."""
+    ordered = sorted(latencies)
+    return OperationStats(
+        count=len(ordered),
+        mean=sum(ordered) / len(ordered) if ordered else 0.0,
+        p50=percentile(ordered, 0.50),
+        p95=percentile(ordered, 0.95),
+        p99=percentile(ordered, 0.99),
+        max=ordered[-1] if ordered else 0.0,
+    )
+
+
+class LoadClient:
+    """One simulated client playing full games against the server."""
+
+    def __init__(
+        self,
+        server: GameServer,
+        num_players: int,
+        think_time: float,
+        rng: random.Random,
+        latencies: Dict[str, List[float]],
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.server = server
+        self.num_players = num_players
+        self.think_time = think_time
+        self.rng = rng
+        self.latencies = latencies
+        self.clock = clock
+
+    async def _call(self, operation: str, *args):
+        start = self.clock()
+        result = await self.server.call(operation, *args)
+        self.latencies.setdefault(operation, []).append(self.clock() - start)
+        return result
+
+    async def _think(self) -> None:
+        if self.think_time > 0:
+            await asyncio.sleep(self.think_time * self.rng.uniform(0.5, 1.5))
+
+    async def play_game(self) -> None:
+        """Play one game from creation through the final round."""
+        names = [f"p{seat}" for seat in range(self.num_players)]
+        game_id = await self._call("create_game", names)
+        complete = False
+        while not complete:
+            round_num = await self._call("start_round", game_id)
+            for player_id in range(self.num_players):
+                await self._think()
+                await self._call("bid", game_id, player_id, self.rng.randint(0, round_num))
+            await self._think()
+            tricks = [0] * self.num_players
+            for _ in range(round_num):
+                tricks[self.rng.randrange(self.num_players)] += 1
+            complete = await self._call("complete_round", game_id, tricks)
+            await self._call("standings", game_id)
+        await self._call("close_game", game_id)
+
+
+async def run_load(
+    clients: int,
+    games_per_client: int = 1,
+    num_players: int = 4,
+    think_time: float = 0.0,
+    profile: bool = False,
+    seed: int = 0,
+) -> LoadReport:
+    """Run concurrent clients against a fresh in-process server.
+
+    Args:
+        clients: Number of concurrent clients.
+        games_per_client: Games each client plays back to back.
+        num_players: Seats per game.
+        think_time: Mean pause between a client's actions, in seconds.
+        profile: Capture a cProfile of server-side work.
+        seed: Seed for the clients' random choices.
+
+    Returns:
+        The load report.
+    """
+    server = GameServer(profile=profile)
+    latencies: Dict[str, List[float]] = {}
+    rng = random.Random(seed)
+    errors = 0
+    games_played = 0
+
+    async def client_task(client: LoadClient) -> None:
+        nonlocal errors, games_played
+        for _ in range(games_per_client):
+            try:
+                await client.play_game()
+                games_played += 1
+            except (ValueError, RuntimeError, KeyError):
+                errors += 1
+
+    tasks = [
+        client_task(LoadClient(server, num_players, think_time, random.Random(rng.random()), latencies))
+        for _ in range(clients)
+    ]
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    duration = time.perf_counter() - start
+
+    return LoadReport(
+        duration=duration,
+        games_played=games_played,
+        errors=errors,
+        operations={name: summarize(values) for name, values in latencies.items()},
+        profile=server.profile_report(),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the game objects with asyncio clients.")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--games", type=int, default=1, help="games per client")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--think-time", type=float, default=0.005)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(
+        clients=args.clients,
+        games_per_client=args.games,
+        num_players=args.players,
+        think_time=args.think_time,
+        profile=args.profile,
+        seed=args.seed,
+    ))
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
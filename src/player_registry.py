@@ -0,0 +1,91 @@
+"""Player registry assigning dense integer ids.
+
+A PlayerRegistry maps player names to ids 0..n-1 in registration order.
+BidCollector and Scoreboard both accept these ids, so per-player data can
+be kept in lists indexed by id and joined without translating names.
+"""
+
+import sys
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+PlayerRef = Union[int, str]  # a registered player's id or name
+
+
+class PlayerRegistry:
+    """Assigns each player name a dense integer id, once."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        """Initialize the registry.
+
+        Args:
+            names: Names to register up front, in id order.
+        """
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        for name in names:
+            self.register(name)
+
+    def register(self, name: str) -> int:
+        """Register a player, returning their id.
+
+        Registering a name that is already known returns its existing id.
+        """
+        player_id = self._ids.get(name)
+        if player_id is None:
+            name = sys.intern(name)
+            player_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return player_id
+
+    def id_of(self, name: str) -> int:
+        """Get a player's id.
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        player_id = self._ids.get(name)
+        if player_id is None:
+            raise ValueError(f"Player '{name}' not found")
+        return player_id
+
+    def name_of(self, player_id: int) -> str:
+        """Get a player's name.
+
+        Raises:
+            ValueError: If the id is not registered.
+        """
+        if not 0 <= player_id < len(self._names):
+            raise ValueError(
+                f"Invalid player_id {player_id}. Must be between 0 and {len(self._names) - 1}"
+            )
+        return self._names[player_id]
+
+    def resolve(self, player: PlayerRef) -> int:
+        """Get the id for a player given by id or name.
+
+        Raises:
+            ValueError: If the player is not registered.
+        """
+        if isinstance(player, str):
+            return self.id_of(player)
+        self.name_of(player)
+        return player
+
+    def clear(self) -> None:
+        """Forget every player, so ids start again from 0."""
+        self._ids.clear()
+        self._names.clear()
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get all registered names, in id order."""
+        return tuple(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
@@ -0,0 +1,202 @@
+"""Incremental per-player statistics.
+
+Keeps running aggregates (bid counts, round score mean/variance, hit rate
+and streaks) that are updated in O(1) per event, so stats queries never
+have to rescan round scores or bid history.
+"""
+
+import math
+from typing import Dict, Hashable, Optional
+
+
+class PlayerStats:
+    """Running statistics for a single player."""
+
+    __slots__ = (
+        "bids_made", "bid_total", "rounds_scored", "mean_score", "_m2",
+        "hits", "current_streak", "longest_streak", "last_round",
+        "_streak_before_last", "_longest_before_last",
+    )
+
+    def __init__(self):
+        """Initialize empty aggregates."""
+        self.bids_made = 0
+        self.bid_total = 0
+        self.rounds_scored = 0
+        self.mean_score = 0.0
+        self._m2 = 0.0
+        self.hits = 0
+        self.current_streak = 0
+        self.longest_streak = 0
+        self.last_round = 0
+        self._streak_before_last = 0
+        self._longest_before_last = 0
+
+    @property
+    def mean_bid(self) -> float:
+        """Get the average bid placed by the player."""
+        if self.bids_made == 0:
+            return 0.0
+        return self.bid_total / self.bids_made
+
+    @property
+    def variance(self) -> float:
+        """Get the sample variance of the player's round scores."""
+        if self.rounds_scored < 2:
+            return 0.0
+        return self._m2 / (self.rounds_scored - 1)
+
+    @property
+    def std_dev(self) -> float:
+        """Get the sample standard deviation of the player's round scores."""
+        return math.sqrt(self.variance)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of scored rounds in which the bid was met."""
+        if self.rounds_scored == 0:
+            return 0.0
+        return self.hits / self.rounds_scored
+
+    def add_bid(self, bid: int) -> None:
+        """Fold a bid into the running bid aggregates."""
+        self.bids_made += 1
+        self.bid_total += bid
+
+    def add_score(self, score: int) -> None:
+        """Fold a round score into the running mean/variance (Welford)."""
+        self.rounds_scored += 1
+        delta = score - self.mean_score
+        self.mean_score += delta / self.rounds_scored
+        self._m2 += delta * (score - self.mean_score)
+        if score > 0:
+            self.hits += 1
+
+    def remove_score(self, score: int) -> None:
+        """Remove a previously added round score (reverse Welford step)."""
+        if self.rounds_scored <= 1:
+            self.rounds_scored = 0
+            self.mean_score = 0.0
+            self._m2 = 0.0
+        else:
+            old_mean = self.mean_score
+            self.rounds_scored -= 1
+            self.mean_score = (old_mean * (self.rounds_scored + 1) - score) / self.rounds_scored
+            self._m2 = max(0.0, self._m2 - (score - old_mean) * (score - self.mean_score))
+        if score > 0:
+            self.hits -= 1
+
+    def record_score(self, round_num: int, score: int, previous: Optional[int] = None) -> None:
+        """Fold a round score into the aggregates and streaks.
+
+        Args:
+            round_num: Round number.
+            score: Score earned in the round.
+            previous: Score previously recorded for this round, if this
+                event overwrites an earlier one.
+        """
+        if previous is not None:
+            self.remove_score(previous)
+        self.add_score(score)
+
+        if previous is not None and round_num != self.last_round:
+            return
+        if previous is None:
+            # A first score for a round at or before the last one starts
+            # the player's next game; the streak carries over into it.
+            self._streak_before_last = self.current_streak
+            self._longest_before_last = self.longest_streak
+            self.last_round = round_num
+
+        if score > 0:
+            self.current_streak = self._streak_before_last + 1
+        else:
+            self.current_streak = 0
+        self.longest_streak = max(self._longest_before_last, self.current_streak)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the current aggregates as a plain dictionary."""
+        return {
+            "bids_made": self.bids_made,
+            "mean_bid": self.mean_bid,
+            "rounds_scored": self.rounds_scored,
+            "mean_score": self.mean_score,
+            "variance": self.variance,
+            "hit_rate": self.hit_rate,
+            "current_streak": self.current_streak,
+            "longest_streak": self.longest_streak,
+        }
+
+
+class StatsTracker:
+    """Maintains PlayerStats for every player from bid and score events.
+
+    Players are keyed by name, which stays the same across games, so one
+    tracker can be shared by every game a server runs (BidCollectors
+    without a registry have no names and key bids by player id).
+
+    A round counts as a hit when its score is positive: under the scoring
+    rules a met bid always scores above zero and a missed bid never does.
+    Streaks count consecutive hits in the order rounds are played, across
+    games. A correction to the most recent round re-evaluates the streak;
+    corrections to older rounds update the moments and hit rate but leave
+    streaks untouched.
+    """
+
+    def __init__(self):
+        """Initialize an empty tracker."""
+        self._stats: Dict[Hashable, PlayerStats] = {}
+
+    def _player(self, player: Hashable) -> PlayerStats:
+        stats = self._stats.get(player)
+        if stats is None:
+            stats = self._stats[player] = PlayerStats()
+        return stats
+
+    def record_bids(self, round_num: int, bids: Dict[Hashable, int]) -> None:
+        """Record a round's collected bids.
+
+        Args:
+            round_num: Round the bids belong to.
+            bids: Mapping of player to bid amount.
+        """
+        for player, bid in bids.items():
+            self._player(player).add_bid(bid)
+
+    def record_score(
+        self,
+        player: Hashable,
+        round_num: int,
+        score: int,
+        previous: Optional[int] = None,
+    ) -> None:
+        """Record a player's score for a round.
+
+        Args:
+            player: Player key.
+            round_num: Round number.
+            score: Score earned in the round.
+            previous: Score previously recorded for this round, if this
+                event overwrites an earlier one.
+        """
+        self._player(player).record_score(round_num, score, previous)
+
+    def get(self, player: Hashable) -> PlayerStats:
+        """Get statistics for a player.
+
+        Raises:
+            ValueError: If no events have been recorded for the player.
+        """
+        if player not in self._stats:
+            raise ValueError(f"No statistics recorded for player '{player}'")
+        return self._stats[player]
+
+    def snapshot(self) -> Dict[Hashable, Dict[str, float]]:
+        """Get statistics for every tracked player as plain dictionaries."""
+        return {player: stats.as_dict() for player, stats in self._stats.items()}
+
+    def __contains__(self, player: Hashable) -> bool:
+        return player in self._stats
+
+    def __len__(self) -> int:
+        return len(self._stats)
@@ -0,0 +1,181 @@
+"""Cross-game skill ratings from final standings.
+
+Applies multiplayer Elo updates with NumPy: a game of n players is
+scored as every pair of players meeting head to head, the higher final
+total winning (ties are draws), and each player's change is the sum of
+their pairwise Elo changes scaled by K / (n - 1). A whole batch of
+games is rated in one vectorized pass from the ratings as they stood
+before the batch, so a nightly update of thousands of games costs a few
+array operations rather than a Python loop per pair.
+
+Every batch is kept in the history, so the ratings can be recomputed
+from scratch, for example after changing K, and the recompute matches
+the incremental updates exactly.
+
+Usage:
+    ratings = RatingBook()
+    ratings.update(standings_of(game.scoreboard) for game in finished_games)
+    print(ratings.top(10))
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.player_registry import PlayerRegistry
+from src.scoreboard import Scoreboard
+
+# (player name, final total) for each player in one game
+GameResult = Sequence[Tuple[str, int]]
+
+# Games rated per vectorized pass; bounds the (games, seats, seats) arrays.
+CHUNK_GAMES = 4096
+
+
+def standings_of(scoreboard: Scoreboard) -> List[Tuple[str, int]]:
+    """Get a game's final (name, total) pairs for rating."""
+    return [(row.name, row.total_score) for row in scoreboard.snapshot().standings]
+
+
+class RatingBook:
+    """Elo-style ratings for every player across many games."""
+
+    def __init__(self, initial: float = 1500.0, k: float = 32.0):
+        """Initialize an empty rating book.
+
+        Args:
+            initial: Rating of a player in their first game.
+            k: Maximum rating change per game.
+        """
+        self.initial = initial
+        self.k = k
+        self.registry = PlayerRegistry()
+        self._ratings = np.empty(0)
+        self._games = np.empty(0, dtype=np.int64)
+        # Each batch as (player ids, totals), padded with -1 / 0.
+        self._history: List[Tuple[np.ndarray, np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return len(self.registry)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.registry
+
+    def rating(self, name: str) -> float:
+        """Get a player's rating.
+
+        Raises:
+            ValueError: If the player has not been rated.
+        """
+        return float(self._ratings[self.registry.id_of(name)])
+
+    def games_played(self, name: str) -> int:
+        """Get the number of rated games a player has played.
+
+        Raises:
+            ValueError: If the player has not been rated.
+        """
+        return int(self._games[self.registry.id_of(name)])
+
+    def top(self, count: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Get (name, rating) pairs, highest rating first."""
+        order = np.argsort(-self._ratings, kind="stable")[:count]
+        return [(self.registry.name_of(int(i)), float(self._ratings[i])) for i in order]
+
+    def as_dict(self) -> dict:
+        """Get every player's rating keyed by name."""
+        return {name: float(self._ratings[i]) for i, name in enumerate(self.registry.names)}
+
+    @property
+    def batches(self) -> int:
+        """Get the number of batches in the history."""
+        return len(self._history)
+
+    def update(self, results: Iterable[GameResult]) -> int:
+        """Rate a batch of finished games and add it to the history.
+
+        All games in the batch are rated from the ratings as they stood
+        before it, so their order within the batch does not matter.
+
+        Args:
+            results: Each game's (name, final total) pairs.
+
+        Returns:
+            The number of games rated.
+
+        Raises:
+            ValueError: If a player appears twice in one game.
+        """
+        batch = self._encode(results)
+        if batch is None:
+            return 0
+        self._history.append(batch)
+        self._apply(*batch)
+        return len(batch[0])
+
+    def recompute(self, k: Optional[float] = None, initial: Optional[float] = None) -> None:
+        """Replay the whole history from scratch.
+
+        Args:
+            k: New K factor; defaults to the current one.
+            initial: New starting rating; defaults to the current one.
+        """
+        if k is not None:
+            self.k = k
+        if initial is not None:
+            self.initial = initial
+        self._ratings = np.full(len(self.registry), self.initial)
+        self._games = np.zeros(len(self.registry), dtype=np.int64)
+        for batch in self._history:
+            self._apply(*batch)
+
+    def _encode(self, results: Iterable[GameResult]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        games = [list(result) for result in results]
+        if not games:
+            return None
+        for game in games:
+            names = [name for name, _ in game]
+            if len(set(names)) != len(names):
+                raise ValueError(f"Player listed twice in one game: {names}")
+        seats = max(len(game) for game in games)
+        ids = np.full((len(games), seats), -1, dtype=np.int64)
+        totals = np.zeros((len(games), seats), dtype=np.int64)
+        for row, game in enumerate(games):
+            ids[row, :len(game)] = [self.registry.register(name) for name, _ in game]
+            totals[row, :len(game)] = [total for _, total in game]
+        self._grow()
+        return ids, totals
+
+    def _grow(self) -> None:
+        added = len(self.registry) - len(self._ratings)
+        if added > 0:
+            self._ratings = np.concatenate([self._ratings, np.full(added, self.initial)])
+            self._games = np.concatenate([self._games, np.zeros(added, dtype=np.int64)])
+
+    def _apply(self, ids: np.ndarray, totals: np.ndarray) -> None:
+        deltas = []
+        for start in range(0, len(ids), CHUNK_GAMES):
+            chunk = slice(start, start + CHUNK_GAMES)
+            deltas.append(self._deltas(ids[chunk], totals[chunk]))
+        seated = ids >= 0
+        players = ids[seated]
+        np.add.at(self._ratings, players, np.concatenate(deltas)[seated.ravel()])
+        np.add.at(self._games, players, 1)
+
+    def _deltas(self, ids: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        """Rating change per seat, flattened, for one chunk of games."""
+        seated = ids >= 0
+        ratings = np.where(seated, self._ratings[np.where(seated, ids, 0)], 0.0)
+
+        # [g, i, j]: seat i's expected and actual result against seat j.
+        expected = 1.0 / (1.0 + 10.0 ** ((ratings[:, None, :] - ratings[:, :, None]) / 400.0))
+        actual = (totals[:, :, None] > totals[:, None, :]) + 0.5 * (
+            totals[:, :, None] == totals[:, None, :]
+        )
+        pairs = seated[:, :, None] & seated[:, None, :]
+        pairs &= ~np.eye(ids.shape[1], dtype=bool)
+
+        opponents = seated.sum(axis=1) - 1
+        scale = np.divide(self.k, opponents, out=np.zeros(len(ids)), where=opponents > 0)
+        deltas = np.where(pairs, actual - expected, 0.0).sum(axis=2) * scale[:, None]
+        return deltas.ravel()
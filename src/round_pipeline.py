@@ -0,0 +1,231 @@
+"""Transactional round completion.
+
+Finishing a round touches three objects: the BidCollector's bids are
+scored against the tricks taken, the scores are written to the
+Scoreboard, and the RoundProgression moves to COMPLETE. RoundPipeline
+runs those steps as one operation per game: everything is validated
+and scored before the first write, so a failure leaves the game as it
+was. Change events are held on the event bus until every write is done,
+so subscribers never see a half-completed round.
+
+Batches of games are processed in a single call. Each game is still
+validated, written and snapshotted on its own, since each has its own
+objects; what the batch shares is event delivery, with every game's
+events handed to each bus subscriber in one pass at the end.
+"""
+
+import threading
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.bid_collector import BidCollector
+from src.event_bus import EventBus
+from src.player_registry import PlayerRegistry
+from src.player_stats import StatsTracker
+from src.round_progression import GamePhase as RoundPhase, RoundProgression
+from src.scoreboard import GamePhase as BoardPhase, Scoreboard
+from src.scoring import score_round
+
+
+@dataclass
+class Game:
+    """The state objects making up one game, sharing a player registry."""
+    collector: BidCollector
+    scoreboard: Scoreboard
+    progression: RoundProgression
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @classmethod
+    def create(
+        cls,
+        player_names: Sequence[str],
+        stats: Optional[StatsTracker] = None,
+        bus: Optional[EventBus] = None,
+    ) -> "Game":
+        """Create a game for the given players.
+
+        Args:
+            player_names: Players in seat order; seat i gets player_id i.
+            stats: Optional statistics tracker for bids and scores.
+            bus: Optional event bus for scoreboard and phase changes.
+        """
+        registry = PlayerRegistry()
+        scoreboard = Scoreboard(stats=stats, bus=bus, registry=registry)
+        for name in player_names:
+            scoreboard.add_player(name)
+        scoreboard.set_round(RoundProgression.MIN_ROUND, RoundProgression.MAX_ROUND)
+        collector = BidCollector(registry=registry, stats=stats)
+        return cls(collector, scoreboard, RoundProgression(bus=bus))
+
+    def reset(
+        self,
+        player_names: Sequence[str],
+        stats: Optional[StatsTracker] = None,
+        bus: Optional[EventBus] = None,
+    ) -> None:
+        """Reuse the game's objects for a new game, as create() would set it up.
+
+        Args:
+            player_names: Players in seat order; seat i gets player_id i.
+            stats: Optional statistics tracker for bids and scores.
+            bus: Optional event bus for scoreboard and phase changes.
+        """
+        scoreboard, collector, progression = self.scoreboard, self.collector, self.progression
+        scoreboard.stats = collector.stats = stats
+        scoreboard.bus = progression.bus = bus
+        self.registry.clear()
+        scoreboard.reset()
+        for name in player_names:
+            scoreboard.add_player(name)
+        scoreboard.set_round(RoundProgression.MIN_ROUND, RoundProgression.MAX_ROUND)
+        collector.reset()
+        progression.reset()
+
+    @property
+    def registry(self) -> PlayerRegistry:
+        """Get the registry shared by the game's objects."""
+        return self.scoreboard.registry
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RoundResult:
+    """Outcome of a completed round, indexed by player_id."""
+    round_num: int
+    bids: Tuple[int, ...]
+    tricks: Tuple[int, ...]
+    scores: Tuple[int, ...]
+    game_complete: bool
+
+
+class RoundPipeline:
+    """Completes rounds atomically, one game or a batch at a time."""
+
+    def complete_round(self, game: Game, tricks: Sequence[int]) -> RoundResult:
+        """Score and close the current round of a game.
+
+        Args:
+            game: The game whose round is ending.
+            tricks: Tricks taken, indexed by player_id.
+
+        Returns:
+            The round's bids, tricks and scores.
+
+        Raises:
+            ValueError: If the trick counts are invalid or a score is out of
+                range.
+            RuntimeError: If the game is not ready for scoring.
+        """
+        with self._deferred((game,)), game.lock:
+            return self._complete(game, tricks)
+
+    def complete_rounds(
+        self, batch: Iterable[Tuple[Game, Sequence[int]]]
+    ) -> List[Union[RoundResult, Exception]]:
+        """Complete the current round of many games.
+
+        Each game is completed atomically; a failing game does not affect
+        the others. Change events for the whole batch are delivered once
+        every game has been processed.
+
+        Args:
+            batch: Iterable of (game, tricks) pairs.
+
+        Returns:
+            For each pair, in order, its RoundResult or the ValueError or
+            RuntimeError that prevented it.
+        """
+        batch = list(batch)
+        results: List[Union[RoundResult, Exception]] = []
+        with self._deferred(game for game, _ in batch):
+            for game, tricks in batch:
+                try:
+                    with game.lock:
+                        results.append(self._complete(game, tricks))
+                except (ValueError, RuntimeError) as exc:
+                    results.append(exc)
+        return results
+
+    @staticmethod
+    @contextmanager
+    def _deferred(games: Iterable[Game]) -> Iterator[None]:
+        """Hold the games' bus events until the block exits."""
+        with ExitStack() as stack:
+            seen = set()
+            for game in games:
+                for bus in (game.scoreboard.bus, game.progression.bus):
+                    if bus is not None and id(bus) not in seen:
+                        seen.add(id(bus))
+                        stack.enter_context(bus.deferred())
+            yield
+
+    def _complete(self, game: Game, tricks: Sequence[int]) -> RoundResult:
+        collector, progression = game.collector, game.progression
+        round_num = progression.current_round
+
+        # Validate everything before the first write.
+        if progression.current_phase not in (RoundPhase.BIDDING, RoundPhase.SCORING):
+            raise RuntimeError(
+                f"Cannot complete round {round_num}. "
+                f"Current phase is {progression.current_phase.value}, "
+                "but must be bidding or scoring."
+            )
+        if collector.current_round != round_num:
+            raise RuntimeError(
+                f"Bids are for round {collector.current_round}, "
+                f"but the game is in round {round_num}"
+            )
+        if not collector.all_bids_collected():
+            raise RuntimeError(
+                f"Cannot proceed to scoring. Missing bids from players: "
+                f"{collector.get_missing_players()}"
+            )
+        self._validate_tricks(tricks, collector.num_players, progression.hands_in_current_round)
+
+        bids = collector.bid_list()
+        scores = score_round(bids, tricks, round_num)
+        last_round = round_num == progression.MAX_ROUND
+        phase = BoardPhase.GAME_OVER if last_round else BoardPhase.SCORING
+
+        # record_round validates the whole write before applying it, and
+        # the remaining steps cannot fail once the checks above pass. Their
+        # change events are held by the caller until all of them are done.
+        game.scoreboard.record_round(round_num, scores, phase)
+        collector.proceed_to_scoring()
+        collector.record_tricks(tricks)
+        while progression.current_phase != RoundPhase.COMPLETE:
+            progression.advance_phase()
+
+        return RoundResult(
+            round_num=round_num,
+            bids=tuple(bids),
+            tricks=tuple(tricks),
+            scores=tuple(scores),
+            game_complete=progression.is_game_complete,
+        )
+
+    @staticmethod
+    def _validate_tricks(tricks: Sequence[int], num_players: int, hands: int) -> None:
+        if len(tricks) != num_players:
+            raise ValueError(
+                f"Expected trick counts for {num_players} players, got {len(tricks)}"
+            )
+        for player_id, taken in enumerate(tricks):
+            if not 0 <= taken <= hands:
+                raise ValueError(
+                    f"Player {player_id} took {taken} tricks, "
+                    f"but the round has {hands} hands"
+                )
+        if sum(tricks) != hands:
+            raise ValueError(
+                f"Trick counts sum to {sum(tricks)}, but the round has {hands} hands"
+            )
@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import Optional
 
+from src.event_bus import EventBus
+
 
 class GamePhase(Enum):
     """Represents the current phase of the game."""
@@ -20,11 +22,25 @@ class RoundProgression:
     MIN_ROUND = 1
     MAX_ROUND = 10
     HANDS_PER_ROUND_MULTIPLIER = 1  # hands = round number
+    # Hands per round, indexed by round number.
+    HANDS = tuple(map(HANDS_PER_ROUND_MULTIPLIER.__mul__, range(MAX_ROUND + 1)))
+    # Phase that follows each phase within a round; COMPLETE moves to
+    # the next round instead.
+    NEXT_PHASE = {
+        GamePhase.SETUP: GamePhase.BIDDING,
+        GamePhase.BIDDING: GamePhase.SCORING,
+        GamePhase.SCORING: GamePhase.COMPLETE,
+    }
+
+    def __init__(self, bus: Optional[EventBus] = None):
+        """Initialize game state at round 1 with setup phase.
 
-    def __init__(self):
-        """Initialize game state at round 1 with setup phase."""
+        Args:
+            bus: Optional event bus notified on every phase change.
+        """
         self._current_round = self.MIN_ROUND
         self._current_phase = GamePhase.SETUP
+        self.bus = bus
 
     @property
     def current_round(self) -> int:
@@ -39,7 +55,7 @@ class RoundProgression:
     @property
     def hands_in_current_round(self) -> int:
         """Get the number of hands to be played in current round."""
-        return self._current_round * self.HANDS_PER_ROUND_MULTIPLIER
+        return self.HANDS[self._current_round]
 
     @property
     def is_game_complete(self) -> bool:
@@ -58,21 +74,22 @@ class RoundProgression:
         Raises:
             ValueError: If attempting to advance beyond round 10.
         """
-        if self._current_phase == GamePhase.SETUP:
-            self._current_phase = GamePhase.BIDDING
-        elif self._current_phase == GamePhase.BIDDING:
-            self._current_phase = GamePhase.SCORING
-        elif self._current_phase == GamePhase.SCORING:
-            self._current_phase = GamePhase.COMPLETE
-        elif self._current_phase == GamePhase.COMPLETE:
-            if self._current_round < self.MAX_ROUND:
-                self._current_round += 1
-                self._current_phase = GamePhase.SETUP
-            else:
-                raise ValueError(
-                    f"Cannot advance beyond round {self.MAX_ROUND}. "
-                    "Game is complete."
-                )
+        next_phase = self.NEXT_PHASE.get(self._current_phase)
+        if next_phase is not None:
+            self._current_phase = next_phase
+        elif self._current_round < self.MAX_ROUND:
+            self._current_round += 1
+            self._current_phase = GamePhase.SETUP
+        else:
+            raise ValueError(
+                f"Cannot advance beyond round {self.MAX_ROUND}. "
+                "Game is complete."
+            )
+        if self.bus is not None:
+            self.bus.publish(
+                "round_progression", "advance_phase",
+                round=self._current_round, phase=self._current_phase,
+            )
 
     def start_round(self) -> None:
         """
@@ -90,10 +107,21 @@ class RoundProgression:
             )
         self.advance_phase()
 
+    def __getstate__(self) -> dict:
+        # Bus subscriptions are process-local; reattach after unpickling.
+        state = self.__dict__.copy()
+        state["bus"] = None
+        return state
+
     def reset(self) -> None:
         """Reset game to initial state (round 1, setup phase)."""
         self._current_round = self.MIN_ROUND
         self._current_phase = GamePhase.SETUP
+        if self.bus is not None:
+            self.bus.publish(
+                "round_progression", "reset",
+                round=self._current_round, phase=self._current_phase,
+            )
 
     def __repr__(self) -> str:
         """Return string representation of current game state."""
@@ -0,0 +1,180 @@
+"""Bucketed score histogram for percentile and rank queries.
+
+Keeps a count of player totals per fixed-width bucket in a Fenwick
+(binary indexed) tree, so the number of players above any bucket is
+found, and kept up to date on every change, in time logarithmic in the
+number of buckets and independent of the number of players. Each bucket
+also counts its players per distinct total, which refines a lookup to
+the exact rank by scanning at most bucket_width totals.
+"""
+
+from typing import Dict, List, Tuple
+
+
+class ScoreHistogram:
+    """Histogram of player totals supporting percentile and rank lookups."""
+
+    def __init__(self, bucket_width: int = 10):
+        """Initialize an empty histogram.
+
+        Args:
+            bucket_width: Width of each score bucket.
+        """
+        if bucket_width < 1:
+            raise ValueError(f"bucket_width must be at least 1, got {bucket_width}")
+        self.bucket_width = bucket_width
+        self._count = 0
+        self._low = 0  # bucket index of slot 0
+        self._counts: List[int] = []  # players per bucket slot
+        self._tree: List[int] = [0]  # Fenwick tree over _counts, 1-based
+        self._scores: Dict[int, Dict[int, int]] = {}  # bucket -> total -> players
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _bucket(self, score: int) -> int:
+        return score // self.bucket_width
+
+    def _slot(self, bucket: int) -> int:
+        """Get the slot for a bucket, widening the range to include it."""
+        counts = self._counts
+        if not counts:
+            low, high = bucket, bucket + 1
+        else:
+            low, high = self._low, self._low + len(counts)
+            if low <= bucket < high:
+                return bucket - low
+            # Grow by at least the current size so repeated growth stays cheap.
+            if bucket < low:
+                low = min(bucket, low - len(counts))
+            else:
+                high = max(bucket + 1, high + len(counts))
+        new_counts = [0] * (high - low)
+        offset = self._low - low
+        new_counts[offset:offset + len(counts)] = counts
+        self._low, self._counts = low, new_counts
+        self._build_tree()
+        return bucket - low
+
+    def _build_tree(self) -> None:
+        tree = [0] + self._counts
+        size = len(tree)
+        for index in range(1, size):
+            parent = index + (index & -index)
+            if parent < size:
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def _add_to_slot(self, slot: int, delta: int) -> None:
+        self._counts[slot] += delta
+        tree = self._tree
+        index = slot + 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def _below_slot(self, slot: int) -> int:
+        """Get the number of players in slots before the given one."""
+        tree = self._tree
+        total = 0
+        while slot > 0:
+            total += tree[slot]
+            slot -= slot & -slot
+        return total
+
+    def add(self, score: int) -> None:
+        """Add a player's total."""
+        bucket = self._bucket(score)
+        self._add_to_slot(self._slot(bucket), 1)
+        totals = self._scores.setdefault(bucket, {})
+        totals[score] = totals.get(score, 0) + 1
+        self._count += 1
+
+    def remove(self, score: int) -> None:
+        """Remove a player's total.
+
+        Raises:
+            ValueError: If the score is not in the histogram.
+        """
+        bucket = self._bucket(score)
+        self._discard(bucket, score)
+        self._add_to_slot(bucket - self._low, -1)
+        self._count -= 1
+
+    def _discard(self, bucket: int, score: int) -> None:
+        totals = self._scores.get(bucket)
+        if not totals or score not in totals:
+            raise ValueError(f"Score {score} not in histogram")
+        if totals[score] == 1:
+            del totals[score]
+            if not totals:
+                del self._scores[bucket]
+        else:
+            totals[score] -= 1
+
+    def clear(self) -> None:
+        """Remove every total."""
+        self._count = 0
+        self._counts = []
+        self._tree = [0]
+        self._scores.clear()
+
+    def update(self, old_score: int, new_score: int) -> None:
+        """Move a player's total from old_score to new_score."""
+        if old_score == new_score:
+            return
+        bucket = self._bucket(new_score)
+        if self._bucket(old_score) != bucket:
+            self.remove(old_score)
+            self.add(new_score)
+            return
+        self._discard(bucket, old_score)
+        totals = self._scores.setdefault(bucket, {})
+        totals[new_score] = totals.get(new_score, 0) + 1
+
+    def _position(self, score: int) -> Tuple[int, int]:
+        """Get (players in higher buckets, players in the score's bucket)."""
+        slot = self._bucket(score) - self._low
+        if slot < 0 or not self._counts:
+            return self._count, 0
+        if slot >= len(self._counts):
+            return 0, 0
+        return self._count - self._below_slot(slot + 1), self._counts[slot]
+
+    def approximate_rank(self, score: int) -> int:
+        """Estimate the rank of a total, assuming it sits mid-bucket.
+
+        Returns:
+            1 + players in higher buckets + half the others in its bucket.
+        """
+        above, in_bucket = self._position(score)
+        return 1 + above + max(0, in_bucket - 1) // 2
+
+    def rank(self, score: int) -> int:
+        """Get the exact rank of a total: 1 + number of strictly higher totals."""
+        above, in_bucket = self._position(score)
+        if in_bucket:
+            totals = self._scores[self._bucket(score)]
+            above += sum(count for total, count in totals.items() if total > score)
+        return 1 + above
+
+    def percentile(self, score: int, exact: bool = False) -> float:
+        """Get the percentage of players with a strictly lower total.
+
+        Args:
+            score: The total to place.
+            exact: Refine within the score's bucket instead of assuming
+                half of its bucket is below.
+
+        Returns:
+            A value from 0 to 100; 0 when the histogram is empty.
+        """
+        if self._count == 0:
+            return 0.0
+        above, in_bucket = self._position(score)
+        if exact and in_bucket:
+            totals = self._scores[self._bucket(score)]
+            below = sum(count for total, count in totals.items() if total < score)
+        else:
+            below = in_bucket / 2
+        return 100.0 * (self._count - above - in_bucket + below) / self._count
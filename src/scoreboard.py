@@ -4,10 +4,20 @@ Provides functionality to display running totals for all players,
 round-by-round scores, and current standings.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import sys
+import threading
+from array import array
+from collections.abc import Mapping, MutableMapping
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Sequence, Set, Tuple
 from enum import Enum
 
+from src.event_bus import EventBus
+from src.player_registry import PlayerRef, PlayerRegistry
+from src.player_stats import StatsTracker
+from src.score_histogram import ScoreHistogram
+from src.scoreboard_render import ScoreboardRenderer
+
 
 class GamePhase(Enum):
     """Enumeration of game phases."""
@@ -17,24 +27,520 @@ class GamePhase(Enum):
     GAME_OVER = "Game Over"
 
 
-@dataclass
+_UNPLAYED = -32768  # array('h') slot value for a round without a score
+_MIN_SCORE = -32767
+_MAX_SCORE = 32767
+
+# Snapshots hold per-player values in tuples of this many player ids, so
+# a write copies only the chunks holding the players it changed.
+_CHUNK = 64
+
+Chunks = Tuple[Tuple[Any, ...], ...]
+
+
+def _chunk_get(chunks: Chunks, index: int) -> Any:
+    """Get the value at an index of chunks, or None past the end."""
+    chunk, offset = divmod(index, _CHUNK)
+    if chunk < len(chunks) and offset < len(chunks[chunk]):
+        return chunks[chunk][offset]
+    return None
+
+
+def _replace_in_chunks(chunks: Chunks, updates: Dict[int, Any]) -> Chunks:
+    """Copy chunks with updates applied by index; untouched chunks are shared.
+
+    Every chunk but the last is kept full, so index i is always at
+    chunks[i // _CHUNK][i % _CHUNK].
+    """
+    if not updates:
+        return chunks
+    chunks = list(chunks)
+    touched: Dict[int, Dict[int, Any]] = {}
+    for index, value in updates.items():
+        touched.setdefault(index // _CHUNK, {})[index % _CHUNK] = value
+    last = max(touched)
+    if last >= len(chunks):
+        if chunks and len(chunks[-1]) < _CHUNK:
+            touched.setdefault(len(chunks) - 1, {})
+        chunks.extend(() for _ in range(last + 1 - len(chunks)))
+    for index, entries in touched.items():
+        chunk = list(chunks[index])
+        size = _CHUNK if index < last else max(len(chunk), max(entries) + 1)
+        chunk.extend([None] * (size - len(chunk)))
+        for offset, value in entries.items():
+            chunk[offset] = value
+        chunks[index] = tuple(chunk)
+    return tuple(chunks)
+
+
+def _check_round_score(round_num: int, score: int) -> None:
+    """Raise if a round score cannot be stored in a PlayerScore."""
+    if round_num < 1:
+        raise ValueError(f"Round number must be at least 1, got {round_num}")
+    _check_score_range(score)
+
+
+def _check_score_range(score: int) -> None:
+    """Raise if a score or total does not fit the int16 score storage."""
+    if not _MIN_SCORE <= score <= _MAX_SCORE:
+        raise ValueError(
+            f"Score {score} out of range ({_MIN_SCORE} to {_MAX_SCORE})"
+        )
+
+
 class PlayerScore:
-    """Represents a player's score information."""
-    name: str
-    total_score: int
-    round_scores: Dict[int, int]  # round_number -> score
-    rank: int = 0
+    """Represents a player's score information.
 
+    Stored compactly: slots instead of a __dict__, an interned name, and a
+    single array('h') whose slot 0 holds the total and slot N holds the
+    score for round N. The round_scores attribute is a dict-like view over
+    that array. Writes replace the array rather than changing it, so a
+    snapshot can share it.
+    """
 
-class Scoreboard:
-    """Display and manage game scoreboard."""
+    __slots__ = ("name", "rank", "_scores")
+
+    def __init__(
+        self,
+        name: str,
+        total_score: int,
+        round_scores: Optional[Dict[int, int]] = None,
+        rank: int = 0,
+    ):
+        """Initialize a player's score record.
+
+        Args:
+            name: Player name.
+            total_score: Total score across all rounds.
+            round_scores: Optional mapping of round number to score.
+            rank: Player's current rank (1 = highest).
+        """
+        self.name = sys.intern(name)
+        self.rank = rank
+        self._scores = array("h", [0])
+        if round_scores:
+            self.round_scores = round_scores
+        self.total_score = total_score
+
+    @property
+    def total_score(self) -> int:
+        """Get the total score across all rounds."""
+        return self._scores[0]
+
+    @total_score.setter
+    def total_score(self, total: int) -> None:
+        _check_score_range(total)
+        scores = array("h", self._scores)
+        scores[0] = total
+        self._scores = scores
+
+    @property
+    def round_scores(self) -> "RoundScores":
+        """Get a dict-like view of round number -> score."""
+        return RoundScores(self)
+
+    @round_scores.setter
+    def round_scores(self, round_scores: Dict[int, int]) -> None:
+        total = self._scores[0]
+        self._scores = array("h", [total])
+        for round_num, score in round_scores.items():
+            self.set_round_score(round_num, score, update_total=False)
+
+    def get_round_score(self, round_num: int, default: Optional[int] = None) -> Optional[int]:
+        """Get the score for a round, or default if none was recorded."""
+        if 0 < round_num < len(self._scores):
+            score = self._scores[round_num]
+            if score != _UNPLAYED:
+                return score
+        return default
+
+    def set_round_score(
+        self, round_num: int, score: int, update_total: bool = True
+    ) -> Optional[int]:
+        """Store the score for a round.
+
+        Args:
+            round_num: Round number (1-based).
+            score: Score earned in the round.
+            update_total: Whether to adjust total_score by the change.
+
+        Returns:
+            The score previously recorded for the round, or None.
+
+        Raises:
+            ValueError: If the round number, score or new total is out of
+                range; nothing is stored in that case.
+        """
+        _check_round_score(round_num, score)
+        previous = self.get_round_score(round_num)
+        total = self._scores[0]
+        if update_total:
+            total += score - (previous or 0)
+            _check_score_range(total)
+        # Concatenation copies and allocates exactly; extend() would over-allocate.
+        scores = self._scores
+        scores = scores + array("h", [_UNPLAYED]) * max(0, round_num + 1 - len(scores))
+        scores[0] = total
+        scores[round_num] = score
+        self._scores = scores
+        return previous
+
+    def clear_round_score(self, round_num: int) -> Optional[int]:
+        """Remove the score for a round without touching total_score.
+
+        Returns:
+            The removed score, or None if the round had no score.
+        """
+        previous = self.get_round_score(round_num)
+        if previous is not None:
+            scores = array("h", self._scores)
+            scores[round_num] = _UNPLAYED
+            self._scores = scores
+        return previous
+
+    def played_rounds(self) -> Iterator[Tuple[int, int]]:
+        """Iterate (round_number, score) pairs in round order."""
+        scores = self._scores
+        for round_num in range(1, len(scores)):
+            score = scores[round_num]
+            if score != _UNPLAYED:
+                yield round_num, score
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerScore):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.total_score == other.total_score
+            and dict(self.played_rounds()) == dict(other.played_rounds())
+            and self.rank == other.rank
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"PlayerScore(name={self.name!r}, total_score={self.total_score!r}, "
+            f"round_scores={dict(self.played_rounds())!r}, rank={self.rank!r})"
+        )
+
+
+class RoundScores(MutableMapping):
+    """Dict-like view of a PlayerScore's round scores."""
+
+    __slots__ = ("_player",)
+
+    def __init__(self, player: PlayerScore):
+        self._player = player
+
+    def __getitem__(self, round_num: int) -> int:
+        score = self._player.get_round_score(round_num)
+        if score is None:
+            raise KeyError(round_num)
+        return score
+
+    def __setitem__(self, round_num: int, score: int) -> None:
+        # Like writes to the old per-player dict, this leaves the total alone.
+        self._player.set_round_score(round_num, score, update_total=False)
+
+    def __delitem__(self, round_num: int) -> None:
+        if self._player.clear_round_score(round_num) is None:
+            raise KeyError(round_num)
+
+    def __iter__(self) -> Iterator[int]:
+        for round_num, _ in self._player.played_rounds():
+            yield round_num
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._player.played_rounds())
+
+    def __repr__(self) -> str:
+        return repr(dict(self._player.played_rounds()))
+
+
+class StandingRow:
+    """Read-only view of one player's standing in a snapshot.
+
+    A plain slots class rather than a frozen dataclass: snapshots of large
+    boards build one per player, and frozen __init__ is several times
+    slower.
+    """
+
+    __slots__ = ("name", "scores", "rank")
+
+    def __init__(self, name: str, scores: array, rank: int):
+        self.name = name
+        self.scores = scores  # as PlayerScore stores them; never modified
+        self.rank = rank
+
+    @property
+    def total_score(self) -> int:
+        """Get the total score across all rounds."""
+        return self.scores[0]
+
+    @property
+    def round_scores(self) -> Tuple[Tuple[int, int], ...]:
+        """Get (round_number, score) pairs for the played rounds, by round."""
+        return tuple(
+            (round_num, score) for round_num, score in enumerate(self.scores)
+            if round_num and score != _UNPLAYED
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StandingRow):
+            return NotImplemented
+        return (self.name, self.total_score, self.round_scores, self.rank) == (
+            other.name, other.total_score, other.round_scores, other.rank
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"StandingRow(name={self.name!r}, total_score={self.total_score!r}, "
+            f"round_scores={self.round_scores!r}, rank={self.rank!r})"
+        )
+
+
+class _OrderHint:
+    """A board's most recently built standings and their player id order.
+
+    Shared by the board's snapshots so that each one sorts from a nearly
+    sorted list and reuses the rows that did not move. Not pickled: a copy
+    starts without a hint.
+    """
+
+    __slots__ = ("order", "rows")
 
     def __init__(self):
-        """Initialize the scoreboard."""
-        self.players: Dict[str, PlayerScore] = {}
+        self.order: Sequence[int] = ()
+        self.rows: Sequence[StandingRow] = ()
+
+    def __reduce__(self):
+        return _OrderHint, ()
+
+
+class ScoreboardSnapshot:
+    """Immutable, internally consistent version of a scoreboard.
+
+    A Scoreboard publishes one per write without ranking anyone: player
+    names and score arrays are held in chunks by player id, and a write
+    copies only the chunks of the players it changed. The standings are
+    sorted by the first reader that asks for them and kept with the
+    snapshot.
+    """
+
+    __slots__ = (
+        "version", "current_round", "total_rounds", "current_phase", "rounds",
+        "_names", "_scores", "_hint", "_standings",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        current_round: int,
+        total_rounds: int,
+        current_phase: GamePhase,
+        rounds: Tuple[int, ...],
+        standings: Optional[Tuple[StandingRow, ...]] = None,
+        names: Chunks = (),
+        scores: Chunks = (),
+        hint: Optional[_OrderHint] = None,
+    ):
+        """Initialize a snapshot from ready standings or from player chunks.
+
+        Args:
+            version: The board version the snapshot shows.
+            current_round: Current round number.
+            total_rounds: Total rounds in the game.
+            current_phase: Current game phase.
+            rounds: Every round with at least one recorded score, in order.
+            standings: Ranked rows; if None they are built from names and
+                scores on first use.
+            names: Player name per player id in chunks, None for no player.
+            scores: Score array per player id in chunks, as for names.
+            hint: Order of a recent snapshot to start sorting from.
+        """
+        self.version = version
+        self.current_round = current_round
+        self.total_rounds = total_rounds
+        self.current_phase = current_phase
+        self.rounds = rounds
+        self._names = names
+        self._scores = scores
+        self._hint = hint if hint is not None else _OrderHint()
+        self._standings = standings
+
+    @property
+    def standings(self) -> Tuple[StandingRow, ...]:
+        """Get the rows sorted by total score descending, ties by player id."""
+        standings = self._standings
+        if standings is None:
+            # Readers racing here build equal tuples; either may be kept.
+            standings = self._standings = self._rank()
+        return standings
+
+    def _rank(self) -> Tuple[StandingRow, ...]:
+        names = list(chain.from_iterable(self._names))
+        arrays = list(chain.from_iterable(self._scores))
+        present = [player_id for player_id, name in enumerate(names) if name is not None]
+        # Players are only ever added until a reset, which replaces the
+        # hint, so a hint of the same size holds the same players.
+        order = list(self._hint.order)
+        if len(order) != len(present):
+            order = present
+        order.sort(key=lambda player_id: (arrays[player_id][0] << 32) - player_id, reverse=True)
+        previous = self._hint.rows
+        if len(previous) == len(order):
+            # A player's score array is replaced on every change, so a row
+            # whose array is the one at its position is still correct.
+            rows = list(previous)
+            for index, player_id in enumerate(order):
+                scores = arrays[player_id]
+                if rows[index].scores is not scores:
+                    rows[index] = StandingRow(names[player_id], scores, index + 1)
+            standings = tuple(rows)
+        else:
+            standings = tuple(map(
+                StandingRow,
+                map(names.__getitem__, order),
+                map(arrays.__getitem__, order),
+                range(1, len(order) + 1),
+            ))
+        self._hint.order, self._hint.rows = order, standings
+        return standings
+
+    def player(self, player_name: str) -> StandingRow:
+        """Get a player's row.
+
+        Raises:
+            ValueError: If player doesn't exist.
+        """
+        for row in self.standings:
+            if row.name == player_name:
+                return row
+        raise ValueError(f"Player '{player_name}' not found")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScoreboardSnapshot):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None
+
+    def _key(self) -> tuple:
+        return (
+            self.version, self.current_round, self.total_rounds,
+            self.current_phase, self.rounds, self.standings,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ScoreboardSnapshot(version={self.version!r}, "
+            f"current_round={self.current_round!r}, total_rounds={self.total_rounds!r}, "
+            f"current_phase={self.current_phase!r}, rounds={self.rounds!r})"
+        )
+
+
+class PlayersView(Mapping):
+    """Read-only mapping of player name -> PlayerScore over a Scoreboard."""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board: "Scoreboard"):
+        self._board = board
+
+    def __getitem__(self, player_name: str) -> PlayerScore:
+        player_id = self._board.registry._ids.get(player_name)
+        by_id = self._board._by_id
+        if player_id is None or player_id >= len(by_id) or by_id[player_id] is None:
+            raise KeyError(player_name)
+        return by_id[player_id]
+
+    def __iter__(self) -> Iterator[str]:
+        for player in self._board._by_id:
+            if player is not None:
+                yield player.name
+
+    def __len__(self) -> int:
+        return self._board._player_count
+
+
+class Scoreboard:
+    """Display and manage game scoreboard.
+
+    Players are stored in a list indexed by their PlayerRegistry id; names
+    are only needed for lookups by name and for rendering. Methods that
+    take a player accept either the id or the name.
+    """
+
+    def __init__(
+        self,
+        stats: Optional[StatsTracker] = None,
+        bus: Optional[EventBus] = None,
+        registry: Optional[PlayerRegistry] = None,
+        histogram: Optional[ScoreHistogram] = None,
+    ):
+        """Initialize the scoreboard.
+
+        Args:
+            stats: Optional statistics tracker fed with every recorded
+                score, keyed by player name.
+            bus: Optional event bus notified of every change.
+            registry: Registry assigning player ids; share one with the
+                game's BidCollector so both use the same ids.
+            histogram: Optional score histogram kept in step with every
+                player's total, for percentile and rank lookups.
+        """
+        self.registry = registry if registry is not None else PlayerRegistry()
+        self._by_id: List[Optional[PlayerScore]] = []
+        self._player_count = 0
+        self.players = PlayersView(self)
         self.current_round: int = 0
         self.current_phase: GamePhase = GamePhase.SETUP
         self.total_rounds: int = 0
+        self.stats = stats
+        self.histogram = histogram
+        self.bus = bus
+        self.version = 0
+        self._lock = threading.Lock()
+        # Snapshot bookkeeping: the published name and score chunks, and
+        # players added or changed since they were published.
+        self._stale: Set[int] = set()
+        self._rounds: Set[int] = set()  # rounds with at least one score
+        self._names: Chunks = ()
+        self._scores: Chunks = ()
+        self._hint = _OrderHint()
+        self._snapshot = self._build_snapshot()
+        self._renderer: Optional[ScoreboardRenderer] = None
+
+    def __getstate__(self) -> dict:
+        # Locks and bus subscriptions are process-local; the published
+        # snapshot is rebuilt on load.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_snapshot"] = None
+        state["_names"] = state["_scores"] = ()
+        state["_stale"] = set(range(len(self._by_id)))
+        state["bus"] = None
+        state["_renderer"] = None
+        del state["players"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self.players = PlayersView(self)
+        self._snapshot = self._build_snapshot()
+
+    def _changed(self) -> None:
+        """Bump the version and publish the next snapshot (lock held)."""
+        self.version += 1
+        self._snapshot = self._build_snapshot()
+
+    def _publish(self, kind: str, **payload) -> None:
+        if self.bus is not None:
+            self.bus.publish("scoreboard", kind, **payload)
 
     def add_player(self, player_name: str) -> None:
         """Add a player to the scoreboard.
@@ -45,31 +551,254 @@ class Scoreboard:
         Raises:
             ValueError: If player already exists.
         """
-        if player_name in self.players:
-            raise ValueError(f"Player '{player_name}' already exists")
-        self.players[player_name] = PlayerScore(
-            name=player_name,
-            total_score=0,
-            round_scores={}
-        )
+        with self._lock:
+            self._add_players((player_name,))
+            self._changed()
+        self._publish("add_player", player_name=player_name)
 
-    def record_round_score(self, player_name: str, round_num: int, score: int) -> None:
+    def add_players(self, player_names: Iterable[str]) -> None:
+        """Add several players as one write.
+
+        Publishes one snapshot and one change event for all of them.
+
+        Args:
+            player_names: Names of the players to add, in id order.
+
+        Raises:
+            ValueError: If any player already exists or is given twice; no
+                player is added in that case.
+        """
+        player_names = list(player_names)
+        with self._lock:
+            self._add_players(player_names)
+            self._changed()
+        self._publish("add_players", count=len(player_names))
+
+    def _add_players(self, player_names: Sequence[str]) -> None:
+        """Check and add new players (lock held)."""
+        by_id = self._by_id
+        ids = self.registry._ids
+        seen = set()
+        for player_name in player_names:
+            player_id = ids.get(player_name)
+            if player_name in seen or (
+                player_id is not None and player_id < len(by_id) and by_id[player_id] is not None
+            ):
+                raise ValueError(f"Player '{player_name}' already exists")
+            seen.add(player_name)
+        for player_name in player_names:
+            player_id = self.registry.register(player_name)
+            if player_id >= len(by_id):
+                by_id.extend([None] * (player_id + 1 - len(by_id)))
+            by_id[player_id] = PlayerScore(
+                name=player_name,
+                total_score=0,
+                round_scores={}
+            )
+            self._stale.add(player_id)
+            if self.histogram is not None:
+                self.histogram.add(0)
+        self._player_count += len(player_names)
+
+    def record_round_score(self, player_name: PlayerRef, round_num: int, score: int) -> None:
         """Record a player's score for a round.
 
         Args:
-            player_name: Name of the player.
+            player_name: Name or id of the player.
             round_num: Round number.
             score: Score earned in the round.
 
+        Raises:
+            ValueError: If player doesn't exist, or the round or score is
+                out of range.
+        """
+        with self._lock:
+            player_id, player = self._validate_score(player_name, round_num, score)
+            
+            old_total = player.total_score
+            previous = player.set_round_score(round_num, score)
+            self._stale.add(player_id)
+            self._rounds.add(round_num)
+            if self.histogram is not None:
+                self.histogram.update(old_total, player.total_score)
+            if self.stats is not None:
+                self.stats.record_score(player.name, round_num, score, previous)
+            self._changed()
+        self._publish(
+            "record_round_score",
+            player_name=player.name, round_num=round_num, score=score,
+        )
+
+    def record_round(
+        self,
+        round_num: int,
+        scores: Sequence[Optional[int]],
+        phase: Optional[GamePhase] = None,
+    ) -> None:
+        """Record one round's scores for many players, indexed by player id.
+
+        Args:
+            round_num: Round number.
+            scores: Score for each player id; None skips that player.
+            phase: Optional phase to switch to as part of the same write.
+
+        Raises:
+            ValueError: If any player doesn't exist, or the round or any
+                score is out of range.
+        """
+        self.record_round_scores(
+            ((player_id, round_num, score)
+             for player_id, score in enumerate(scores) if score is not None),
+            phase,
+        )
+
+    def record_round_scores(
+        self,
+        scores: Iterable[Tuple[PlayerRef, int, int]],
+        phase: Optional[GamePhase] = None,
+    ) -> None:
+        """Record several round scores as one batch.
+
+        Every player is checked before anything is written, totals are
+        recomputed once per affected player, and a single change event is
+        published for the whole batch.
+
+        Args:
+            scores: Iterable of (player name or id, round_num, score) tuples.
+            phase: Optional phase to switch to as part of the same write.
+
+        Raises:
+            ValueError: If any player doesn't exist, or any round or score
+                is out of range.
+        """
+        with self._lock:
+            resolved = []
+            totals: Dict[int, int] = {}
+            written: Dict[Tuple[int, int], int] = {}
+            for player_name, round_num, score in scores:
+                player_id, player = self._validate_score(player_name, round_num, score)
+                key = (player_id, round_num)
+                previous = written.get(key, player.get_round_score(round_num, 0))
+                total = totals.get(player_id, player.total_score) + score - previous
+                _check_score_range(total)
+                totals[player_id] = total
+                written[key] = score
+                resolved.append((player_id, player, round_num, score))
+
+            old_totals = {player_id: player.total_score for player_id, player, _, _ in resolved}
+            for player_id, player, round_num, score in resolved:
+                previous = player.set_round_score(round_num, score)
+                if self.stats is not None:
+                    self.stats.record_score(player.name, round_num, score, previous)
+            self._stale.update(old_totals)
+            self._rounds.update(round_num for _, _, round_num, _ in resolved)
+            if self.histogram is not None:
+                for player_id, old_total in old_totals.items():
+                    self.histogram.update(old_total, self._by_id[player_id].total_score)
+            if phase is not None:
+                self.current_phase = phase
+            if resolved or phase is not None:
+                self._changed()
+        if resolved:
+            self._publish("record_round_scores", count=len(resolved))
+        if phase is not None:
+            self._publish("set_phase", phase=phase)
+
+    def reset(self) -> None:
+        """Remove every player and return to the setup phase, for reuse.
+
+        The registry is left alone; clear it as well when the board will
+        be reused for different players. The version keeps counting up, so
+        snapshots and renders of the old game are never reused.
+        """
+        with self._lock:
+            self._clear()
+            self._changed()
+        self._publish("reset")
+
+    def _clear(self) -> None:
+        """Drop all game state (lock held)."""
+        self._by_id.clear()
+        self._player_count = 0
+        self._stale.clear()
+        self._rounds.clear()
+        self._names = self._scores = ()
+        self._hint = _OrderHint()
+        self.current_round = 0
+        self.current_phase = GamePhase.SETUP
+        self.total_rounds = 0
+        if self.histogram is not None:
+            self.histogram.clear()
+
+    def percentile_of(self, player: PlayerRef, exact: bool = False) -> float:
+        """Get the percentage of players whose total is below this player's.
+
+        Args:
+            player: Name or id of the player.
+            exact: Refine within the histogram bucket.
+
         Raises:
             ValueError: If player doesn't exist.
+            RuntimeError: If the scoreboard has no histogram.
         """
-        if player_name not in self.players:
-            raise ValueError(f"Player '{player_name}' not found")
-        
-        player = self.players[player_name]
-        player.round_scores[round_num] = score
-        player.total_score = sum(player.round_scores.values())
+        return self._require_histogram().percentile(self._player(player)[1].total_score, exact)
+
+    def rank_of(self, player: PlayerRef, exact: bool = True) -> int:
+        """Get a player's rank (1 = highest; ties share the better rank).
+
+        Args:
+            player: Name or id of the player.
+            exact: Refine within the histogram bucket; otherwise estimate.
+
+        Raises:
+            ValueError: If player doesn't exist.
+            RuntimeError: If the scoreboard has no histogram.
+        """
+        histogram = self._require_histogram()
+        total = self._player(player)[1].total_score
+        return histogram.rank(total) if exact else histogram.approximate_rank(total)
+
+    def _require_histogram(self) -> ScoreHistogram:
+        if self.histogram is None:
+            raise RuntimeError("Scoreboard has no score histogram")
+        return self.histogram
+
+    def _player(self, player: PlayerRef) -> Tuple[int, PlayerScore]:
+        """Get a player's id and score record from their id or name."""
+        if isinstance(player, str):
+            player_id = self.registry._ids.get(player)
+        else:
+            player_id = player
+        by_id = self._by_id
+        if player_id is None or not 0 <= player_id < len(by_id) or by_id[player_id] is None:
+            raise ValueError(f"Player '{player}' not found")
+        return player_id, by_id[player_id]
+
+    def validate_score(self, player_name: PlayerRef, round_num: int, score: int) -> int:
+        """Check that a round score could be recorded, without recording it.
+
+        Args:
+            player_name: Name or id of the player.
+            round_num: Round number.
+            score: Score earned in the round.
+
+        Returns:
+            The player's id.
+
+        Raises:
+            ValueError: If player doesn't exist, or the round or score is
+                out of range.
+        """
+        with self._lock:
+            return self._validate_score(player_name, round_num, score)[0]
+
+    def _validate_score(
+        self, player: PlayerRef, round_num: int, score: int
+    ) -> Tuple[int, PlayerScore]:
+        """Raise if a round score cannot be recorded; else resolve the player."""
+        resolved = self._player(player)
+        _check_round_score(round_num, score)
+        return resolved
 
     def set_round(self, round_num: int, total_rounds: int) -> None:
         """Set current round information.
@@ -78,9 +807,12 @@ class Scoreboard:
             round_num: Current round number.
             total_rounds: Total rounds in the game.
         """
-        self.current_round = round_num
-        self.total_rounds = total_rounds
-        self.current_phase = GamePhase.ROUND
+        with self._lock:
+            self.current_round = round_num
+            self.total_rounds = total_rounds
+            self.current_phase = GamePhase.ROUND
+            self._changed()
+        self._publish("set_round", round_num=round_num, total_rounds=total_rounds)
 
     def set_phase(self, phase: GamePhase) -> None:
         """Set the current game phase.
@@ -88,7 +820,48 @@ class Scoreboard:
         Args:
             phase: The current game phase.
         """
-        self.current_phase = phase
+        with self._lock:
+            self.current_phase = phase
+            self._changed()
+        self._publish("set_phase", phase=phase)
+
+    def snapshot(self) -> ScoreboardSnapshot:
+        """Get an immutable, consistent version of the scoreboard.
+
+        Every write publishes the next snapshot before releasing the writer
+        lock, so readers only load the current one and never lock. The
+        writer only republishes the players it changed; ranking happens
+        when a reader first asks for the snapshot's standings.
+
+        Returns:
+            The snapshot for the current version.
+        """
+        return self._snapshot
+
+    def _build_snapshot(self) -> ScoreboardSnapshot:
+        # Costs the number of changed players times _CHUNK, plus a copy of
+        # the chunk tuples; nothing here walks every player.
+        by_id = self._by_id
+        stale = self._stale
+        if stale:
+            self._names = _replace_in_chunks(self._names, {
+                player_id: by_id[player_id].name for player_id in stale
+                if _chunk_get(self._names, player_id) is None
+            })
+            self._scores = _replace_in_chunks(
+                self._scores, {player_id: by_id[player_id]._scores for player_id in stale}
+            )
+            stale.clear()
+        return ScoreboardSnapshot(
+            version=self.version,
+            current_round=self.current_round,
+            total_rounds=self.total_rounds,
+            current_phase=self.current_phase,
+            rounds=tuple(sorted(self._rounds)),
+            names=self._names,
+            scores=self._scores,
+            hint=self._hint,
+        )
 
     def get_standings(self) -> List[PlayerScore]:
         """Get player standings sorted by score (descending).
@@ -96,7 +869,7 @@ class Scoreboard:
         Returns:
             List of PlayerScore objects sorted by total score descending.
         """
-        standings = list(self.players.values())
+        standings = [player for player in self._by_id if player is not None]
         standings.sort(key=lambda p: p.total_score, reverse=True)
         
         # Update ranks
@@ -105,28 +878,20 @@ class Scoreboard:
         
         return standings
 
+    @property
+    def renderer(self) -> ScoreboardRenderer:
+        """Get the board's renderer, creating it on first use."""
+        if self._renderer is None:
+            self._renderer = ScoreboardRenderer(self)
+        return self._renderer
+
     def display_standings(self) -> str:
         """Display current player standings.
 
         Returns:
             Formatted string with player rankings and scores.
         """
-        if not self.players:
-            return "No players in the game."
-        
-        standings = self.get_standings()
-        lines = ["="*50]
-        lines.append(f"CURRENT STANDINGS")
-        lines.append(f"Round {self.current_round}/{self.total_rounds} | Phase: {self.current_phase.value}")
-        lines.append("="*50)
-        lines.append(f"{'Rank':<6}{'Player':<25}{'Score':<10}")
-        lines.append("-"*50)
-        
-        for player in standings:
-            lines.append(f"{player.rank:<6}{player.name:<25}{player.total_score:<10}")
-        
-        lines.append("="*50)
-        return "\n".join(lines)
+        return self.renderer.render("text", "standings")
 
     def display_round_breakdown(self, player_name: Optional[str] = None) -> str:
         """Display round-by-round score breakdown.
@@ -138,44 +903,7 @@ class Scoreboard:
         Returns:
             Formatted string with round-by-round scores.
         """
-        if not self.players:
-            return "No players in the game."
-        
-        if player_name:
-            if player_name not in self.players:
-                raise ValueError(f"Player '{player_name}' not found")
-            players_to_display = [self.players[player_name]]
-        else:
-            players_to_display = self.get_standings()
-        
-        lines = ["="*70]
-        lines.append("ROUND-BY-ROUND BREAKDOWN")
-        lines.append("="*70)
-        
-        # Get all rounds that have been played
-        all_rounds = set()
-        for player in self.players.values():
-            all_rounds.update(player.round_scores.keys())
-        
-        if not all_rounds:
-            return "No rounds played yet."
-        
-        sorted_rounds = sorted(all_rounds)
-        
-        for player in players_to_display:
-            lines.append(f"\n{player.name} (Total: {player.total_score})")
-            lines.append("-"*70)
-            lines.append(f"{'Round':<10}{'Score':<10}{'Running Total':<15}")
-            lines.append("-"*70)
-            
-            running_total = 0
-            for round_num in sorted_rounds:
-                score = player.round_scores.get(round_num, 0)
-                running_total += score
-                lines.append(f"{round_num:<10}{score:<10}{running_total:<15}")
-        
-        lines.append("="*70)
-        return "\n".join(lines)
+        return self.renderer.render("text", "breakdown", player_name or None)
 
     def display_game_status(self) -> str:
         """Display comprehensive game status including standings and phase info.
@@ -183,8 +911,4 @@ class Scoreboard:
         Returns:
             Formatted string with complete game status.
         """
-        status_lines = []
-        status_lines.append("\n" + self.display_standings())
-        status_lines.append("\n")
-        status_lines.append(self.display_round_breakdown())
-        return "\n".join(status_lines)
+        return self.renderer.render("text", "status")
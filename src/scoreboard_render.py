@@ -0,0 +1,276 @@
+"""Multi-format rendering of scoreboard standings and breakdowns.
+
+A ScoreboardRenderer renders a board's current snapshot as text, JSON
+or CSV. Several formats can be produced in one pass over the standings,
+static headers and row formats are built once per renderer, and output
+is written straight into string buffers. Rendered output is cached until
+the scoreboard's version changes.
+"""
+
+import csv
+import io
+import json
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.scoreboard import Scoreboard, ScoreboardSnapshot
+
+FORMATS = ("text", "json", "csv")
+VIEWS = ("standings", "breakdown", "status")
+
+_STANDINGS_WIDTH = 50
+_BREAKDOWN_WIDTH = 70
+
+
+class ScoreboardRenderer:
+    """Renders a Scoreboard's snapshots in text, JSON and CSV."""
+
+    def __init__(self, scoreboard: "Scoreboard"):
+        """Initialize the renderer and precompute its layouts.
+
+        Args:
+            scoreboard: Board whose snapshots are rendered.
+        """
+        self.scoreboard = scoreboard
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple[str, str, Optional[str]], str] = {}
+        self._cache_version = -1
+
+        rule = "=" * _STANDINGS_WIDTH
+        self._standings_head = f"{rule}\nCURRENT STANDINGS\n"
+        self._standings_columns = (
+            f"{rule}\n{'Rank':<6}{'Player':<25}{'Score':<10}\n"
+            + "-" * _STANDINGS_WIDTH + "\n"
+        )
+        self._standings_tail = rule
+        self._standings_row = "{:<6}{:<25}{:<10}\n".format
+
+        rule = "=" * _BREAKDOWN_WIDTH
+        dash = "-" * _BREAKDOWN_WIDTH
+        self._breakdown_head = f"{rule}\nROUND-BY-ROUND BREAKDOWN\n{rule}"
+        self._breakdown_columns = (
+            f"\n{dash}\n{'Round':<10}{'Score':<10}{'Running Total':<15}\n{dash}"
+        )
+        self._breakdown_tail = f"\n{rule}"
+        self._breakdown_row = "\n{:<10}{:<10}{:<15}".format
+
+    def render(
+        self, fmt: str = "text", view: str = "standings",
+        player_name: Optional[str] = None,
+        snapshot: Optional["ScoreboardSnapshot"] = None,
+    ) -> str:
+        """Render the board's current snapshot.
+
+        Args:
+            fmt: One of "text", "json" or "csv".
+            view: One of "standings", "breakdown" or "status".
+            player_name: Restrict a breakdown to a single player.
+            snapshot: Snapshot to render instead of the current one, for
+                callers that derive other data from the same version.
+
+        Returns:
+            The rendered document.
+
+        Raises:
+            ValueError: If the format, view or player is unknown.
+        """
+        return self.render_many((fmt,), view, player_name, snapshot)[fmt]
+
+    def render_many(
+        self, formats: Iterable[str] = FORMATS, view: str = "standings",
+        player_name: Optional[str] = None,
+        snapshot: Optional["ScoreboardSnapshot"] = None,
+    ) -> Dict[str, str]:
+        """Render several formats from one pass over the same snapshot.
+
+        Args:
+            formats: Formats to produce.
+            view: One of "standings", "breakdown" or "status".
+            player_name: Restrict a breakdown to a single player.
+            snapshot: Snapshot to render instead of the current one.
+
+        Returns:
+            Dictionary mapping each format to its rendered document.
+
+        Raises:
+            ValueError: If a format, the view or the player is unknown.
+        """
+        formats = tuple(formats)
+        for fmt in formats:
+            if fmt not in FORMATS:
+                raise ValueError(f"Unknown format '{fmt}'. Expected one of {FORMATS}")
+        if view not in VIEWS:
+            raise ValueError(f"Unknown view '{view}'. Expected one of {VIEWS}")
+        if player_name is not None and view == "standings":
+            raise ValueError("player_name only applies to breakdown views")
+
+        if snapshot is None:
+            snapshot = self.scoreboard.snapshot()
+        with self._lock:
+            if self._cache_version != snapshot.version:
+                self._cache.clear()
+                self._cache_version = snapshot.version
+            cached = {
+                fmt: self._cache[(fmt, view, player_name)]
+                for fmt in formats if (fmt, view, player_name) in self._cache
+            }
+        missing = tuple(fmt for fmt in formats if fmt not in cached)
+        if not missing:
+            return cached
+
+        rendered = self._render_snapshot(snapshot, missing, view, player_name)
+        with self._lock:
+            if self._cache_version == snapshot.version:
+                for fmt, body in rendered.items():
+                    self._cache[(fmt, view, player_name)] = body
+        cached.update(rendered)
+        return cached
+
+    def _render_snapshot(
+        self, snapshot: "ScoreboardSnapshot", formats: Tuple[str, ...],
+        view: str, player_name: Optional[str],
+    ) -> Dict[str, str]:
+        buffers = {fmt: io.StringIO() for fmt in formats}
+        if view == "standings":
+            self._write_standings(snapshot, buffers)
+        elif view == "breakdown":
+            self._write_breakdown(snapshot, buffers, player_name)
+        else:
+            self._write_status(snapshot, buffers)
+        return {fmt: buffer.getvalue() for fmt, buffer in buffers.items()}
+
+    def _write_standings(
+        self, snapshot: "ScoreboardSnapshot", buffers: Dict[str, io.StringIO]
+    ) -> None:
+        text = buffers.get("text")
+        data = buffers.get("json")
+        table = csv.writer(buffers["csv"], lineterminator="\n") if "csv" in buffers else None
+
+        if text is not None:
+            if not snapshot.standings:
+                text.write("No players in the game.")
+                text = None
+            else:
+                text.write(self._standings_head)
+                text.write(
+                    f"Round {snapshot.current_round}/{snapshot.total_rounds} "
+                    f"| Phase: {snapshot.current_phase.value}\n"
+                )
+                text.write(self._standings_columns)
+        if data is not None:
+            data.write(
+                f'{{"version": {snapshot.version}, '
+                f'"current_round": {snapshot.current_round}, '
+                f'"total_rounds": {snapshot.total_rounds}, '
+                f'"phase": {json.dumps(snapshot.current_phase.value)}, '
+                f'"standings": ['
+            )
+        if table is not None:
+            table.writerow(("rank", "name", "total_score"))
+
+        for index, row in enumerate(snapshot.standings):
+            if text is not None:
+                text.write(self._standings_row(row.rank, row.name, row.total_score))
+            if data is not None:
+                if index:
+                    data.write(", ")
+                data.write(
+                    f'{{"rank": {row.rank}, "name": {json.dumps(row.name)}, '
+                    f'"total_score": {row.total_score}}}'
+                )
+            if table is not None:
+                table.writerow((row.rank, row.name, row.total_score))
+
+        if text is not None:
+            text.write(self._standings_tail)
+        if data is not None:
+            data.write("]}")
+
+    def _write_breakdown(
+        self, snapshot: "ScoreboardSnapshot", buffers: Dict[str, io.StringIO],
+        player_name: Optional[str],
+    ) -> None:
+        text = buffers.get("text")
+        data = buffers.get("json")
+        table = csv.writer(buffers["csv"], lineterminator="\n") if "csv" in buffers else None
+
+        if player_name is not None:
+            # An empty board reports "no players" rather than an unknown name.
+            rows = (snapshot.player(player_name),) if snapshot.standings else ()
+        else:
+            rows = snapshot.standings
+
+        if text is not None:
+            if not snapshot.standings:
+                text.write("No players in the game.")
+                text = None
+            elif not snapshot.rounds:
+                text.write("No rounds played yet.")
+                text = None
+            else:
+                text.write(self._breakdown_head)
+        if data is not None:
+            data.write(f'{{"version": {snapshot.version}, "rounds": {list(snapshot.rounds)}, "players": [')
+        if table is not None:
+            table.writerow(("name", "round", "score", "running_total"))
+
+        for index, row in enumerate(rows):
+            scores = dict(row.round_scores)
+            if text is not None:
+                text.write(f"\n\n{row.name} (Total: {row.total_score})")
+                text.write(self._breakdown_columns)
+            if data is not None:
+                if index:
+                    data.write(", ")
+                data.write(
+                    f'{{"name": {json.dumps(row.name)}, '
+                    f'"total_score": {row.total_score}, "rounds": ['
+                )
+            running_total = 0
+            for round_index, round_num in enumerate(snapshot.rounds):
+                score = scores.get(round_num, 0)
+                running_total += score
+                if text is not None:
+                    text.write(self._breakdown_row(round_num, score, running_total))
+                if data is not None:
+                    if round_index:
+                        data.write(", ")
+                    data.write(
+                        f'{{"round": {round_num}, "score": {score}, '
+                        f'"running_total": {running_total}}}'
+                    )
+                if table is not None:
+                    table.writerow((row.name, round_num, score, running_total))
+            if data is not None:
+                data.write("]}")
+
+        if text is not None:
+            text.write(self._breakdown_tail)
+        if data is not None:
+            data.write("]}")
+
+    def _write_status(
+        self, snapshot: "ScoreboardSnapshot", buffers: Dict[str, io.StringIO]
+    ) -> None:
+        standings = {fmt: io.StringIO() for fmt in buffers}
+        breakdown = {fmt: io.StringIO() for fmt in buffers}
+        self._write_standings(snapshot, standings)
+        self._write_breakdown(snapshot, breakdown, None)
+
+        for fmt, buffer in buffers.items():
+            if fmt == "text":
+                buffer.write("\n")
+                buffer.write(standings[fmt].getvalue())
+                buffer.write("\n\n\n")
+                buffer.write(breakdown[fmt].getvalue())
+            elif fmt == "json":
+                buffer.write('{"standings": ')
+                buffer.write(standings[fmt].getvalue())
+                buffer.write(', "breakdown": ')
+                buffer.write(breakdown[fmt].getvalue())
+                buffer.write("}")
+            else:
+                buffer.write(standings[fmt].getvalue())
+                buffer.write("\n")
+                buffer.write(breakdown[fmt].getvalue())
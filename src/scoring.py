@@ -0,0 +1,97 @@
+"""Round scoring rules.
+
+Mirrors ScoreCalculation.calculate on the Java side:
+
+- Bid 1+: if bid == tricks taken, score = +20 * bid;
+  otherwise score = -10 * |bid - tricks taken|
+- Bid 0: if no tricks taken, score = +10 * round number;
+  otherwise score = -10 * round number
+
+Every score a game can produce, for rounds 1 to RoundProgression.MAX_ROUND
+with bids and tricks from 0 to the round number, is computed once at
+import into SCORE_TABLE, and the valid bids per round into VALID_BIDS.
+Lookups fall back to the formula outside those ranges.
+"""
+
+from typing import List, Sequence, Tuple
+
+from src.round_progression import RoundProgression
+
+_MAX_ROUND = RoundProgression.MAX_ROUND
+
+
+def _formula(bid: int, tricks_taken: int, round_number: int) -> int:
+    if bid == 0:
+        return 10 * round_number if tricks_taken == 0 else -10 * round_number
+    if bid == tricks_taken:
+        return 20 * bid
+    return -10 * abs(bid - tricks_taken)
+
+
+# SCORE_TABLE[round][bid][tricks]; row 0 is an unused placeholder.
+SCORE_TABLE: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_formula(bid, taken, round_number) for taken in range(round_number + 1))
+        for bid in range(round_number + 1)
+    )
+    for round_number in range(_MAX_ROUND + 1)
+)
+
+# VALID_BIDS[round]: the bids a player may make in that round.
+VALID_BIDS: Tuple[range, ...] = tuple(
+    range(round_number + 1) for round_number in range(_MAX_ROUND + 1)
+)
+
+
+def valid_bids(round_number: int) -> range:
+    """Get the bids a player may make in a round: 0 to the round number."""
+    if 0 <= round_number < len(VALID_BIDS):
+        return VALID_BIDS[round_number]
+    return range(max(round_number, -1) + 1)
+
+
+def calculate_score(bid: int, tricks_taken: int, round_number: int) -> int:
+    """Calculate a player's score for one round.
+
+    Args:
+        bid: The number of tricks bid.
+        tricks_taken: The number of tricks actually taken.
+        round_number: The current round number (1-based).
+
+    Returns:
+        The round score.
+    """
+    if 0 <= bid <= round_number <= _MAX_ROUND and 0 <= tricks_taken <= round_number:
+        return SCORE_TABLE[round_number][bid][tricks_taken]
+    return _formula(bid, tricks_taken, round_number)
+
+
+def score_round(
+    bids: Sequence[int], tricks: Sequence[int], round_number: int
+) -> List[int]:
+    """Calculate every player's score for one round.
+
+    Args:
+        bids: Bids indexed by player_id.
+        tricks: Tricks taken, indexed by player_id.
+        round_number: The current round number (1-based).
+
+    Returns:
+        Scores indexed by player_id.
+
+    Raises:
+        ValueError: If bids and tricks differ in length.
+    """
+    if len(bids) != len(tricks):
+        raise ValueError(
+            f"Got {len(bids)} bids but {len(tricks)} trick counts"
+        )
+    if not 0 < round_number <= _MAX_ROUND:
+        return [_formula(bid, taken, round_number) for bid, taken in zip(bids, tricks)]
+    table = SCORE_TABLE[round_number]
+    return [
+        table[bid][taken]
+        if 0 <= bid <= round_number and 0 <= taken <= round_number
+        else _formula(bid, taken, round_number)
+        for bid, taken in zip(bids, tricks)
+    ]
@@ -0,0 +1,404 @@
+"""Scoreboard mirrored into shared memory for readers in other processes.
+
+A SharedScoreboard is a Scoreboard that keeps its totals, round scores,
+ranks and player names in a multiprocessing.shared_memory block. Every
+write updates the block under the scoreboard's writer lock, bracketed by
+a seqlock counter: odd while a write is in progress, even when the block
+is consistent. A SharedScoreboardReader attached by name in another
+process reads the block in place, retrying for up to a timeout when
+the counter shows a concurrent write, so renderers get consistent data
+without pickling or any IPC per read.
+
+Block layout (native byte order):
+
+    header   seq, version, capacities, player count,
+             round, total rounds, phase, name bytes used
+    ranks    int32 per player id (0 = no player in that slot)
+    scores   int16 rows per player id: slot 0 the total, slot N round N,
+             -32768 for an unplayed round (as in PlayerScore)
+    names    (offset, length) int32 pairs per player id, then UTF-8 bytes
+
+Usage:
+    board = SharedScoreboard(max_players=8)
+    ...                                  # in a renderer process:
+    reader = SharedScoreboardReader(board.name)
+    text = ScoreboardRenderer(reader).render("text", "status")
+"""
+
+import struct
+import time
+from array import array
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Sequence, Set, Tuple, TypeVar
+
+from src.event_bus import EventBus
+from src.player_registry import PlayerRef, PlayerRegistry
+from src.player_stats import StatsTracker
+from src.round_progression import RoundProgression
+from src.score_histogram import ScoreHistogram
+from src.scoreboard import (
+    _UNPLAYED,
+    GamePhase,
+    PlayerScore,
+    Scoreboard,
+    ScoreboardSnapshot,
+    StandingRow,
+)
+
+T = TypeVar("T")
+
+_SEQ = struct.Struct("=Q")
+# version, max players, max rounds, name capacity, player count,
+# current round, total rounds, phase, name bytes used
+_HEADER = struct.Struct("=qiiiiiiii")
+_HEADER_SIZE = _SEQ.size + _HEADER.size
+_PHASES = tuple(GamePhase)
+_PHASE_INDEX = {phase: index for index, phase in enumerate(_PHASES)}
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class _Layout:
+    """Region offsets of a block with the given capacities."""
+
+    def __init__(self, max_players: int, max_rounds: int, name_capacity: int):
+        self.max_players = max_players
+        self.max_rounds = max_rounds
+        self.name_capacity = name_capacity
+        self.width = max_rounds + 1
+        self.ranks = _align(_HEADER_SIZE)
+        self.scores = _align(self.ranks + 4 * max_players)
+        self.name_index = _align(self.scores + 2 * max_players * self.width)
+        self.names = self.name_index + 8 * max_players
+        self.size = self.names + name_capacity
+
+
+class _Views:
+    """Typed memoryviews over a block's regions."""
+
+    def __init__(self, buf: memoryview, layout: _Layout):
+        self.buf = buf
+        self.ranks = buf[layout.ranks:layout.scores].cast("i")[:layout.max_players]
+        self.scores = buf[layout.scores:layout.name_index].cast("h")[
+            :layout.max_players * layout.width
+        ]
+        self.name_index = buf[layout.name_index:layout.names].cast("i")
+        self.names = buf[layout.names:layout.size]
+
+    def release(self) -> None:
+        for view in (self.ranks, self.scores, self.name_index, self.names):
+            view.release()
+
+
+class SharedScoreboard(Scoreboard):
+    """Scoreboard whose state is published to a shared memory block.
+
+    Capacities are fixed when the block is created: player ids must be
+    below max_players, rounds at most max_rounds, and all names together
+    must fit in name_capacity bytes of UTF-8.
+    """
+
+    def __init__(
+        self,
+        max_players: int,
+        max_rounds: int = RoundProgression.MAX_ROUND,
+        name_capacity: Optional[int] = None,
+        name: Optional[str] = None,
+        stats: Optional[StatsTracker] = None,
+        bus: Optional[EventBus] = None,
+        registry: Optional[PlayerRegistry] = None,
+        histogram: Optional[ScoreHistogram] = None,
+    ):
+        """Initialize the scoreboard and create its shared memory block.
+
+        Args:
+            max_players: Number of player id slots in the block.
+            max_rounds: Highest round number that can be recorded.
+            name_capacity: Bytes reserved for player names; defaults to
+                32 per player.
+            name: Name for the block; a unique one is chosen by default.
+            stats: Optional statistics tracker, as for Scoreboard.
+            bus: Optional event bus, as for Scoreboard.
+            registry: Registry assigning player ids, as for Scoreboard.
+            histogram: Optional score histogram, as for Scoreboard.
+        """
+        if max_players < 1 or max_rounds < 1:
+            raise ValueError("max_players and max_rounds must be at least 1")
+        if name_capacity is None:
+            name_capacity = 32 * max_players
+        self._layout = _Layout(max_players, max_rounds, name_capacity)
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=self._layout.size)
+        self._views = _Views(self._shm.buf, self._layout)
+        self._dirty: Set[int] = set()
+        self._names_synced = 0  # player slots whose names are in the block
+        self._names_used = 0
+        self._cleared = True  # the block's tables still need initializing
+        super().__init__(stats=stats, bus=bus, registry=registry, histogram=histogram)
+        self._sync()
+
+    @property
+    def name(self) -> str:
+        """Get the shared memory block's name, for attaching readers."""
+        return self._shm.name
+
+    def close(self) -> None:
+        """Detach from the block; further writes are no longer published."""
+        if self._shm is not None:
+            self._views.release()
+            self._shm.close()
+            self._shm = None
+
+    def unlink(self) -> None:
+        """Detach from the block and destroy it."""
+        shm = self._shm
+        self.close()
+        if shm is not None:
+            shm.unlink()
+
+    def __enter__(self) -> "SharedScoreboard":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
+
+    def __getstate__(self) -> dict:
+        # The block belongs to this process; an unpickled copy is a plain,
+        # unpublished board.
+        state = super().__getstate__()
+        for key in ("_shm", "_views", "_layout"):
+            state[key] = None
+        state["_dirty"] = set()
+        return state
+
+    def _add_players(self, player_names: Sequence[str]) -> None:
+        # Raises ValueError if the block has no room for a player's id or
+        # name, before any player is added.
+        if self._shm is not None:
+            next_id = len(self.registry)
+            names_used = self._names_used
+            for player_name in player_names:
+                player_id = self.registry._ids.get(player_name)
+                if player_id is None:
+                    player_id, next_id = next_id, next_id + 1
+                if player_id >= self._layout.max_players:
+                    raise ValueError(
+                        f"Player id {player_id} exceeds shared capacity of "
+                        f"{self._layout.max_players} players"
+                    )
+                names_used += len(player_name.encode())
+                if names_used > self._layout.name_capacity:
+                    raise ValueError("Shared name table is full")
+        super()._add_players(player_names)
+
+    def _validate_score(
+        self, player: PlayerRef, round_num: int, score: int
+    ) -> Tuple[int, PlayerScore]:
+        resolved = super()._validate_score(player, round_num, score)
+        if self._layout is not None and round_num > self._layout.max_rounds:
+            raise ValueError(
+                f"Round {round_num} exceeds shared capacity of {self._layout.max_rounds} rounds"
+            )
+        return resolved
+
+    def _clear(self) -> None:
+        super()._clear()
+        self._names_synced = 0
+        self._names_used = 0
+        self._dirty.clear()
+        self._cleared = True
+
+    def _changed(self) -> None:
+        # The players written since the last snapshot are its stale rows.
+        self._dirty.update(self._stale)
+        super()._changed()
+        self._sync()
+
+    def _sync(self) -> None:
+        """Publish changed state to the block (writer lock held)."""
+        if self._shm is None:
+            return
+        buf, views, layout = self._shm.buf, self._views, self._layout
+        seq = _SEQ.unpack_from(buf, 0)[0] + 1
+        _SEQ.pack_into(buf, 0, seq)  # odd: write in progress
+
+        try:
+            if self._cleared:
+                views.ranks[:] = array("i", [0]) * len(views.ranks)
+                views.scores[:] = array("h", [_UNPLAYED]) * len(views.scores)
+                self._cleared = False
+
+            by_id = self._by_id
+            dirty = self._dirty
+            for player_id in range(self._names_synced, len(by_id)):
+                player = by_id[player_id]
+                if player is not None:
+                    encoded = player.name.encode()
+                    end = self._names_used + len(encoded)
+                    views.names[self._names_used:end] = encoded
+                    views.name_index[2 * player_id:2 * player_id + 2] = array(
+                        "i", [self._names_used, len(encoded)]
+                    )
+                    self._names_used = end
+                    dirty.add(player_id)
+            self._names_synced = len(by_id)
+
+            if dirty:
+                width = layout.width
+                for player_id in dirty:
+                    row = by_id[player_id]._scores
+                    start = player_id * width
+                    views.scores[start:start + len(row)] = memoryview(row)
+                    views.scores[start + len(row):start + width] = (
+                        array("h", [_UNPLAYED]) * (width - len(row))
+                    )
+                dirty.clear()
+                # Same order as Scoreboard.snapshot(): by total, ties by id.
+                ordered = [player_id for player_id, player in enumerate(by_id) if player is not None]
+                ordered.sort(key=lambda player_id: by_id[player_id]._scores[0], reverse=True)
+                for rank, player_id in enumerate(ordered, 1):
+                    views.ranks[player_id] = rank
+
+            _HEADER.pack_into(
+                buf, _SEQ.size,
+                self.version, layout.max_players, layout.max_rounds,
+                layout.name_capacity, self._player_count, self.current_round,
+                self.total_rounds, _PHASE_INDEX[self.current_phase], self._names_used,
+            )
+        except BaseException:
+            # The block may be half written: republish all of it next time.
+            self._cleared = True
+            self._names_synced = 0
+            self._names_used = 0
+            raise
+        finally:
+            _SEQ.pack_into(buf, 0, seq + 1)  # even: no write in progress
+
+
+class SharedScoreboardReader:
+    """Read-only, zero-copy access to a SharedScoreboard's block.
+
+    Has the snapshot() method ScoreboardRenderer needs, so a renderer can
+    be built directly on a reader.
+    """
+
+    def __init__(self, name: str, timeout: float = 1.0):
+        """Attach to a block by name.
+
+        Before Python 3.13 an attached block is registered with the
+        process's resource tracker, which destroys it when the tracker
+        exits; attach from processes started with multiprocessing by the
+        writer's process, which share its tracker.
+
+        Args:
+            name: The SharedScoreboard's name.
+            timeout: Seconds a read may keep retrying while the block is
+                mid-write before giving up.
+        """
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13
+            self._shm = shared_memory.SharedMemory(name=name)
+        buf = self._shm.buf
+        _, max_players, max_rounds, name_capacity = _HEADER.unpack_from(buf, _SEQ.size)[:4]
+        self._layout = _Layout(max_players, max_rounds, name_capacity)
+        self._views = _Views(buf, self._layout)
+        self._snapshot: Optional[ScoreboardSnapshot] = None
+        self.timeout = timeout
+
+    def close(self) -> None:
+        """Detach from the block."""
+        if self._shm is not None:
+            self._views.release()
+            self._shm.close()
+            self._shm = None
+
+    def __enter__(self) -> "SharedScoreboardReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def version(self) -> int:
+        """Get the version last published by the writer."""
+        return self.read(lambda reader: _HEADER.unpack_from(reader._shm.buf, _SEQ.size)[0])
+
+    def read(self, fn: Callable[["SharedScoreboardReader"], T]) -> T:
+        """Run a read-only function against a consistent state of the block.
+
+        fn may use total(), round_score(), rank(), name() and scores() on
+        the reader; it is retried if a write overlapped it, so it must not
+        have side effects. Values it keeps must be copied out, not left as
+        memoryviews.
+
+        Raises:
+            TimeoutError: If no consistent state was seen within the
+                reader's timeout, e.g. because the writer died mid-write.
+        """
+        buf = self._shm.buf
+        deadline = time.monotonic() + self.timeout
+        while True:
+            start = _SEQ.unpack_from(buf, 0)[0]
+            if not start & 1:
+                result = fn(self)
+                if _SEQ.unpack_from(buf, 0)[0] == start:
+                    return result
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Shared scoreboard {self._shm.name} stayed mid-write for {self.timeout}s"
+                )
+            time.sleep(0)
+
+    def scores(self, player_id: int) -> memoryview:
+        """Get a player's score row in place: slot 0 total, slot N round N."""
+        width = self._layout.width
+        return self._views.scores[player_id * width:(player_id + 1) * width]
+
+    def total(self, player_id: int) -> int:
+        """Get a player's total score."""
+        return self._views.scores[player_id * self._layout.width]
+
+    def round_score(self, player_id: int, round_num: int) -> Optional[int]:
+        """Get a player's score for a round, or None if unplayed."""
+        score = self._views.scores[player_id * self._layout.width + round_num]
+        return None if score == _UNPLAYED else score
+
+    def rank(self, player_id: int) -> int:
+        """Get a player's rank (1 = highest), or 0 for an empty slot."""
+        return self._views.ranks[player_id]
+
+    def name(self, player_id: int) -> str:
+        """Get a player's name."""
+        offset, length = self._views.name_index[2 * player_id:2 * player_id + 2]
+        return bytes(self._views.names[offset:offset + length]).decode()
+
+    def snapshot(self) -> ScoreboardSnapshot:
+        """Get a consistent snapshot, rebuilt only when the version changes."""
+        version = self.version
+        if self._snapshot is None or self._snapshot.version != version:
+            self._snapshot = self.read(SharedScoreboardReader._build_snapshot)
+        return self._snapshot
+
+    def _build_snapshot(self) -> ScoreboardSnapshot:
+        (version, max_players, _, _, _, current_round, total_rounds,
+         phase, _) = _HEADER.unpack_from(self._shm.buf, _SEQ.size)
+        ranks = self._views.ranks
+        ordered = sorted(
+            (ranks[player_id], player_id) for player_id in range(max_players) if ranks[player_id]
+        )
+        rows = []
+        rounds = set()
+        for rank, player_id in ordered:
+            row = StandingRow(self.name(player_id), array("h", self.scores(player_id)), rank)
+            rounds.update(round_num for round_num, _ in row.round_scores)
+            rows.append(row)
+        return ScoreboardSnapshot(
+            version=version,
+            current_round=current_round,
+            total_rounds=total_rounds,
+            current_phase=_PHASES[phase],
+            rounds=tuple(sorted(rounds)),
+            standings=tuple(rows),
+        )
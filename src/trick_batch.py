@@ -0,0 +1,152 @@
+"""Vectorized round simulation with NumPy.
+
+Plays many independent rounds at once under the random policy: every
+round's deal, legal-move filtering and trick resolution is an array
+operation across all rounds, one card position at a time, instead of a
+Python loop per round. Cards use the trick_engine encoding, and each
+trick is resolved by ranking every card played to it and taking the
+first card of the highest rank, which reproduces trick_engine's
+precedence rules.
+
+Rounds played under any other policy go through
+trick_engine.play_rounds, which calls the policy card by card.
+
+Usage:
+    tricks = play_rounds(100_000, num_players=4, round_num=7, rng=np.random.default_rng())
+    tricks[i]  # tricks taken per seat in round i
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from src.trick_engine import DECK_SIZE, ESCAPE, MERMAID, PIRATE, RANKS, SKULL_KING, TRUMP_SUIT
+
+# Stands in for a card that has already been played.
+_PLAYED = DECK_SIZE
+
+# Lead-suit states besides a suit index: no card has set the suit yet
+# (only escapes so far), or a character card came first so none is led.
+_UNSET = -1
+_NO_SUIT = -2
+
+_CARDS = np.arange(DECK_SIZE + 1)
+# Suit per card, -1 for special cards and -2 for the played marker.
+_SUIT = np.where(_CARDS < ESCAPE, _CARDS // RANKS, -1)
+_SUIT[_PLAYED] = -2
+_RANK = np.where(_CARDS < ESCAPE, _CARDS % RANKS + 1, 0)
+_IS_PIRATE = (_CARDS >= PIRATE) & (_CARDS < MERMAID)
+_IS_MERMAID = (_CARDS >= MERMAID) & (_CARDS < SKULL_KING)
+_IS_CHARACTER = (_CARDS >= PIRATE) & (_CARDS < _PLAYED)
+
+# Card ranks within a trick; the first card of the highest rank wins.
+_SUITED = 100  # plus the card's rank, for cards of the suit led
+_TRUMP = 200  # plus the card's rank
+_MERMAID = 300
+_PIRATE = 400
+_SKULL_KING = 500
+_MERMAID_OVER_KING = 600
+
+
+def deal(
+    count: int, num_players: int, round_num: int, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Deal round_num cards to each player for many rounds.
+
+    Returns:
+        Array of cards with shape (count, num_players, round_num).
+
+    Raises:
+        ValueError: If the deck is too small for the deal.
+    """
+    needed = num_players * round_num
+    if needed > DECK_SIZE:
+        raise ValueError(
+            f"Cannot deal {round_num} cards to {num_players} players from {DECK_SIZE} cards"
+        )
+    rng = rng or np.random.default_rng()
+    cards = rng.random((count, DECK_SIZE)).argsort(axis=1)[:, :needed]
+    return cards.reshape(count, num_players, round_num)
+
+
+def trick_winners(tricks: np.ndarray) -> np.ndarray:
+    """Get the position in play order of the winning card of each trick.
+
+    Args:
+        tricks: Cards with shape (count, num_players), in play order.
+
+    Returns:
+        Winning positions with shape (count,).
+    """
+    lead = np.full(len(tricks), _UNSET)
+    for position in range(tricks.shape[1]):
+        lead = _follow(lead, tricks[:, position])
+    return _winners(tricks, lead)
+
+
+def play_rounds(
+    count: int,
+    num_players: int,
+    round_num: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Deal and play out many independent rounds with random legal play.
+
+    Args:
+        count: Number of rounds to simulate.
+        num_players: Seats per round.
+        round_num: Round number, which is also the number of tricks.
+        rng: Random source for dealing and play.
+
+    Returns:
+        Tricks taken per seat, with shape (count, num_players); the lead
+        rotates with the round number as it does at the table.
+    """
+    rng = rng or np.random.default_rng()
+    hands = deal(count, num_players, round_num, rng)
+    rounds = np.arange(count)
+    leader = np.full(count, (round_num - 1) % num_players)
+    taken = np.zeros((count, num_players), dtype=np.int64)
+    for _ in range(round_num):
+        trick = np.empty((count, num_players), dtype=np.int64)
+        lead = np.full(count, _UNSET)
+        for position in range(num_players):
+            seat = (leader + position) % num_players
+            hand = hands[rounds, seat]
+            suits = _SUIT[hand]
+            # Follow the suit led if the hand holds it; specials are always legal.
+            holds_lead = ((suits == lead[:, None]) & (lead[:, None] >= 0)).any(axis=1)
+            legal = (hand != _PLAYED) & (
+                ~holds_lead[:, None] | (suits == lead[:, None]) | (suits == -1)
+            )
+            choice = np.where(legal, rng.random(hand.shape), -1.0).argmax(axis=1)
+            card = hand[rounds, choice]
+            hands[rounds, seat, choice] = _PLAYED
+            trick[:, position] = card
+            lead = _follow(lead, card)
+        leader = (leader + _winners(trick, lead)) % num_players
+        taken[rounds, leader] += 1
+    return taken
+
+
+def _follow(lead: np.ndarray, card: np.ndarray) -> np.ndarray:
+    """Update the lead-suit state of each trick after one more card."""
+    suit = _SUIT[card]
+    lead = np.where((lead == _UNSET) & (suit >= 0), suit, lead)
+    return np.where((lead == _UNSET) & _IS_CHARACTER[card], _NO_SUIT, lead)
+
+
+def _winners(tricks: np.ndarray, lead: np.ndarray) -> np.ndarray:
+    """Get the winning position of each trick, given its final lead suit."""
+    suits = _SUIT[tricks]
+    led = (suits == lead[:, None]) & (lead[:, None] >= 0)
+    strength = np.where(led, _SUITED + _RANK[tricks], 0)
+    strength = np.where(suits == TRUMP_SUIT, _TRUMP + _RANK[tricks], strength)
+    strength = np.where(
+        _IS_MERMAID[tricks],
+        np.where((tricks == SKULL_KING).any(axis=1, keepdims=True), _MERMAID_OVER_KING, _MERMAID),
+        strength,
+    )
+    strength = np.where(_IS_PIRATE[tricks], _PIRATE, strength)
+    strength = np.where(tricks == SKULL_KING, _SKULL_KING, strength)
+    return strength.argmax(axis=1)
@@ -0,0 +1,219 @@
+"""Trick-play engine for simulating rounds.
+
+Cards are integers 0-68 and a hand is an int bitmask with bit n set for
+card n, so following suit, legal-move filtering and trick resolution are
+a few bitwise operations:
+
+    0-55   suited cards, 14 per suit: suit * 14 + (rank - 1), with
+           black (index 3) the trump suit
+    56-60  escapes
+    61-65  pirates
+    66-67  mermaids
+    68     Skull King
+
+A trick is won by the Skull King, unless a mermaid was also played, when
+the first mermaid wins; otherwise by the first pirate, then the first
+mermaid, then the highest trump, then the highest card of the suit led.
+If only escapes were played, the first one wins. Players must follow the
+suit led when they can; special cards may always be played. The Tigress
+and other optional cards are not included.
+
+The trick counts from play_round() are indexed by seat, like the bids in
+a BidCollector, and can be passed straight to RoundPipeline.complete_round.
+Large batches of rounds under the random policy are faster through
+trick_batch.play_rounds, which plays them as NumPy arrays.
+
+Usage:
+    hands = deal(num_players=4, round_num=7, rng=rng)
+    tricks = play_round(hands, rng=rng)
+"""
+
+import random
+from typing import Callable, List, Optional, Sequence
+
+SUITS = ("green", "yellow", "purple", "black")
+RANKS = 14
+TRUMP_SUIT = 3
+
+ESCAPE = len(SUITS) * RANKS  # first escape
+PIRATE = ESCAPE + 5  # first pirate
+MERMAID = PIRATE + 5  # first mermaid
+SKULL_KING = MERMAID + 2
+DECK_SIZE = SKULL_KING + 1
+
+BIT = tuple(1 << card for card in range(DECK_SIZE))
+SUIT_MASKS = tuple(((1 << RANKS) - 1) << (suit * RANKS) for suit in range(len(SUITS)))
+TRUMP_MASK = SUIT_MASKS[TRUMP_SUIT]
+ESCAPE_MASK = ((1 << 5) - 1) << ESCAPE
+PIRATE_MASK = ((1 << 5) - 1) << PIRATE
+MERMAID_MASK = ((1 << 2) - 1) << MERMAID
+SKULL_KING_MASK = BIT[SKULL_KING]
+SPECIAL_MASK = ESCAPE_MASK | PIRATE_MASK | MERMAID_MASK | SKULL_KING_MASK
+FULL_DECK = (1 << DECK_SIZE) - 1
+
+# Suit of each card, or None for special cards.
+CARD_SUIT = tuple(card // RANKS if card < ESCAPE else None for card in range(DECK_SIZE))
+
+# Chooses a card from the legal moves, given the cards already in the trick.
+Policy = Callable[[int, Sequence[int], random.Random], int]
+
+
+def card_name(card: int) -> str:
+    """Get a readable name for a card, e.g. "black 14" or "pirate"."""
+    if card < ESCAPE:
+        return f"{SUITS[card // RANKS]} {card % RANKS + 1}"
+    if card < PIRATE:
+        return "escape"
+    if card < MERMAID:
+        return "pirate"
+    if card < SKULL_KING:
+        return "mermaid"
+    return "skull king"
+
+
+def cards_in(mask: int) -> List[int]:
+    """List the cards in a bitmask, lowest first."""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(low.bit_length() - 1)
+        mask ^= low
+    return cards
+
+
+def deal(num_players: int, round_num: int, rng: Optional[random.Random] = None) -> List[int]:
+    """Deal round_num cards to each player from a shuffled deck.
+
+    Returns:
+        One hand bitmask per seat.
+
+    Raises:
+        ValueError: If the deck is too small for the deal.
+    """
+    needed = num_players * round_num
+    if needed > DECK_SIZE:
+        raise ValueError(
+            f"Cannot deal {round_num} cards to {num_players} players from {DECK_SIZE} cards"
+        )
+    cards = (rng or random).sample(range(DECK_SIZE), needed)
+    hands = []
+    for seat in range(num_players):
+        hand = 0
+        for card in cards[seat * round_num:(seat + 1) * round_num]:
+            hand |= BIT[card]
+        hands.append(hand)
+    return hands
+
+
+def lead_suit(trick: Sequence[int]) -> Optional[int]:
+    """Get the suit led: that of the first suited card, unless a pirate,
+    mermaid or the Skull King came before it (then no suit is led)."""
+    for card in trick:
+        if card < ESCAPE:
+            return CARD_SUIT[card]
+        if card >= PIRATE:
+            return None
+    return None
+
+
+def legal_moves(hand: int, trick: Sequence[int]) -> int:
+    """Get the bitmask of cards in a hand that may be played to a trick."""
+    suit = lead_suit(trick)
+    if suit is not None and hand & SUIT_MASKS[suit]:
+        return hand & (SUIT_MASKS[suit] | SPECIAL_MASK)
+    return hand
+
+
+def trick_winner(trick: Sequence[int]) -> int:
+    """Get the position in play order of the card that wins a trick."""
+    played = 0
+    for card in trick:
+        played |= BIT[card]
+
+    if played & SKULL_KING_MASK:
+        winning = played & MERMAID_MASK or SKULL_KING_MASK
+    elif played & PIRATE_MASK:
+        winning = PIRATE_MASK
+    elif played & MERMAID_MASK:
+        winning = MERMAID_MASK
+    else:
+        winning = 0
+    if winning:
+        for position, card in enumerate(trick):
+            if BIT[card] & winning:
+                return position
+
+    candidates = played & TRUMP_MASK
+    if not candidates:
+        suit = lead_suit(trick)
+        if suit is None:
+            return 0  # only escapes
+        candidates = played & SUIT_MASKS[suit]
+    return trick.index(candidates.bit_length() - 1)
+
+
+def random_policy(legal: int, trick: Sequence[int], rng: random.Random) -> int:
+    """Play a uniformly random legal card."""
+    return rng.choice(cards_in(legal))
+
+
+def play_round(
+    hands: Sequence[int],
+    leader: int = 0,
+    policy: Policy = random_policy,
+    rng: Optional[random.Random] = None,
+) -> List[int]:
+    """Play out every trick of a round.
+
+    Args:
+        hands: Hand bitmask per seat, all the same size.
+        leader: Seat that leads the first trick; each trick's winner
+            leads the next.
+        policy: Chooses each card from the legal moves.
+        rng: Random source passed to the policy.
+
+    Returns:
+        Tricks taken per seat.
+    """
+    rng = rng or random.Random()
+    hands = list(hands)
+    num_players = len(hands)
+    tricks = [0] * num_players
+    for _ in range(bin(hands[0]).count("1")):
+        trick: List[int] = []
+        for offset in range(num_players):
+            seat = (leader + offset) % num_players
+            card = policy(legal_moves(hands[seat], trick), trick, rng)
+            hands[seat] ^= BIT[card]
+            trick.append(card)
+        leader = (leader + trick_winner(trick)) % num_players
+        tricks[leader] += 1
+    return tricks
+
+
+def play_rounds(
+    count: int,
+    num_players: int,
+    round_num: int,
+    policy: Policy = random_policy,
+    rng: Optional[random.Random] = None,
+) -> List[List[int]]:
+    """Deal and play out many independent rounds.
+
+    Args:
+        count: Number of rounds to simulate.
+        num_players: Seats per round.
+        round_num: Round number, which is also the number of tricks.
+        policy: Chooses each card from the legal moves.
+        rng: Random source for dealing and the policy.
+
+    Returns:
+        Tricks taken per seat for each round; the lead rotates with the
+        round number as it does at the table.
+    """
+    rng = rng or random.Random()
+    leader = (round_num - 1) % num_players
+    return [
+        play_round(deal(num_players, round_num, rng), leader, policy, rng)
+        for _ in range(count)
+    ]
@@ -271,3 +271,82 @@ class TestMultipleRounds:
         collector.start_round(5)
         collector.collect_bid(0, 5)  # Should not raise
         assert collector.bids[0] == 5
+
+
+class TestReset:
+    """Test resetting a collector for reuse."""
+
+    def test_reset_clears_round_and_bids(self):
+        """Test that reset returns to the initial state."""
+        collector = BidCollector(2)
+        collector.start_round(3)
+        collector.collect_bid(0, 1)
+        version = collector.version
+
+        collector.reset(4)
+        assert collector.num_players == 4
+        assert collector.current_round == 0
+        assert collector.bids == {}
+        assert collector.version > version
+        with pytest.raises(RuntimeError):
+            collector.collect_bid(0, 0)
+
+
+class TestHistory:
+    """Test the retained bid and trick history."""
+
+    @pytest.fixture
+    def collector(self):
+        """Provide a three-player collector with two rounds of bids."""
+        collector = BidCollector(3)
+        collector.start_round(1)
+        collector.collect_bids({0: 1, 1: 0, 2: 1})
+        collector.record_tricks([1, 0, 0])
+        collector.start_round(2)
+        collector.collect_bids({0: 2, 2: 1})
+        return collector
+
+    def test_bid_series(self, collector):
+        """Test per-player bid series, including the round in progress."""
+        assert collector.bid_history(0) == [1, 2]
+        assert collector.bid_history(1) == [0, None]
+        assert collector.history_rounds == 2
+
+    def test_trick_series(self, collector):
+        """Test per-player trick series."""
+        assert collector.trick_history(0) == [1, None]
+        collector.record_tricks([1, 1, 0])
+        assert collector.trick_history(1) == [0, 1]
+
+    def test_bid_totals_against_hands(self, collector):
+        """Test over- and under-bid balances."""
+        assert collector.bid_total(1) == 2
+        assert collector.bid_balance(1) == 1  # overbid
+        assert collector.bid_balance(2) == 1
+        collector.start_round(3)
+        collector.collect_bid(0, 0)
+        assert collector.bid_balance(3) == -3  # underbid
+        with pytest.raises(ValueError, match="No bids recorded"):
+            collector.bid_total(4)
+
+    def test_export_buffers(self, collector):
+        """Test the contiguous (rounds, players) export."""
+        history = collector.export_history()
+        assert history["bids"].shape == (2, 3)
+        assert history["bids"].tolist() == [[1, 0, 1], [2, -1, 1]]
+        assert history["tricks"].tolist() == [[1, 0, 0], [-1, -1, -1]]
+        assert history["bids"].readonly
+        collector.start_round(3)  # exported copies don't pin the history
+
+    def test_record_tricks_validation(self, collector):
+        """Test invalid trick counts."""
+        with pytest.raises(ValueError, match="Expected trick counts for 3"):
+            collector.record_tricks([1, 1])
+        with pytest.raises(ValueError, match="cannot be negative"):
+            collector.record_tricks([2, -1, 1])
+
+    def test_reset_clears_history(self, collector):
+        """Test that reset drops the history."""
+        collector.reset(2)
+        assert collector.history_rounds == 0
+        assert collector.export_history()["bids"].tolist() == []
@@ -0,0 +1,111 @@
+"""Tests for the parallel bulk export."""
+
+import json
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from src import bulk_export
+from src.bulk_export import export_reports
+from src.scoreboard import Scoreboard, ScoreboardSnapshot
+
+
+def make_board(table):
+    """Build a small finished scoreboard."""
+    scoreboard = Scoreboard()
+    for seat in range(3):
+        scoreboard.add_player(f"{table}-p{seat}")
+    scoreboard.set_round(2, 2)
+    for seat in range(3):
+        scoreboard.record_round_score(f"{table}-p{seat}", 1, 10 * seat)
+        scoreboard.record_round_score(f"{table}-p{seat}", 2, 20)
+    return scoreboard
+
+
+@pytest.fixture
+def boards():
+    """Provide eight tables keyed by id."""
+    return {f"table-{i}": make_board(f"t{i}") for i in range(8)}
+
+
+class TestExportReports:
+    """Test exporting reports."""
+
+    def test_files_match_display_output(self, boards, tmp_path):
+        """Test that each table's file holds its game status report."""
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            summary = export_reports(list(boards.items()), str(tmp_path), executor=pool)
+
+        assert summary.exported == 8
+        for table_id, board in boards.items():
+            with open(tmp_path / f"{table_id}.txt") as handle:
+                assert handle.read() == board.display_game_status()
+
+    def test_archive_and_progress(self, boards, tmp_path):
+        """Test streaming JSON reports into one archive with progress."""
+        calls = []
+        path = tmp_path / "reports.zip"
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            export_reports(
+                list(boards.items()), str(path), fmt="json", archive=True,
+                max_in_flight=2, executor=pool,
+                progress=lambda done, total: calls.append((done, total)),
+            )
+
+        with zipfile.ZipFile(path) as archive:
+            assert sorted(archive.namelist()) == sorted(f"{t}.json" for t in boards)
+            document = json.loads(archive.read("table-0.json"))
+        assert document["standings"]["standings"][0]["name"] == "t0-p2"
+        assert calls[-1] == (8, 8)
+
+    def test_workers_receive_snapshots(self, boards, tmp_path):
+        """Test that tasks carry immutable snapshots, not live boards."""
+        sent = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args):
+                sent.append(args[0])
+                return super().submit(fn, *args)
+
+        with RecordingExecutor(max_workers=2) as pool:
+            export_reports(list(boards.items()), str(tmp_path), executor=pool)
+        assert len(sent) == 8
+        assert all(isinstance(snapshot, ScoreboardSnapshot) for snapshot in sent)
+
+    def test_lazy_input_has_unknown_total(self, boards, tmp_path):
+        """Test that generator input reports progress without a total."""
+        calls = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            export_reports(
+                (item for item in boards.items()), str(tmp_path), executor=pool,
+                progress=lambda done, total: calls.append(total),
+            )
+        assert set(calls) == {None}
+        assert len(os.listdir(tmp_path)) == 8
+
+    def test_table_ids_sanitized(self, tmp_path):
+        """Test that table ids cannot escape the destination directory."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            export_reports([("../evil/1", make_board("x"))], str(tmp_path), executor=pool)
+        assert os.listdir(tmp_path) == ["_evil_1.txt"]
+
+    def test_duplicate_names_rejected(self, tmp_path):
+        """Test that ids mapping to the same file name raise ValueError."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with pytest.raises(ValueError, match="Duplicate table id"):
+                export_reports(
+                    [("a/b", make_board("x")), ("a_b", make_board("y"))],
+                    str(tmp_path), executor=pool,
+                )
+
+    def test_unknown_format(self, tmp_path):
+        """Test that an unknown format raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown format"):
+            export_reports([], str(tmp_path), fmt="pdf")
+
+    def test_invalid_max_in_flight_creates_no_pool(self, tmp_path, monkeypatch):
+        """Test that max_in_flight is validated before a pool is started."""
+        monkeypatch.setattr(bulk_export, "ProcessPoolExecutor", pytest.fail)
+        with pytest.raises(ValueError, match="max_in_flight"):
+            export_reports([], str(tmp_path), max_in_flight=0)
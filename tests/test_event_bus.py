@@ -0,0 +1,229 @@
+"""Tests for the change-notification bus."""
+
+import threading
+
+import pytest
+from src.event_bus import EventBus
+from src.round_progression import RoundProgression, GamePhase
+from src.scoreboard import Scoreboard
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a manually advanced clock."""
+    return FakeClock()
+
+
+class TestCoalescing:
+    """Test per-subscriber coalescing."""
+
+    def test_zero_window_delivers_each_event(self, clock):
+        """Test that a zero window delivers every event immediately."""
+        bus = EventBus(clock=clock, scheduler=None)
+        received = []
+        bus.subscribe(received.append)
+
+        bus.publish("scoreboard", "set_phase")
+        bus.publish("scoreboard", "set_phase")
+
+        assert len(received) == 2
+
+    def test_burst_coalesced_into_one_notification(self, clock):
+        """Test that a burst of score writes produces one notification."""
+        bus = EventBus(clock=clock, scheduler=None)
+        received = []
+        bus.subscribe(received.append, window=0.05)
+        scoreboard = Scoreboard(bus=bus)
+        scoreboard.add_player("Alice")
+
+        for round_num in range(1, 9):
+            scoreboard.record_round_score("Alice", round_num, 20)
+        assert received == []
+
+        clock.now = 0.05
+        assert bus.deliver_due() == 1
+        assert len(received) == 1
+        assert len(received[0].events) == 9
+        assert received[0].events[-1].kind == "record_round_score"
+
+    def test_windows_are_per_subscriber(self, clock):
+        """Test that each subscriber uses its own window."""
+        bus = EventBus(clock=clock, scheduler=None)
+        fast, slow = [], []
+        bus.subscribe(fast.append)
+        bus.subscribe(slow.append, window=1.0)
+
+        bus.publish("scoreboard", "add_player")
+        assert len(fast) == 1
+        assert slow == []
+
+        bus.flush()
+        assert len(slow) == 1
+
+    def test_event_buffer_keeps_latest(self, clock):
+        """Test that a full window buffer drops the oldest events."""
+        bus = EventBus(clock=clock, scheduler=None)
+        received = []
+        bus.subscribe(received.append, window=1.0, max_events=2)
+        for i in range(5):
+            bus.publish("scoreboard", "record_round_score", score=i)
+        bus.flush()
+
+        notification = received[0]
+        assert [e.payload["score"] for e in notification.events] == [3, 4]
+        assert notification.dropped == 3
+
+
+class TestTimedDelivery:
+    """Test delivery when a window closes without further publishes."""
+
+    def test_window_pushed_by_scheduler(self, clock):
+        """Test that the last burst of a round is pushed when its window closes."""
+        scheduled = []
+        bus = EventBus(clock=clock, scheduler=lambda delay, fn: scheduled.append((delay, fn)))
+        received = []
+        bus.subscribe(received.append, window=0.05)
+        scoreboard = Scoreboard(bus=bus)
+        scoreboard.add_player("Alice")
+        for round_num in range(1, 9):
+            scoreboard.record_round_score("Alice", round_num, 20)
+
+        assert [delay for delay, _ in scheduled] == [0.05]  # one timer per window
+        clock.now = 0.05
+        scheduled.pop()[1]()
+        assert len(received) == 1
+        assert len(received[0].events) == 9
+
+    def test_early_timer_rearms_for_the_rest_of_the_window(self, clock):
+        """Test that a timer firing before the window closes waits out the rest."""
+        scheduled = []
+        bus = EventBus(clock=clock, scheduler=lambda delay, fn: scheduled.append((delay, fn)))
+        received = []
+        bus.subscribe(received.append, window=1.0)
+        bus.publish("scoreboard", "set_phase")
+
+        clock.now = 0.75
+        scheduled.pop()[1]()
+        assert received == []
+        assert [delay for delay, _ in scheduled] == [0.25]
+
+    def test_default_timer_delivers(self):
+        """Test that the default timer thread delivers a closed window."""
+        bus = EventBus()
+        delivered = threading.Event()
+        bus.subscribe(lambda notification: delivered.set(), window=0.01)
+        bus.publish("scoreboard", "set_phase")
+        assert delivered.wait(5)
+
+
+class TestQueuedSubscribers:
+    """Test subscribers that consume through drain()."""
+
+    def test_bounded_queue_drops_to_latest(self, clock):
+        """Test that a slow consumer only keeps the newest notifications."""
+        bus = EventBus(clock=clock, scheduler=None)
+        subscription = bus.subscribe(max_pending=2)
+        for i in range(4):
+            bus.publish("scoreboard", "set_round", round_num=i)
+
+        notifications = subscription.drain()
+        assert [n.events[0].payload["round_num"] for n in notifications] == [2, 3]
+        assert subscription.dropped_notifications == 2
+        assert subscription.drain() == []
+
+    def test_cancel_stops_delivery(self, clock):
+        """Test that a cancelled subscription receives nothing."""
+        bus = EventBus(clock=clock, scheduler=None)
+        subscription = bus.subscribe()
+        subscription.cancel()
+        bus.publish("scoreboard", "set_phase")
+        assert subscription.drain() == []
+
+    def test_deferred_publishes_held_until_exit(self, clock):
+        """Test that deferred() delivers a block's events together at the end."""
+        bus = EventBus(clock=clock, scheduler=None)
+        received = []
+        bus.subscribe(received.append)
+        with bus.deferred():
+            bus.publish("scoreboard", "set_round")
+            with bus.deferred():
+                bus.publish("scoreboard", "set_phase")
+            assert received == []
+
+        assert len(received) == 1
+        assert [e.kind for e in received[0].events] == ["set_round", "set_phase"]
+
+
+class TestFailingSubscribers:
+    """Test that a raising callback is isolated from the others."""
+
+    def test_later_subscribers_still_notified(self, clock):
+        """Test that one failing callback does not lose other notifications."""
+        errors = []
+        bus = EventBus(clock=clock, scheduler=None, on_error=lambda sub, n, error: errors.append(error))
+
+        def fail(notification):
+            raise RuntimeError("subscriber failed")
+
+        failing = bus.subscribe(fail)
+        received = []
+        bus.subscribe(received.append, window=1.0)
+        bus.publish("scoreboard", "set_phase")
+        bus.flush()
+
+        assert len(received) == 1
+        assert failing.failed_notifications == 1
+        assert isinstance(failing.last_error, RuntimeError)
+        assert errors == [failing.last_error]
+
+    def test_committed_write_does_not_raise(self, clock):
+        """Test that the publisher sees no error from a subscriber."""
+        bus = EventBus(clock=clock, scheduler=None)
+        bus.subscribe(lambda notification: 1 / 0)
+        scoreboard = Scoreboard(bus=bus)
+        scoreboard.add_player("Alice")
+        scoreboard.record_round_score("Alice", 1, 20)
+        assert scoreboard.players["Alice"].total_score == 20
+
+
+class TestPublishers:
+    """Test that game objects publish their changes."""
+
+    def test_round_progression_publishes_phase_changes(self, clock):
+        """Test that advance_phase publishes the new phase."""
+        bus = EventBus(clock=clock, scheduler=None)
+        subscription = bus.subscribe()
+        game = RoundProgression(bus=bus)
+        game.start_round()
+
+        event = subscription.drain()[0].events[0]
+        assert event.source == "round_progression"
+        assert event.payload == {"round": 1, "phase": GamePhase.BIDDING}
+
+    def test_scoreboard_publishes_mutations(self, clock):
+        """Test that every scoreboard mutation is published."""
+        bus = EventBus(clock=clock, scheduler=None)
+        subscription = bus.subscribe(window=1.0)
+        scoreboard = Scoreboard(bus=bus)
+        scoreboard.add_player("Alice")
+        scoreboard.set_round(1, 10)
+        scoreboard.record_round_score("Alice", 1, 20)
+        bus.flush()
+
+        kinds = [e.kind for e in subscription.drain()[0].events]
+        assert kinds == ["add_player", "set_round", "record_round_score"]
+
+    def test_negative_window_rejected(self, clock):
+        """Test that a negative window raises ValueError."""
+        with pytest.raises(ValueError, match="negative"):
+            EventBus(clock=clock, scheduler=None).subscribe(window=-1)
@@ -0,0 +1,94 @@
+"""Tests for the game object pool."""
+
+import pytest
+from src.event_bus import EventBus
+from src.game_pool import GamePool
+from src.player_stats import StatsTracker
+from src.round_pipeline import Game, RoundPipeline
+from src.round_progression import GamePhase as RoundPhase
+from src.scoreboard import GamePhase as BoardPhase
+
+
+def play_first_round(game):
+    """Complete round 1 of a two-player game."""
+    game.progression.start_round()
+    game.collector.start_round(1)
+    game.collector.collect_bids({0: 1, 1: 0})
+    RoundPipeline().complete_round(game, [1, 0])
+
+
+class TestGamePool:
+    """Test acquiring, releasing and reusing games."""
+
+    def test_reused_game_matches_fresh_game(self):
+        """Test that a reset game is indistinguishable from a new one."""
+        pool = GamePool()
+        game = pool.acquire(["Alice", "Bob"])
+        play_first_round(game)
+        pool.release(game)
+
+        reused = pool.acquire(["Carol", "Dan", "Eve"])
+        fresh = Game.create(["Carol", "Dan", "Eve"])
+        assert reused is game
+        assert reused.registry.names == fresh.registry.names
+        assert reused.scoreboard.snapshot().standings == fresh.scoreboard.snapshot().standings
+        assert reused.scoreboard.current_phase == BoardPhase.ROUND
+        assert reused.collector.num_players == 3
+        assert reused.collector.current_round == 0
+        assert reused.collector.bids == {}
+        assert reused.progression.current_round == 1
+        assert reused.progression.current_phase == RoundPhase.SETUP
+        assert pool.reused == 1
+
+    def test_versions_keep_increasing(self):
+        """Test that reuse never repeats a version seen by caches."""
+        pool = GamePool()
+        game = pool.acquire(["Alice", "Bob"])
+        play_first_round(game)
+        board_version, bids_version = game.scoreboard.version, game.collector.version
+        pool.release(game)
+
+        game = pool.acquire(["Alice", "Bob"])
+        assert game.scoreboard.version > board_version
+        assert game.collector.version > bids_version
+
+    def test_reused_game_plays(self):
+        """Test that a reused game can be played from the start."""
+        pool = GamePool()
+        game = pool.acquire(["Alice", "Bob"])
+        play_first_round(game)
+        pool.release(game)
+
+        game = pool.acquire(["Alice", "Bob"])
+        play_first_round(game)
+        assert game.scoreboard.players["Alice"].total_score == 20
+
+    def test_shared_objects_attached_and_detached(self):
+        """Test that stats and bus follow acquire and release."""
+        stats, bus = StatsTracker(), EventBus()
+        pool = GamePool()
+        game = pool.acquire(["Alice", "Bob"], stats=stats, bus=bus)
+        pool.release(game)
+        assert game.scoreboard.stats is None and game.progression.bus is None
+
+        game = pool.acquire(["Alice", "Bob"], stats=stats, bus=bus)
+        assert game.collector.stats is stats
+        assert game.scoreboard.bus is bus
+
+    def test_prewarm_and_bound(self):
+        """Test pre-warming and the idle limit."""
+        pool = GamePool(max_idle=2, prewarm=5)
+        assert len(pool) == 2
+        games = [pool.acquire(["Alice"]) for _ in range(3)]
+        assert pool.created == 3 and pool.reused == 2
+        for game in games:
+            pool.release(game)
+        assert len(pool) == 2
+
+    def test_double_release_rejected(self):
+        """Test that a game cannot be pooled twice."""
+        pool = GamePool()
+        game = pool.acquire(["Alice"])
+        pool.release(game)
+        with pytest.raises(ValueError, match="already in the pool"):
+            pool.release(game)
@@ -0,0 +1,179 @@
+"""Tests for the spilling game store."""
+
+import os
+
+import pytest
+from src.event_bus import EventBus
+from src.game_store import GameStore
+from src.player_stats import StatsTracker
+from src.round_pipeline import Game, RoundPipeline
+from src.round_progression import GamePhase
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a manual clock."""
+    return FakeClock()
+
+
+def play_first_round(game):
+    """Complete round 1 with seat 0 bidding and taking the one trick."""
+    game.progression.start_round()
+    game.collector.start_round(1)
+    game.collector.collect_bids({0: 1, 1: 0})
+    RoundPipeline().complete_round(game, [1, 0])
+
+
+def finish_game(game):
+    """Force a game's progression to completion."""
+    while not game.progression.is_game_complete:
+        game.progression.advance_phase()
+
+
+class TestGameStore:
+    """Test eviction, spilling and faulting back in."""
+
+    def test_spilled_game_round_trips(self, tmp_path):
+        """Test that a spilled game comes back with its state intact."""
+        store = GameStore(str(tmp_path))
+        game = Game.create(["Alice", "Bob"])
+        play_first_round(game)
+        store.put("t1", game)
+
+        assert store.spill("t1")
+        assert store.spilled == 1 and store.resident == 0
+        assert len(os.listdir(tmp_path)) == 1
+
+        loaded = store.get("t1")
+        assert loaded is not game
+        assert loaded.scoreboard.players["Alice"].total_score == 20
+        assert loaded.progression.current_phase == GamePhase.COMPLETE
+        assert loaded.collector.bid_list() == [1, 0]
+        assert os.listdir(tmp_path) == []
+        assert store.loads == 1
+
+    def test_max_resident_evicts_least_recently_used(self, tmp_path):
+        """Test that the least recently used game is spilled first."""
+        store = GameStore(str(tmp_path), max_resident=2)
+        store.put("a", Game.create(["Alice"]))
+        store.put("b", Game.create(["Bob"]))
+        store.get("a")
+        store.put("c", Game.create(["Charlie"]))
+
+        assert store.resident == 2
+        assert store.spilled == 1
+        assert set(store) == {"a", "b", "c"}
+        assert store.get("b").scoreboard.players["Bob"].total_score == 0
+        assert store.resident == 2
+
+    def test_completed_games_evicted_first(self, tmp_path):
+        """Test that finished games are spilled before ones in play."""
+        store = GameStore(str(tmp_path), max_resident=2)
+        store.put("playing", Game.create(["Alice"]))
+        finished = Game.create(["Bob"])
+        finish_game(finished)
+        store.put("finished", finished)
+        store.put("new", Game.create(["Charlie"]))
+
+        assert store.spilled == 1
+        store.get("playing")
+        assert store.loads == 0  # the older, unfinished game stayed resident
+        assert store.spill("finished") is False  # already on disk
+
+    def test_memory_budget(self, tmp_path):
+        """Test that the budget limits the estimated resident bytes."""
+        store = GameStore(str(tmp_path), memory_budget=250, size_of=lambda game: 100)
+        for game_id in range(5):
+            store.put(game_id, Game.create(["Alice"]))
+        assert store.resident == 2
+        assert store.resident_bytes() == 200
+        assert len(store) == 5
+
+    def test_sizes_measured_once(self, tmp_path):
+        """Test that sizes are measured on entry, not on every access."""
+        measured = []
+        store = GameStore(
+            str(tmp_path), memory_budget=250, size_of=lambda game: measured.append(game) or 100
+        )
+        for game_id in range(3):
+            store.put(game_id, Game.create(["Alice"]))
+        for _ in range(5):
+            store.get(2)
+        assert len(measured) == 3
+        store.get(0)  # faulted back in: measured again
+        assert len(measured) == 4
+        assert store.resident_bytes() == 200
+
+    def test_ttl_sweep(self, tmp_path, clock):
+        """Test that sweep spills games idle longer than the TTL."""
+        store = GameStore(str(tmp_path), ttl=60, clock=clock)
+        store.put("old", Game.create(["Alice"]))
+        clock.now = 50
+        store.put("recent", Game.create(["Bob"]))
+        clock.now = 100
+
+        assert store.sweep() == 1
+        assert "old" in store and store.resident == 1
+
+    def test_locked_game_not_spilled(self, tmp_path):
+        """Test that a game mid-operation stays resident."""
+        store = GameStore(str(tmp_path))
+        game = Game.create(["Alice"])
+        store.put("t1", game)
+        with game.lock:
+            assert not store.spill("t1")
+        assert store.spill("t1")
+
+    def test_pinned_game_not_spilled(self, tmp_path):
+        """Test that a pinned game keeps its identity until unpinned."""
+        store = GameStore(str(tmp_path), max_resident=1)
+        store.put("held", Game.create(["Alice"]))
+        game = store.pin("held")
+        store.put("other", Game.create(["Bob"]))
+
+        assert not store.spill("held")
+        assert store.get("held") is game
+        with store.checkout("other") as other:
+            assert store.get("other") is other
+        store.unpin("held")
+        assert store.resident == 1
+        with pytest.raises(ValueError, match="not pinned"):
+            store.unpin("held")
+
+    def test_shared_objects_reattached(self, tmp_path):
+        """Test that the shared stats tracker and bus survive a spill."""
+        stats, bus = StatsTracker(), EventBus()
+        store = GameStore(str(tmp_path), stats=stats, bus=bus)
+        store.put("t1", Game.create(["Alice", "Bob"], stats=stats, bus=bus))
+        store.spill("t1")
+
+        game = store.get("t1")
+        assert game.scoreboard.stats is stats
+        assert game.collector.stats is stats
+        assert game.scoreboard.bus is bus
+        assert game.progression.bus is bus
+
+    def test_remove_and_missing(self, tmp_path):
+        """Test removing games and looking up unknown ones."""
+        store = GameStore(str(tmp_path))
+        store.put("t1", Game.create(["Alice"]))
+        store.spill("t1")
+        store.remove("t1")
+        assert "t1" not in store
+        assert os.listdir(tmp_path) == []
+        assert store.get("t1") is None
+        assert store.get("t1", "fallback") == "fallback"
+        with pytest.raises(KeyError):
+            store.pin("t1")
+        with pytest.raises(KeyError):
+            store.remove("t1")
@@ -0,0 +1,203 @@
+"""Tests for the HTTP API."""
+
+import asyncio
+import json
+
+import pytest
+from src.game_store import GameStore
+from src.http_api import HttpApi
+from src.round_pipeline import Game
+
+
+@pytest.fixture
+def game():
+    """Provide a game in its first bidding phase."""
+    game = Game.create(["Alice", "Bob"])
+    game.progression.start_round()
+    game.collector.start_round(1)
+    return game
+
+
+@pytest.fixture
+def api(game):
+    """Provide an API serving one game."""
+    return HttpApi({"t1": game})
+
+
+def send_raw(api, payload):
+    """Send raw request bytes to a fresh server; return everything read back."""
+
+    async def exchange():
+        server = await api.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(payload)
+            return await asyncio.wait_for(reader.read(), 5)
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(exchange())
+
+
+class TestHandle:
+    """Test request handling without a socket."""
+
+    def test_standings(self, api):
+        """Test that standings are served as JSON with an ETag."""
+        status, headers, body = api.handle("GET", "/games/t1/standings", {})
+        assert status == 200
+        assert headers["ETag"].startswith('"')
+        assert [p["name"] for p in json.loads(body)["standings"]] == ["Alice", "Bob"]
+
+    def test_missing_players(self, api, game):
+        """Test that missing players are listed with names."""
+        game.collector.collect_bid(0, 1)
+        _, _, body = api.handle("GET", "/games/t1/missing", {})
+        assert json.loads(body)["missing"] == [{"player_id": 1, "name": "Bob"}]
+
+    def test_missing_players_beyond_registry(self, api, game):
+        """Test that expected but unregistered players are listed without names."""
+        game.collector.num_players = 3
+        _, _, body = api.handle("GET", "/games/t1/missing", {})
+        assert json.loads(body)["missing"][2] == {"player_id": 2, "name": None}
+
+    def test_bidding_status(self, api):
+        """Test the bidding status resource."""
+        _, _, body = api.handle("GET", "/games/t1/bidding", {})
+        document = json.loads(body)
+        assert document["round"] == 1
+        assert document["bids_collected"] == 0
+        assert not document["all_bids_collected"]
+
+    def test_if_none_match_returns_304(self, api):
+        """Test that a matching If-None-Match skips rendering."""
+        _, headers, _ = api.handle("GET", "/games/t1/standings", {})
+        etag = headers["ETag"]
+
+        status, headers, body = api.handle(
+            "GET", "/games/t1/standings", {"if-none-match": f'"other", {etag}'}
+        )
+        assert status == 304
+        assert body == b""
+        assert headers["ETag"] == etag
+
+    def test_etag_changes_with_version(self, api, game):
+        """Test that writes invalidate the ETag of affected resources only."""
+        _, standings, _ = api.handle("GET", "/games/t1/standings", {})
+        _, bidding, _ = api.handle("GET", "/games/t1/bidding", {})
+
+        game.scoreboard.record_round_score("Alice", 1, 20)
+
+        status, _, _ = api.handle("GET", "/games/t1/standings", {"if-none-match": standings["ETag"]})
+        assert status == 200
+        status, _, _ = api.handle("GET", "/games/t1/bidding", {"if-none-match": bidding["ETag"]})
+        assert status == 304
+
+    def test_etag_and_body_come_from_one_snapshot(self, api, game):
+        """Test that a version bumped ahead of its snapshot is not advertised."""
+        game.scoreboard.version += 1  # as mid-write, before the snapshot is published
+        _, headers, body = api.handle("GET", "/games/t1/breakdown", {})
+        version = game.scoreboard.snapshot().version
+        assert json.loads(body)["version"] == version
+        assert headers["ETag"].endswith(f'-breakdown-{version}"')
+
+    def test_response_cached_per_version(self, api):
+        """Test that unchanged resources reuse the rendered body."""
+        _, _, first = api.handle("GET", "/games/t1/breakdown", {})
+        _, _, second = api.handle("GET", "/games/t1/breakdown", {})
+        assert first is second
+
+    @pytest.mark.parametrize("path", [
+        "/games/t9/standings", "/games/t1/scores", "/players", "/games/t1/standings/x",
+    ])
+    def test_not_found(self, api, path):
+        """Test that unknown games and resources give 404."""
+        assert api.handle("GET", path, {})[0] == 404
+
+    def test_serves_game_store(self, game, tmp_path):
+        """Test serving a GameStore, including spilled and unknown games."""
+        store = GameStore(str(tmp_path))
+        store.put("t1", game)
+        store.spill("t1")
+        api = HttpApi(store)
+        status, _, body = api.handle("GET", "/games/t1/standings", {})
+        assert status == 200
+        assert [row["name"] for row in json.loads(body)["standings"]] == ["Alice", "Bob"]
+        assert api.handle("GET", "/games/nope/standings", {})[0] == 404
+
+    def test_method_not_allowed(self, api):
+        """Test that writes are rejected."""
+        status, headers, _ = api.handle("POST", "/games/t1/standings", {})
+        assert status == 405
+        assert headers["Allow"] == "GET, HEAD"
+
+
+class TestServer:
+    """Test the asyncio server over a localhost socket."""
+
+    def test_keep_alive_and_revalidation(self, api):
+        """Test two requests on one connection, the second revalidated."""
+
+        async def exchange():
+            server = await api.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            try:
+                writer.write(b"GET /games/t1/standings HTTP/1.1\r\nHost: x\r\n\r\n")
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers = dict(
+                    line.split(": ", 1) for line in head.decode().split("\r\n")[1:] if line
+                )
+                body = await reader.readexactly(int(headers["Content-Length"]))
+
+                writer.write(
+                    b"GET /games/t1/standings HTTP/1.1\r\nHost: x\r\n"
+                    + f"If-None-Match: {headers['ETag']}\r\nConnection: close\r\n\r\n".encode()
+                )
+                second = await reader.read()
+            finally:
+                writer.close()
+                server.close()
+                await server.wait_closed()
+            return head, body, second
+
+        head, body, second = asyncio.run(exchange())
+        assert head.startswith(b"HTTP/1.1 200 OK")
+        assert b"Connection: keep-alive" in head
+        assert json.loads(body)["standings"]
+        assert second.startswith(b"HTTP/1.1 304 Not Modified")
+        assert second.endswith(b"\r\n\r\n")
+
+    def test_request_body_drained(self, api):
+        """Test that a request body is skipped before the next request."""
+        response = send_raw(
+            api,
+            b"POST /games/t1/standings HTTP/1.1\r\nContent-Length: 11\r\n\r\n"
+            b"GET / HTTP/"
+            b"GET /games/t1/bidding HTTP/1.1\r\nConnection: close\r\n\r\n",
+        )
+        assert response.startswith(b"HTTP/1.1 405 Method Not Allowed")
+        assert response.count(b"HTTP/1.1 ") == 2
+        assert b"HTTP/1.1 200 OK" in response
+
+    @pytest.mark.parametrize("header, status", [
+        (b"Transfer-Encoding: chunked", b"501 Not Implemented"),
+        (b"Content-Length: abc", b"400 Bad Request"),
+        (b"Content-Length: 10000000", b"413 "),
+    ])
+    def test_undrainable_body_refused(self, api, header, status):
+        """Test that bodies the server cannot skip close the connection."""
+        response = send_raw(api, b"GET /games/t1/standings HTTP/1.1\r\n" + header + b"\r\n\r\n")
+        assert response.startswith(b"HTTP/1.1 " + status)
+        assert b"Connection: close" in response
+
+    def test_render_error_returns_500(self, api, game):
+        """Test that a failing render is answered rather than dropped."""
+        game.scoreboard._renderer = object()  # render() now raises
+        response = send_raw(
+            api, b"GET /games/t1/standings HTTP/1.1\r\nConnection: close\r\n\r\n"
+        )
+        assert response.startswith(b"HTTP/1.1 500 Internal Server Error")
@@ -0,0 +1,207 @@
+"""Tests for the micro-batching ingestion queue."""
+
+import threading
+
+import pytest
+from src.bid_collector import BidCollector
+from src.event_bus import EventBus
+from src.ingestion import IngestionQueue
+from src.scoreboard import Scoreboard
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def game():
+    """Provide a collector and scoreboard for a two-player game."""
+    collector = BidCollector(2)
+    collector.start_round(3)
+    scoreboard = Scoreboard()
+    scoreboard.add_player("Alice")
+    scoreboard.add_player("Bob")
+    return collector, scoreboard
+
+
+class TestBatching:
+    """Test batch triggering by size and deadline."""
+
+    def test_batch_applied_when_full(self, clock, game):
+        """Test that reaching max_batch applies the buffered commands."""
+        collector, scoreboard = game
+        queue = IngestionQueue(max_batch=2, max_delay=1.0, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+
+        first = queue.submit_bid("t1", 0, 1)
+        assert not first.done()
+        assert collector.bids == {}
+
+        second = queue.submit_bid("t1", 1, 2)
+        assert first.done() and second.done()
+        assert collector.bids == {0: 1, 1: 2}
+
+    def test_batch_applied_after_deadline(self, clock, game):
+        """Test that poll() applies batches whose deadline has passed."""
+        collector, scoreboard = game
+        queue = IngestionQueue(max_batch=10, max_delay=0.01, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+
+        future = queue.submit_score("t1", "Alice", 1, 60)
+        assert queue.poll() == 0
+
+        clock.now = 0.01
+        assert queue.poll() == 1
+        assert future.result() is None
+        assert scoreboard.players["Alice"].total_score == 60
+
+    def test_scores_published_once_per_batch(self, clock, game):
+        """Test that a batch of score writes produces a single change event."""
+        collector, scoreboard = game
+        bus = EventBus(clock=clock)
+        subscription = bus.subscribe()
+        scoreboard.bus = bus
+        queue = IngestionQueue(max_batch=4, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+
+        for round_num in (1, 2):
+            queue.submit_score("t1", "Alice", round_num, 20)
+            queue.submit_score("t1", "Bob", round_num, -10)
+
+        notifications = subscription.drain()
+        assert len(notifications) == 1
+        assert notifications[0].events[0].kind == "record_round_scores"
+        assert scoreboard.players["Alice"].total_score == 40
+
+    def test_submit_applies_only_due_games(self, clock, game):
+        """Test that a submit flushes games past their deadline and no others."""
+        collector, scoreboard = game
+        other = Scoreboard()
+        other.add_player("Carol")
+        queue = IngestionQueue(max_batch=10, max_delay=0.01, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+        queue.register_game("t2", None, other)
+
+        early = queue.submit_score("t1", "Alice", 1, 20)
+        clock.now = 0.005
+        queue.submit_score("t2", "Carol", 1, 30)
+        clock.now = 0.01
+        queue.submit_score("t2", "Carol", 2, 10)
+
+        assert early.done()
+        assert queue.pending("t1") == 0
+        assert queue.pending("t2") == 2
+
+    def test_slow_apply_does_not_block_other_games(self, clock, game):
+        """Test that submits to one game proceed while another's batch applies."""
+        collector, scoreboard = game
+        applying, release = threading.Event(), threading.Event()
+        bus = EventBus(clock=clock)
+        bus.subscribe(lambda notification: (applying.set(), release.wait(5)))
+        scoreboard.bus = bus
+        other = Scoreboard()
+        other.add_player("Carol")
+        queue = IngestionQueue(max_batch=1, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+        queue.register_game("t2", None, other)
+
+        slow = threading.Thread(target=queue.submit_score, args=("t1", "Alice", 1, 20))
+        slow.start()
+        assert applying.wait(5)
+        # A second batch for t1 waits for the first without holding up t2.
+        waiting = threading.Thread(target=queue.submit_score, args=("t1", "Bob", 1, 40))
+        waiting.start()
+        other_game = threading.Thread(target=queue.submit_score, args=("t2", "Carol", 1, 30))
+        other_game.start()
+        other_game.join(2)
+        done = not other_game.is_alive()
+        release.set()
+        for thread in (slow, waiting, other_game):
+            thread.join()
+        assert done
+        assert other.players["Carol"].total_score == 30
+        assert scoreboard.players["Bob"].total_score == 40
+
+
+class TestErrors:
+    """Test per-command error reporting."""
+
+    def test_invalid_command_fails_alone(self, clock, game):
+        """Test that one invalid command does not fail the rest of its batch."""
+        collector, scoreboard = game
+        queue = IngestionQueue(max_batch=3, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+
+        good = queue.submit_bid("t1", 0, 2)
+        bad_bid = queue.submit_bid("t1", 1, 9)
+        bad_player = queue.submit_score("t1", "Nobody", 1, 10)
+
+        assert good.result() is None
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            bad_bid.result()
+        with pytest.raises(ValueError, match="not found"):
+            bad_player.result()
+        assert collector.bids == {0: 2}
+
+    def test_malformed_command_fails_alone(self, clock, game):
+        """Test that an unexpected error is set on its own command's future."""
+        collector, scoreboard = game
+        queue = IngestionQueue(max_batch=2, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+
+        bad = queue.submit_bid("t1", 0, "x")
+        good = queue.submit_bid("t1", 1, 1)
+
+        assert good.result() is None
+        with pytest.raises(TypeError):
+            bad.result()
+        assert collector.bids == {1: 1}
+
+    def test_unknown_game_raises_error(self, clock):
+        """Test that submitting to an unregistered game raises ValueError."""
+        queue = IngestionQueue(clock=clock)
+        with pytest.raises(ValueError, match="not registered"):
+            queue.submit_bid("missing", 0, 1)
+
+    def test_unregister_flushes_pending(self, clock, game):
+        """Test that unregistering a game applies its buffered commands."""
+        collector, scoreboard = game
+        queue = IngestionQueue(max_batch=10, max_delay=1.0, clock=clock)
+        queue.register_game("t1", collector, scoreboard)
+        future = queue.submit_bid("t1", 0, 3)
+
+        queue.unregister_game("t1")
+        assert future.done()
+        assert collector.bids == {0: 3}
+
+
+class TestBatchMethods:
+    """Test the batch write methods used by the queue."""
+
+    def test_collect_bids_is_all_or_nothing(self):
+        """Test that collect_bids stores nothing if any bid is invalid."""
+        collector = BidCollector(2)
+        collector.start_round(1)
+        with pytest.raises(ValueError):
+            collector.collect_bids({0: 1, 1: 5})
+        assert collector.bids == {}
+
+    def test_record_round_scores_is_all_or_nothing(self):
+        """Test that record_round_scores writes nothing for unknown players."""
+        scoreboard = Scoreboard()
+        scoreboard.add_player("Alice")
+        with pytest.raises(ValueError, match="not found"):
+            scoreboard.record_round_scores([("Alice", 1, 20), ("Nobody", 1, 10)])
+        assert scoreboard.players["Alice"].round_scores == {}
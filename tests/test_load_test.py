@@ -0,0 +1,60 @@
+"""Tests for the asyncio load-testing harness."""
+
+import asyncio
+
+import pytest
+from src.load_test import GameServer, percentile, run_load, summarize
+
+
+class TestPercentiles:
+    """Test latency summaries."""
+
+    def test_nearest_rank_percentiles(self):
+        """Test nearest-rank percentiles over 1..100."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+
+    def test_summarize(self):
+        """Test that summaries report count, mean and max."""
+        stats = summarize([0.3, 0.1, 0.2])
+        assert stats.count == 3
+        assert stats.mean == pytest.approx(0.2)
+        assert stats.p50 == 0.2
+        assert stats.max == 0.3
+
+    def test_empty_percentile(self):
+        """Test that an empty sample gives zero."""
+        assert percentile([], 0.5) == 0.0
+
+
+class TestRunLoad:
+    """Test complete load runs."""
+
+    def test_clients_play_full_games(self):
+        """Test that every client plays its games without errors."""
+        report = asyncio.run(run_load(clients=20, games_per_client=2, num_players=3))
+
+        assert report.errors == 0
+        assert report.games_played == 40
+        assert report.operations["complete_round"].count == 400
+        assert report.operations["bid"].count == 1200
+        assert report.throughput > 0
+        assert "complete_round" in report.format()
+
+    def test_profile_capture(self):
+        """Test that profiling records server-side functions."""
+        report = asyncio.run(run_load(clients=2, profile=True))
+        assert "complete_round" in report.profile
+
+    def test_server_forgets_closed_games(self):
+        """Test that finished games are removed from the server."""
+        server = GameServer()
+
+        async def play():
+            game_id = await server.call("create_game", ["A", "B"])
+            await server.call("close_game", game_id)
+
+        asyncio.run(play())
+        assert server.games == {}
@@ -0,0 +1,98 @@
+"""Tests for the shared player registry."""
+
+import pytest
+from src.bid_collector import BidCollector
+from src.player_registry import PlayerRegistry
+from src.scoreboard import Scoreboard
+
+
+class TestPlayerRegistry:
+    """Test id assignment and lookups."""
+
+    def test_ids_are_dense_and_stable(self):
+        """Test that ids follow registration order and are assigned once."""
+        registry = PlayerRegistry(["Alice", "Bob"])
+        assert registry.register("Charlie") == 2
+        assert registry.register("Alice") == 0
+        assert len(registry) == 3
+        assert registry.names == ("Alice", "Bob", "Charlie")
+
+    def test_lookups(self):
+        """Test name/id lookups in both directions."""
+        registry = PlayerRegistry(["Alice", "Bob"])
+        assert registry.id_of("Bob") == 1
+        assert registry.name_of(1) == "Bob"
+        assert registry.resolve("Alice") == 0
+        assert registry.resolve(1) == 1
+        assert "Alice" in registry
+
+    def test_unknown_players_raise_error(self):
+        """Test that unknown names and ids raise ValueError."""
+        registry = PlayerRegistry(["Alice"])
+        with pytest.raises(ValueError, match="not found"):
+            registry.id_of("Bob")
+        with pytest.raises(ValueError, match="Invalid player_id"):
+            registry.name_of(1)
+
+
+class TestSharedRegistry:
+    """Test BidCollector and Scoreboard sharing one registry."""
+
+    @pytest.fixture
+    def game(self):
+        """Provide a collector and scoreboard sharing a registry."""
+        registry = PlayerRegistry()
+        scoreboard = Scoreboard(registry=registry)
+        for name in ("Alice", "Bob", "Charlie"):
+            scoreboard.add_player(name)
+        collector = BidCollector(registry=registry)
+        return registry, collector, scoreboard
+
+    def test_collector_sized_from_registry(self, game):
+        """Test that the collector takes its player count from the registry."""
+        _, collector, _ = game
+        assert collector.num_players == 3
+
+    def test_bids_by_name_use_registry_ids(self, game):
+        """Test that bids given by name are stored under the player's id."""
+        _, collector, _ = game
+        collector.start_round(2)
+        collector.collect_bid("Bob", 1)
+        collector.collect_bids({"Alice": 0, 2: 2})
+        assert collector.bid_list() == [0, 1, 2]
+
+    def test_scores_by_id(self, game):
+        """Test that scores can be recorded by player id."""
+        _, _, scoreboard = game
+        scoreboard.record_round_score(1, 1, 20)
+        assert scoreboard.players["Bob"].total_score == 20
+
+    def test_record_round_joins_by_index(self, game):
+        """Test recording a whole round from a list indexed by player id."""
+        _, collector, scoreboard = game
+        collector.start_round(1)
+        collector.collect_bids({0: 1, 1: 0, 2: 1})
+        tricks = [1, 0, 0]
+        bids = collector.bid_list()
+        scores = [20 if bid == won else -10 for bid, won in zip(bids, tricks)]
+
+        scoreboard.record_round(1, scores)
+
+        assert [row.name for row in scoreboard.snapshot().standings] == ["Alice", "Bob", "Charlie"]
+        assert scoreboard.players["Charlie"].total_score == -10
+
+    def test_unknown_ids_rejected(self, game):
+        """Test that unknown ids raise ValueError in both classes."""
+        _, collector, scoreboard = game
+        collector.start_round(1)
+        with pytest.raises(ValueError, match="Invalid player_id"):
+            collector.collect_bid(3, 0)
+        with pytest.raises(ValueError, match="not found"):
+            scoreboard.record_round_score(3, 1, 20)
+
+    def test_name_lookup_requires_registry(self):
+        """Test that bidding by name without a registry raises ValueError."""
+        collector = BidCollector(2)
+        collector.start_round(1)
+        with pytest.raises(ValueError, match="without a registry"):
+            collector.collect_bid("Alice", 0)
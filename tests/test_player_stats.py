@@ -0,0 +1,127 @@
+"""Tests for the incremental player statistics module."""
+
+import statistics
+
+import pytest
+from src.bid_collector import BidCollector
+from src.player_stats import StatsTracker
+from src.round_pipeline import Game, RoundPipeline
+from src.scoreboard import Scoreboard
+
+
+class TestRunningAggregates:
+    """Test the running score aggregates."""
+
+    def test_mean_and_variance_match_batch_computation(self):
+        """Test that Welford updates match a full recomputation."""
+        tracker = StatsTracker()
+        scores = [20, -10, 40, 30, -20, 60]
+        for round_num, score in enumerate(scores, 1):
+            tracker.record_score("Alice", round_num, score)
+
+        stats = tracker.get("Alice")
+        assert stats.rounds_scored == len(scores)
+        assert stats.mean_score == pytest.approx(statistics.mean(scores))
+        assert stats.variance == pytest.approx(statistics.variance(scores))
+
+    def test_hit_rate_counts_positive_rounds(self):
+        """Test that positive round scores count as met bids."""
+        tracker = StatsTracker()
+        for round_num, score in enumerate([20, -10, 10, -30], 1):
+            tracker.record_score("Alice", round_num, score)
+
+        assert tracker.get("Alice").hit_rate == pytest.approx(0.5)
+
+    def test_streaks(self):
+        """Test current and longest streak tracking."""
+        tracker = StatsTracker()
+        for round_num, score in enumerate([20, 40, 60, -10, 20], 1):
+            tracker.record_score("Alice", round_num, score)
+
+        stats = tracker.get("Alice")
+        assert stats.current_streak == 1
+        assert stats.longest_streak == 3
+
+    def test_correction_replaces_previous_score(self):
+        """Test that overwriting a round score replaces it in the aggregates."""
+        tracker = StatsTracker()
+        tracker.record_score("Alice", 1, 20)
+        tracker.record_score("Alice", 2, 40)
+        tracker.record_score("Alice", 2, -10, previous=40)
+
+        stats = tracker.get("Alice")
+        assert stats.rounds_scored == 2
+        assert stats.mean_score == pytest.approx(5.0)
+        assert stats.variance == pytest.approx(statistics.variance([20, -10]))
+        assert stats.hits == 1
+        assert stats.current_streak == 0
+        assert stats.longest_streak == 1
+
+    def test_unknown_player_raises_error(self):
+        """Test that querying an untracked player raises ValueError."""
+        with pytest.raises(ValueError, match="No statistics"):
+            StatsTracker().get("Nobody")
+
+
+class TestEventSources:
+    """Test that the game objects feed the tracker."""
+
+    def test_scoreboard_feeds_scores(self):
+        """Test that recorded scores reach the tracker, keyed by player name."""
+        tracker = StatsTracker()
+        scoreboard = Scoreboard(stats=tracker)
+        scoreboard.add_player("Alice")
+        scoreboard.record_round_score("Alice", 1, 20)
+        scoreboard.record_round_score("Alice", 1, 40)
+
+        stats = tracker.get("Alice")
+        assert stats.rounds_scored == 1
+        assert stats.mean_score == pytest.approx(40.0)
+
+    def test_bid_collector_feeds_bids_once_per_round(self):
+        """Test that bids are recorded once when proceeding to scoring."""
+        tracker = StatsTracker()
+        collector = BidCollector(2, stats=tracker)
+        collector.start_round(3)
+        collector.collect_bid(0, 2)
+        collector.collect_bid(1, 0)
+        collector.proceed_to_scoring()
+        collector.proceed_to_scoring()
+
+        assert tracker.get(0).bids_made == 1
+        assert tracker.get(0).mean_bid == pytest.approx(2.0)
+        assert tracker.get(1).bid_total == 0
+
+    def test_bids_and_scores_share_one_record(self):
+        """Test that a game's bids and scores land on the same player record."""
+        tracker = StatsTracker()
+        scoreboard = Scoreboard(stats=tracker)
+        for name in ("Alice", "Bob"):
+            scoreboard.add_player(name)
+        collector = BidCollector(registry=scoreboard.registry, stats=tracker)
+        collector.start_round(1)
+        collector.collect_bids({"Alice": 1, "Bob": 0})
+        collector.proceed_to_scoring()
+        scoreboard.record_round(1, [20, 10])
+
+        assert len(tracker) == 2
+        alice = tracker.get("Alice")
+        assert (alice.bids_made, alice.rounds_scored) == (1, 1)
+
+    def test_games_sharing_a_tracker_keep_players_apart(self):
+        """Test that players in the same seat of different games stay separate."""
+        tracker = StatsTracker()
+        pipeline = RoundPipeline()
+        for names in (["Alice", "Bob"], ["Carol", "Alice"]):
+            game = Game.create(names, stats=tracker)
+            game.progression.start_round()
+            game.collector.start_round(1)
+            game.collector.collect_bids({0: 1, 1: 0})
+            pipeline.complete_round(game, [1, 0])
+
+        carol, alice = tracker.get("Carol"), tracker.get("Alice")
+        assert (carol.bids_made, carol.rounds_scored, carol.current_streak) == (1, 1, 1)
+        assert (alice.bids_made, alice.rounds_scored) == (2, 2)
+        assert alice.mean_bid == pytest.approx(0.5)
+        # Alice met her bid in both games' round 1: the streak spans games.
+        assert (alice.current_streak, alice.longest_streak) == (2, 2)
@@ -0,0 +1,121 @@
+"""Tests for cross-game skill ratings."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.ratings import RatingBook, standings_of  # noqa: E402
+from src.scoreboard import Scoreboard  # noqa: E402
+
+
+def reference_update(ratings, game, k=32.0, initial=1500.0):
+    """Rate one game with a plain pairwise loop."""
+    current = {name: ratings.get(name, initial) for name, _ in game}
+    deltas = {name: 0.0 for name, _ in game}
+    for name, total in game:
+        for other, other_total in game:
+            if other == name:
+                continue
+            expected = 1 / (1 + 10 ** ((current[other] - current[name]) / 400))
+            actual = 1.0 if total > other_total else 0.5 if total == other_total else 0.0
+            deltas[name] += k / (len(game) - 1) * (actual - expected)
+    for name, delta in deltas.items():
+        ratings[name] = current[name] + delta
+
+
+def random_games(rng, count, pool):
+    """Generate games of 2-6 distinct players with random totals."""
+    games = []
+    for _ in range(count):
+        seats = rng.sample(pool, rng.randint(2, 6))
+        games.append([(name, rng.randint(-200, 400)) for name in seats])
+    return games
+
+
+class TestRatingBook:
+    """Test the vectorized rating updates."""
+
+    def test_two_player_game(self):
+        """Test a single head-to-head between new players."""
+        book = RatingBook()
+        book.update([[("Alice", 120), ("Bob", 40)]])
+        assert book.rating("Alice") == pytest.approx(1516.0)
+        assert book.rating("Bob") == pytest.approx(1484.0)
+        assert book.games_played("Alice") == 1
+
+    def test_tie_between_equals_changes_nothing(self):
+        """Test that a draw between equal ratings is neutral."""
+        book = RatingBook()
+        book.update([[("Alice", 50), ("Bob", 50), ("Charlie", 50)]])
+        assert book.as_dict() == pytest.approx({"Alice": 1500, "Bob": 1500, "Charlie": 1500})
+
+    def test_matches_pairwise_loop(self):
+        """Test batches of disjoint games against the reference loop."""
+        rng = random.Random(3)
+        book = RatingBook()
+        reference = {}
+        for _ in range(20):
+            pool = [f"p{i}" for i in range(60)]
+            rng.shuffle(pool)
+            games, start = [], 0
+            while start + 6 <= len(pool):
+                size = rng.randint(2, 6)
+                games.append([(name, rng.randint(-200, 400)) for name in pool[start:start + size]])
+                start += size
+            book.update(games)
+            for game in games:
+                reference_update(reference, game)
+
+        assert book.as_dict() == pytest.approx(reference)
+
+    def test_recompute_matches_incremental(self):
+        """Test that replaying the history reproduces nightly updates."""
+        rng = random.Random(5)
+        pool = [f"p{i}" for i in range(40)]
+        book = RatingBook()
+        for _ in range(10):
+            book.update(random_games(rng, 50, pool))
+        incremental = book.as_dict()
+
+        book.recompute(k=16)
+        assert book.as_dict() != pytest.approx(incremental)
+        book.recompute(k=32)
+        assert book.as_dict() == pytest.approx(incremental)
+        assert book.batches == 10
+
+    def test_ratings_are_zero_sum(self):
+        """Test that each batch conserves the total rating."""
+        rng = random.Random(9)
+        book = RatingBook()
+        book.update(random_games(rng, 300, [f"p{i}" for i in range(100)]))
+        assert sum(book.as_dict().values()) == pytest.approx(1500.0 * len(book))
+
+    def test_top_and_lookup_errors(self):
+        """Test ranking output and unknown players."""
+        book = RatingBook()
+        book.update([[("Alice", 10), ("Bob", 20)]])
+        assert [name for name, _ in book.top(1)] == ["Bob"]
+        with pytest.raises(ValueError, match="not found"):
+            book.rating("Charlie")
+
+    def test_duplicate_player_rejected(self):
+        """Test that a game listing a player twice is rejected whole."""
+        book = RatingBook()
+        with pytest.raises(ValueError, match="listed twice"):
+            book.update([[("Alice", 1), ("Bob", 2)], [("Carol", 1), ("Carol", 2)]])
+        assert len(book) == 0
+        assert book.update([]) == 0
+
+    def test_standings_of_scoreboard(self):
+        """Test rating a finished Scoreboard."""
+        scoreboard = Scoreboard()
+        for name, score in (("Alice", 60), ("Bob", 90)):
+            scoreboard.add_player(name)
+            scoreboard.record_round_score(name, 1, score)
+        assert standings_of(scoreboard) == [("Bob", 90), ("Alice", 60)]
+
+        book = RatingBook()
+        book.update([standings_of(scoreboard)])
+        assert book.rating("Bob") > book.rating("Alice")
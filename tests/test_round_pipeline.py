@@ -0,0 +1,154 @@
+"""Tests for the transactional round pipeline."""
+
+import pickle
+
+import pytest
+from src.event_bus import EventBus
+from src.round_pipeline import Game, RoundPipeline
+from src.round_progression import GamePhase as RoundPhase
+from src.scoreboard import GamePhase as BoardPhase
+
+
+def start_bidding(game, bids):
+    """Move a game into bidding and collect the given bids."""
+    game.progression.start_round()
+    game.collector.start_round(game.progression.current_round)
+    game.collector.collect_bids(dict(enumerate(bids)))
+
+
+@pytest.fixture
+def game():
+    """Provide a three-player game."""
+    return Game.create(["Alice", "Bob", "Charlie"])
+
+
+@pytest.fixture
+def pipeline():
+    """Provide a round pipeline."""
+    return RoundPipeline()
+
+
+class TestCompleteRound:
+    """Test completing a single game's round."""
+
+    def test_round_completed(self, game, pipeline):
+        """Test that scores are written and the round is closed."""
+        start_bidding(game, [1, 0, 0])
+        result = pipeline.complete_round(game, [1, 0, 0])
+
+        assert result.round_num == 1
+        assert result.scores == (20, 10, 10)
+        assert not result.game_complete
+        assert game.progression.current_phase == RoundPhase.COMPLETE
+        assert game.scoreboard.current_phase == BoardPhase.SCORING
+        assert game.scoreboard.players["Alice"].total_score == 20
+
+    def test_invalid_tricks_leave_game_unchanged(self, game, pipeline):
+        """Test that a failed validation writes nothing."""
+        start_bidding(game, [1, 0, 0])
+        version = game.scoreboard.version
+
+        with pytest.raises(ValueError, match="sum to 2"):
+            pipeline.complete_round(game, [1, 1, 0])
+
+        assert game.scoreboard.version == version
+        assert game.progression.current_phase == RoundPhase.BIDDING
+
+    def test_missing_bids_rejected(self, game, pipeline):
+        """Test that a round cannot complete before every bid is in."""
+        game.progression.start_round()
+        game.collector.start_round(1)
+        game.collector.collect_bid(0, 1)
+        with pytest.raises(RuntimeError, match=r"Missing bids from players: \[1, 2\]"):
+            pipeline.complete_round(game, [1, 0, 0])
+
+    def test_wrong_phase_rejected(self, game, pipeline):
+        """Test that a round in setup cannot be completed."""
+        with pytest.raises(RuntimeError, match="must be bidding or scoring"):
+            pipeline.complete_round(game, [1, 0, 0])
+
+    def test_full_game(self, game, pipeline):
+        """Test playing all ten rounds through the pipeline."""
+        for round_num in range(1, 11):
+            if round_num > 1:
+                game.progression.advance_phase()
+            start_bidding(game, [round_num, 0, 0])
+            result = pipeline.complete_round(game, [round_num, 0, 0])
+
+        assert result.game_complete
+        assert game.progression.is_game_complete
+        assert game.scoreboard.current_phase == BoardPhase.GAME_OVER
+        assert game.scoreboard.players["Alice"].total_score == sum(20 * r for r in range(1, 11))
+
+    def test_game_pickles_without_lock(self, game):
+        """Test that a game survives pickling."""
+        restored = pickle.loads(pickle.dumps(game))
+        assert restored.registry.names == ("Alice", "Bob", "Charlie")
+        with restored.lock:
+            pass
+
+    def test_round_recorded_in_history(self, game, pipeline):
+        """Test that the round's tricks are stored with its bids."""
+        start_bidding(game, [1, 0, 0])
+        pipeline.complete_round(game, [1, 0, 0])
+        assert game.collector.export_history()["tricks"].tolist() == [[1, 0, 0]]
+
+
+class TestCompleteRounds:
+    """Test completing a batch of games."""
+
+    def test_failures_are_isolated(self, pipeline):
+        """Test that one failing game does not stop the batch."""
+        games = [Game.create(["A", "B"]) for _ in range(3)]
+        for game in games:
+            start_bidding(game, [1, 0])
+
+        results = pipeline.complete_rounds([
+            (games[0], [1, 0]),
+            (games[1], [2, 0]),
+            (games[2], [0, 1]),
+        ])
+
+        assert results[0].scores == (20, 10)
+        assert isinstance(results[1], ValueError)
+        assert results[2].scores == (-10, -10)
+        assert games[1].progression.current_phase == RoundPhase.BIDDING
+
+    def test_raising_subscriber_does_not_split_round(self, pipeline):
+        """Test that a failing subscriber cannot leave a round half-completed."""
+        bus = EventBus()
+
+        def fail_on_scores(notification):
+            if any(event.kind == "record_round_scores" for event in notification.events):
+                raise RuntimeError("subscriber failed")
+
+        subscription = bus.subscribe(fail_on_scores)
+        game = Game.create(["A", "B"], bus=bus)
+        start_bidding(game, [1, 0])
+
+        results = pipeline.complete_rounds([(game, [1, 0])])
+
+        assert results[0].scores == (20, 10)
+        assert game.scoreboard.players["A"].total_score == 20
+        assert game.progression.current_phase == RoundPhase.COMPLETE
+        assert game.collector.trick_history(0) == [1]
+        assert subscription.failed_notifications == 1
+
+    def test_events_delivered_after_all_writes(self, pipeline):
+        """Test that subscribers hear of a batch only once every game is done."""
+        bus = EventBus()
+        games = [Game.create(["A", "B"], bus=bus) for _ in range(2)]
+        for game in games:
+            start_bidding(game, [1, 0])
+        seen = []
+        bus.subscribe(lambda notification: seen.append(
+            ([event.kind for event in notification.events],
+             [game.progression.current_phase for game in games])
+        ))
+
+        pipeline.complete_rounds([(game, [1, 0]) for game in games])
+
+        assert len(seen) == 1
+        kinds, phases = seen[0]
+        assert phases == [RoundPhase.COMPLETE] * 2
+        assert kinds.count("record_round_scores") == 2
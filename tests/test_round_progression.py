@@ -51,6 +51,12 @@ class TestHandsPerRound:
         assert game.current_round == 10
         assert game.hands_in_current_round == 10
 
+    def test_hands_table_covers_every_round(self):
+        """Test that the precomputed hands table matches the round-number rule."""
+        assert RoundProgression.HANDS[RoundProgression.MIN_ROUND:] == tuple(
+            range(RoundProgression.MIN_ROUND, RoundProgression.MAX_ROUND + 1)
+        )
+
 
 class TestRoundCompletion:
     """Tests for round completion requirements (Criterion 2)."""
@@ -0,0 +1,106 @@
+"""Tests for the score histogram."""
+
+import random
+
+import pytest
+from src.score_histogram import ScoreHistogram
+from src.scoreboard import Scoreboard
+
+
+def exact_rank(scores, score):
+    """Rank by full scan: 1 + number of strictly higher scores."""
+    return 1 + sum(1 for s in scores if s > score)
+
+
+class TestScoreHistogram:
+    """Test histogram maintenance and lookups."""
+
+    def test_rank_matches_full_scan(self):
+        """Test exact ranks against a full scan on random totals."""
+        rng = random.Random(7)
+        scores = [rng.randint(-300, 900) for _ in range(2000)]
+        histogram = ScoreHistogram(bucket_width=25)
+        for score in scores:
+            histogram.add(score)
+
+        for score in rng.sample(scores, 50) + [-1000, 5000]:
+            assert histogram.rank(score) == exact_rank(scores, score)
+
+    def test_random_updates_match_full_scan(self):
+        """Test ranks and percentiles after moves that widen the range both ways."""
+        rng = random.Random(11)
+        scores = [0] * 500
+        histogram = ScoreHistogram(bucket_width=20)
+        for score in scores:
+            histogram.add(score)
+        for _ in range(3000):
+            index = rng.randrange(len(scores))
+            new = scores[index] + rng.choice((-60, -20, -10, 10, 20, 40, 60))
+            histogram.update(scores[index], new)
+            scores[index] = new
+
+        for score in rng.sample(scores, 40):
+            assert histogram.rank(score) == exact_rank(scores, score)
+            below = sum(1 for s in scores if s < score)
+            assert histogram.percentile(score, exact=True) == pytest.approx(100 * below / 500)
+
+    def test_exact_percentile(self):
+        """Test that exact percentiles count strictly lower totals."""
+        histogram = ScoreHistogram(bucket_width=100)
+        for score in (10, 20, 30, 40):
+            histogram.add(score)
+        assert histogram.percentile(30, exact=True) == pytest.approx(50.0)
+        assert histogram.percentile(10, exact=True) == 0.0
+
+    def test_approximate_lookups_stay_within_bucket(self):
+        """Test that estimates are bounded by the bucket's contents."""
+        histogram = ScoreHistogram(bucket_width=100)
+        for score in (10, 20, 30, 40, 250):
+            histogram.add(score)
+        assert histogram.approximate_rank(250) == 1
+        assert 2 <= histogram.approximate_rank(30) <= 5
+        assert histogram.percentile(250) == pytest.approx(90.0)
+
+    def test_update_and_remove(self):
+        """Test moving and removing totals."""
+        histogram = ScoreHistogram(bucket_width=10)
+        histogram.add(0)
+        histogram.add(0)
+        histogram.update(0, 45)
+        assert histogram.rank(45) == 1
+        assert histogram.rank(0) == 2
+        histogram.remove(45)
+        assert len(histogram) == 1
+        with pytest.raises(ValueError, match="not in histogram"):
+            histogram.remove(45)
+
+    def test_empty_histogram(self):
+        """Test lookups on an empty histogram."""
+        histogram = ScoreHistogram()
+        assert histogram.percentile(10) == 0.0
+        assert histogram.rank(10) == 1
+
+
+class TestScoreboardIntegration:
+    """Test the histogram maintained by a Scoreboard."""
+
+    def test_histogram_tracks_totals(self):
+        """Test that score writes keep the histogram in step."""
+        scoreboard = Scoreboard(histogram=ScoreHistogram(bucket_width=50))
+        for name in ("Alice", "Bob", "Charlie", "Dana"):
+            scoreboard.add_player(name)
+        scoreboard.record_round_score("Alice", 1, 120)
+        scoreboard.record_round_scores([("Bob", 1, 40), ("Charlie", 1, -20), ("Bob", 2, 40)])
+
+        assert scoreboard.rank_of("Alice") == 1
+        assert scoreboard.rank_of("Bob") == 2
+        assert scoreboard.rank_of("Dana") == 3
+        assert scoreboard.percentile_of("Alice", exact=True) == pytest.approx(75.0)
+        assert scoreboard.percentile_of("Charlie", exact=True) == 0.0
+
+    def test_requires_histogram(self):
+        """Test that lookups without a histogram raise RuntimeError."""
+        scoreboard = Scoreboard()
+        scoreboard.add_player("Alice")
+        with pytest.raises(RuntimeError, match="no score histogram"):
+            scoreboard.rank_of("Alice")
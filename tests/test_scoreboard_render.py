@@ -0,0 +1,98 @@
+"""Tests for the multi-format scoreboard renderer."""
+
+import csv
+import io
+import json
+import pickle
+
+import pytest
+from src.scoreboard import Scoreboard
+
+
+@pytest.fixture
+def scoreboard():
+    """Provide a scoreboard with two rounds played."""
+    scoreboard = Scoreboard()
+    scoreboard.add_player("Alice")
+    scoreboard.add_player('Bob "the Bold", Jr.')
+    scoreboard.set_round(2, 5)
+    scoreboard.record_round_score("Alice", 1, 100)
+    scoreboard.record_round_score("Alice", 2, -20)
+    scoreboard.record_round_score('Bob "the Bold", Jr.', 1, 150)
+    return scoreboard
+
+
+class TestFormats:
+    """Test each output format."""
+
+    def test_json_standings(self, scoreboard):
+        """Test that JSON standings parse and carry ranks in order."""
+        document = json.loads(scoreboard.renderer.render("json"))
+        assert document["current_round"] == 2
+        assert document["total_rounds"] == 5
+        assert document["phase"] == "Round"
+        assert [p["name"] for p in document["standings"]] == ['Bob "the Bold", Jr.', "Alice"]
+        assert [p["rank"] for p in document["standings"]] == [1, 2]
+
+    def test_csv_standings(self, scoreboard):
+        """Test that CSV standings quote names correctly."""
+        rows = list(csv.reader(io.StringIO(scoreboard.renderer.render("csv"))))
+        assert rows[0] == ["rank", "name", "total_score"]
+        assert rows[1] == ["1", 'Bob "the Bold", Jr.', "150"]
+        assert rows[2] == ["2", "Alice", "80"]
+
+    def test_json_breakdown_running_totals(self, scoreboard):
+        """Test that JSON breakdowns carry running totals for every round."""
+        document = json.loads(scoreboard.renderer.render("json", "breakdown", "Alice"))
+        assert document["rounds"] == [1, 2]
+        assert [r["running_total"] for r in document["players"][0]["rounds"]] == [100, 80]
+
+    def test_json_status(self, scoreboard):
+        """Test that the JSON status view combines standings and breakdown."""
+        document = json.loads(scoreboard.renderer.render("json", "status"))
+        assert set(document) == {"standings", "breakdown"}
+
+    def test_text_matches_display_methods(self, scoreboard):
+        """Test that text output is what the display methods return."""
+        renderer = scoreboard.renderer
+        assert renderer.render("text") == scoreboard.display_standings()
+        assert "Running Total" in renderer.render("text", "breakdown")
+        assert renderer.render("text", "status").startswith("\n" + "=" * 50)
+
+    def test_empty_board(self):
+        """Test rendering a board with no players."""
+        renderer = Scoreboard().renderer
+        assert renderer.render("text") == "No players in the game."
+        assert json.loads(renderer.render("json"))["standings"] == []
+
+
+class TestRenderMany:
+    """Test single-pass rendering and caching."""
+
+    def test_render_many_agrees_with_render(self, scoreboard):
+        """Test that one pass produces the same documents as separate calls."""
+        many = scoreboard.renderer.render_many(view="breakdown")
+        assert set(many) == {"text", "json", "csv"}
+
+        fresh = pickle.loads(pickle.dumps(scoreboard))
+        for fmt, body in many.items():
+            assert fresh.renderer.render(fmt, "breakdown") == body
+
+    def test_output_cached_until_write(self, scoreboard):
+        """Test that repeated renders reuse output until the board changes."""
+        renderer = scoreboard.renderer
+        first = renderer.render("json")
+        assert renderer.render("json") is first
+
+        scoreboard.record_round_score("Alice", 3, 200)
+        assert renderer.render("json") is not first
+        assert '"total_score": 280' in renderer.render("json")
+
+    def test_invalid_arguments(self, scoreboard):
+        """Test that unknown formats, views and players raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown format"):
+            scoreboard.renderer.render("xml")
+        with pytest.raises(ValueError, match="Unknown view"):
+            scoreboard.renderer.render("text", "chart")
+        with pytest.raises(ValueError, match="not found"):
+            scoreboard.renderer.render("json", "breakdown", "Nobody")
@@ -0,0 +1,87 @@
+"""Tests for the round scoring rules."""
+
+import pytest
+from src.round_progression import RoundProgression
+from src.scoring import SCORE_TABLE, VALID_BIDS, calculate_score, score_round, valid_bids
+
+
+class TestScoring:
+    """Test the scoring rules shared with the Java implementation."""
+
+    @pytest.mark.parametrize("bid, tricks, round_number, expected", [
+        (2, 2, 5, 40),
+        (2, 3, 5, -10),
+        (3, 0, 5, -30),
+        (0, 0, 7, 70),
+        (0, 2, 7, -70),
+    ])
+    def test_calculate_score(self, bid, tricks, round_number, expected):
+        """Test each branch of the scoring rules."""
+        assert calculate_score(bid, tricks, round_number) == expected
+
+    def test_score_round(self):
+        """Test scoring a whole round indexed by player_id."""
+        assert score_round([1, 0, 2], [1, 1, 0], 3) == [20, -30, -20]
+
+    def test_score_round_length_mismatch(self):
+        """Test that mismatched bids and tricks raise ValueError."""
+        with pytest.raises(ValueError, match="2 bids but 3 trick counts"):
+            score_round([1, 0], [1, 0, 0], 1)
+
+
+def java_calculate(bid, tricks_taken, round_number):
+    """Transliteration of ScoreCalculation.calculate from the Java side."""
+    bid_met = bid == tricks_taken
+    if bid == 0:
+        if tricks_taken == 0:
+            score = 10 * round_number
+        else:
+            score = -10 * round_number
+    else:
+        if bid_met:
+            score = 20 * bid
+        else:
+            score = -10 * abs(bid - tricks_taken)
+    return score
+
+
+class TestJavaEquivalence:
+    """Test every valid (round, bid, tricks) against the Java rules."""
+
+    def test_every_valid_combination(self):
+        """Test the score table, calculate_score and score_round over the whole domain."""
+        assert len(SCORE_TABLE) == RoundProgression.MAX_ROUND + 1
+        for round_number in range(RoundProgression.MIN_ROUND, RoundProgression.MAX_ROUND + 1):
+            assert VALID_BIDS[round_number] == range(round_number + 1)
+            assert len(SCORE_TABLE[round_number]) == round_number + 1
+            for bid, row in enumerate(SCORE_TABLE[round_number]):
+                assert row == tuple(
+                    java_calculate(bid, taken, round_number) for taken in range(round_number + 1)
+                )
+            cases = [
+                (bid, taken)
+                for bid in range(round_number + 1)
+                for taken in range(round_number + 1)
+            ]
+            expected = [java_calculate(bid, taken, round_number) for bid, taken in cases]
+            assert [calculate_score(bid, taken, round_number) for bid, taken in cases] == expected
+            bids, tricks = zip(*cases)
+            assert score_round(bids, tricks, round_number) == expected
+
+    @pytest.mark.parametrize("bid, tricks, round_number", [
+        (0, 0, 11),
+        (3, 3, 12),
+        (4, 2, 3),
+        (1, -1, 5),
+        (-1, 0, 5),
+    ])
+    def test_outside_table_uses_formula(self, bid, tricks, round_number):
+        """Test that lookups outside the tables fall back to the Java rules."""
+        expected = java_calculate(bid, tricks, round_number)
+        assert calculate_score(bid, tricks, round_number) == expected
+        assert score_round([bid, 0], [tricks, 0], round_number)[0] == expected
+
+    def test_valid_bids_beyond_table(self):
+        """Test valid bid ranges for rounds past the table."""
+        assert valid_bids(12) == range(13)
+        assert valid_bids(0) == range(1)
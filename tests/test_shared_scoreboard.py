@@ -0,0 +1,148 @@
+"""Tests for the shared-memory scoreboard."""
+
+import multiprocessing
+import pickle
+import struct
+import threading
+
+import pytest
+from src.scoreboard import GamePhase, Scoreboard
+from src.scoreboard_render import ScoreboardRenderer
+from src.shared_scoreboard import SharedScoreboard, SharedScoreboardReader
+
+
+@pytest.fixture
+def board():
+    """Provide a shared scoreboard with three players, destroyed afterwards."""
+    with SharedScoreboard(max_players=4, max_rounds=3) as board:
+        for name in ("Alice", "Bob", "Charlie"):
+            board.add_player(name)
+        board.set_round(1, 3)
+        yield board
+
+
+def render_in_child(name, queue):
+    """Attach in a separate process and send back the rendered status."""
+    with SharedScoreboardReader(name) as reader:
+        queue.put(ScoreboardRenderer(reader).render("text", "status"))
+
+
+class TestSharedScoreboard:
+    """Test publishing to and reading from the shared block."""
+
+    def test_reader_snapshot_matches_writer(self, board):
+        """Test that a reader sees the writer's snapshot."""
+        board.record_round_scores([("Alice", 1, 20), ("Bob", 1, 40), ("Charlie", 2, -10)])
+        board.set_phase(GamePhase.SCORING)
+
+        with SharedScoreboardReader(board.name) as reader:
+            assert reader.snapshot() == board.snapshot()
+
+    def test_renders_match_plain_scoreboard(self, board):
+        """Test that rendering from a reader matches the writer's output."""
+        board.record_round_score("Bob", 1, 30)
+        with SharedScoreboardReader(board.name) as reader:
+            for view in ("standings", "breakdown", "status"):
+                assert ScoreboardRenderer(reader).render("json", view) == (
+                    board.renderer.render("json", view)
+                )
+
+    def test_zero_copy_accessors(self, board):
+        """Test per-player reads through read()."""
+        board.record_round_score("Charlie", 2, 50)
+        with SharedScoreboardReader(board.name) as reader:
+            total, rank, score, name = reader.read(
+                lambda r: (r.total(2), r.rank(2), r.round_score(2, 2), r.name(2))
+            )
+            assert (total, rank, score, name) == (50, 1, 50, "Charlie")
+            assert reader.round_score(2, 1) is None
+            assert reader.rank(3) == 0  # empty slot
+
+    def test_snapshot_cached_per_version(self, board):
+        """Test that readers rebuild only after a write."""
+        with SharedScoreboardReader(board.name) as reader:
+            first = reader.snapshot()
+            assert reader.snapshot() is first
+            board.record_round_score("Alice", 1, 10)
+            assert reader.snapshot().version == board.version
+
+    def test_reader_in_other_process(self, board):
+        """Test rendering from a separate process without pickling the board."""
+        board.record_round_score("Alice", 1, 20)
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=render_in_child, args=(board.name, queue))
+        process.start()
+        text = queue.get(timeout=30)
+        process.join(timeout=30)
+        assert text == board.display_game_status()
+
+    def test_consistent_under_concurrent_writes(self, board):
+        """Test that every read sees a total matching its round scores."""
+        stop = threading.Event()
+
+        def write():
+            score = 0
+            while not stop.is_set():
+                score = (score + 7) % 100
+                board.record_round_scores([("Alice", 1, score), ("Alice", 2, -score)])
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            with SharedScoreboardReader(board.name) as reader:
+                for _ in range(2000):
+                    row = reader.read(lambda r: r.scores(0).tolist())
+                    assert row[0] == sum(s for s in row[1:] if s != -32768)
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_capacity_limits(self, board):
+        """Test that writes beyond the block's capacities are rejected."""
+        board.add_player("Dana")
+        with pytest.raises(ValueError, match="capacity of 4 players"):
+            board.add_player("Eve")
+        with pytest.raises(ValueError, match="capacity of 3 rounds"):
+            board.record_round_score("Alice", 4, 10)
+        assert board.players["Alice"].total_score == 0
+
+    def test_pickled_copy_is_plain_board(self, board):
+        """Test that pickling yields an unpublished copy."""
+        board.record_round_score("Alice", 1, 20)
+        copy = pickle.loads(pickle.dumps(board))
+        copy.record_round_score("Alice", 2, 10)
+        assert copy.players["Alice"].total_score == 30
+        assert isinstance(copy, Scoreboard)
+        with SharedScoreboardReader(board.name) as reader:
+            assert reader.total(0) == 20
+
+    def test_reset_clears_block(self, board):
+        """Test that a reset board publishes an empty block."""
+        board.record_round_score("Alice", 1, 20)
+        board.reset()
+        board.add_player("Zed")
+        board.record_round_score("Zed", 2, 40)
+        with SharedScoreboardReader(board.name) as reader:
+            assert reader.snapshot() == board.snapshot()
+
+    def test_failed_write_leaves_block_readable(self, board):
+        """Test that a write failing mid-sync still ends the seqlock write."""
+        board.current_phase = "bogus"  # not publishable
+        with pytest.raises(KeyError):
+            board.record_round_score("Alice", 1, 20)
+        with SharedScoreboardReader(board.name, timeout=1.0) as reader:
+            reader.read(lambda r: r.total(0))
+            board.set_phase(GamePhase.SCORING)
+            assert reader.snapshot() == board.snapshot()
+
+    def test_read_times_out_mid_write(self, board):
+        """Test that readers give up on a block left mid-write."""
+        seq = struct.unpack_from("=Q", board._shm.buf, 0)[0]
+        struct.pack_into("=Q", board._shm.buf, 0, seq + 1)
+        try:
+            with SharedScoreboardReader(board.name, timeout=0.01) as reader:
+                with pytest.raises(TimeoutError):
+                    reader.read(lambda r: r.total(0))
+        finally:
+            struct.pack_into("=Q", board._shm.buf, 0, seq)
@@ -0,0 +1,69 @@
+"""Tests for vectorized round simulation."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import trick_batch as tb  # noqa: E402
+from src import trick_engine as te  # noqa: E402
+
+
+class TestTrickBatch:
+    """Test batch dealing, play and trick resolution."""
+
+    def test_deal(self):
+        """Test that each round's hands are disjoint and the right size."""
+        hands = tb.deal(50, 6, 10, np.random.default_rng(1))
+        assert hands.shape == (50, 6, 10)
+        for cards in hands.reshape(50, -1):
+            assert len(set(cards.tolist())) == 60
+
+    def test_deal_too_large(self):
+        """Test that a deal needing more than the deck is rejected."""
+        with pytest.raises(ValueError, match="Cannot deal"):
+            tb.deal(1, 7, 10)
+
+    @pytest.mark.parametrize("num_players", [2, 3, 4, 5, 6])
+    def test_winners_match_scalar(self, num_players):
+        """Test trick resolution against trick_winner on random tricks."""
+        rng = np.random.default_rng(num_players)
+        tricks = np.stack([rng.permutation(te.DECK_SIZE)[:num_players] for _ in range(3000)])
+        expected = [te.trick_winner(trick) for trick in tricks.tolist()]
+        assert tb.trick_winners(tricks).tolist() == expected
+
+    def test_tricks_sum_to_round(self):
+        """Test that every trick is awarded to exactly one seat."""
+        rng = np.random.default_rng(4)
+        for round_num in range(1, 11):
+            tricks = tb.play_rounds(200, 5, round_num, rng)
+            assert tricks.shape == (200, 5)
+            assert (tricks.sum(axis=1) == round_num).all()
+
+    def test_play_is_legal_and_scored_like_scalar(self, monkeypatch):
+        """Test each batch round by replaying its cards through trick_engine."""
+        played = []
+        follow = tb._follow
+
+        def recording_follow(lead, card):
+            played.append(card)
+            return follow(lead, card)
+
+        monkeypatch.setattr(tb, "_follow", recording_follow)
+        num_players, round_num, count = 4, 8, 200
+        hands = tb.deal(count, num_players, round_num, np.random.default_rng(9))
+        tricks = tb.play_rounds(count, num_players, round_num, np.random.default_rng(9))
+        cards = np.array(played).reshape(round_num, num_players, count)
+
+        for i in range(count):
+            held = [sum(te.BIT[card] for card in hand) for hand in hands[i].tolist()]
+            leader, taken = (round_num - 1) % num_players, [0] * num_players
+            for trick_cards in cards[:, :, i].tolist():
+                trick = []
+                for position, card in enumerate(trick_cards):
+                    seat = (leader + position) % num_players
+                    assert te.legal_moves(held[seat], trick) & te.BIT[card]
+                    held[seat] ^= te.BIT[card]
+                    trick.append(card)
+                leader = (leader + te.trick_winner(trick)) % num_players
+                taken[leader] += 1
+            assert taken == tricks[i].tolist()
@@ -0,0 +1,131 @@
+"""Tests for the trick-play engine."""
+
+import random
+
+import pytest
+from src import trick_engine as te
+from src.round_pipeline import Game, RoundPipeline
+
+
+def suited(suit, rank):
+    """Get the card for a suit name and rank (1-14)."""
+    return te.SUITS.index(suit) * te.RANKS + rank - 1
+
+
+ESCAPE, PIRATE, MERMAID, SK = te.ESCAPE, te.PIRATE, te.MERMAID, te.SKULL_KING
+
+
+class TestCards:
+    """Test the card encoding."""
+
+    def test_deck_composition(self):
+        """Test the deck's size and card names."""
+        assert te.DECK_SIZE == 69
+        names = [te.card_name(card) for card in range(te.DECK_SIZE)]
+        assert names.count("escape") == 5
+        assert names.count("pirate") == 5
+        assert names.count("mermaid") == 2
+        assert names.count("skull king") == 1
+        assert te.card_name(suited("black", 14)) == "black 14"
+
+    def test_cards_in(self):
+        """Test listing the cards of a bitmask."""
+        assert te.cards_in(te.BIT[3] | te.BIT[SK]) == [3, SK]
+        assert te.cards_in(0) == []
+
+    def test_deal(self):
+        """Test that hands are disjoint and the right size."""
+        hands = te.deal(6, 10, random.Random(1))
+        assert [bin(hand).count("1") for hand in hands] == [10] * 6
+        combined = 0
+        for hand in hands:
+            assert not combined & hand
+            combined |= hand
+
+    def test_deal_too_large(self):
+        """Test that a deal needing more than the deck is rejected."""
+        with pytest.raises(ValueError, match="Cannot deal"):
+            te.deal(7, 10)
+
+
+class TestTrickWinner:
+    """Test trick resolution."""
+
+    @pytest.mark.parametrize("trick, winner", [
+        ([suited("green", 5), suited("green", 12), suited("yellow", 14)], 1),
+        ([suited("green", 5), suited("black", 1), suited("green", 14)], 1),
+        ([suited("green", 5), suited("black", 2), suited("black", 9)], 2),
+        ([ESCAPE, suited("purple", 3), suited("purple", 8)], 2),
+        ([ESCAPE, ESCAPE + 1, ESCAPE + 2], 0),
+        ([suited("black", 14), MERMAID, suited("green", 1)], 1),
+        ([MERMAID, PIRATE, MERMAID + 1], 1),
+        ([PIRATE, PIRATE + 1, suited("black", 14)], 0),
+        ([PIRATE, SK, MERMAID + 1], 2),
+        ([SK, PIRATE, suited("black", 14)], 0),
+        ([MERMAID + 1, SK, MERMAID], 0),
+    ])
+    def test_winner(self, trick, winner):
+        """Test the winning position for each precedence rule."""
+        assert te.trick_winner(trick) == winner
+
+
+class TestLegalMoves:
+    """Test following suit."""
+
+    def test_must_follow_suit(self):
+        """Test that a player holding the suit led must play it or a special."""
+        hand = te.BIT[suited("green", 3)] | te.BIT[suited("black", 9)] | te.BIT[PIRATE]
+        legal = te.legal_moves(hand, [suited("green", 10)])
+        assert te.cards_in(legal) == [suited("green", 3), PIRATE]
+
+    def test_void_in_suit_plays_anything(self):
+        """Test that a player without the suit led may play any card."""
+        hand = te.BIT[suited("black", 9)] | te.BIT[suited("yellow", 2)]
+        assert te.legal_moves(hand, [suited("green", 10)]) == hand
+
+    def test_character_lead_sets_no_suit(self):
+        """Test that no suit is led after a pirate leads."""
+        hand = te.BIT[suited("green", 3)] | te.BIT[suited("black", 9)]
+        assert te.legal_moves(hand, [PIRATE, suited("green", 10)]) == hand
+        assert te.lead_suit([ESCAPE, suited("purple", 4)]) == te.SUITS.index("purple")
+
+
+class TestPlayRound:
+    """Test playing out rounds."""
+
+    def test_tricks_sum_to_round(self):
+        """Test that every trick is awarded to exactly one seat."""
+        rng = random.Random(4)
+        for round_num in range(1, 11):
+            for tricks in te.play_rounds(20, 5, round_num, rng=rng):
+                assert sum(tricks) == round_num
+                assert len(tricks) == 5
+
+    def test_policy_plays_legal_cards(self):
+        """Test that every card a policy returns is played once."""
+        seen = []
+
+        def lowest(legal, trick, rng):
+            card = te.cards_in(legal)[0]
+            seen.append(card)
+            return card
+
+        hands = te.deal(3, 5, random.Random(2))
+        te.play_round(hands, policy=lowest)
+        assert len(seen) == len(set(seen)) == 15
+        assert set(seen) == set(te.cards_in(hands[0] | hands[1] | hands[2]))
+
+    def test_tricks_feed_round_pipeline(self):
+        """Test that simulated tricks complete a game's round."""
+        rng = random.Random(8)
+        game = Game.create(["Alice", "Bob", "Charlie", "Dana"])
+        pipeline = RoundPipeline()
+        for round_num in range(1, 11):
+            if round_num > 1:
+                game.progression.advance_phase()
+            game.progression.start_round()
+            game.collector.start_round(round_num)
+            game.collector.collect_bids({seat: rng.randint(0, round_num) for seat in range(4)})
+            tricks = te.play_round(te.deal(4, round_num, rng), (round_num - 1) % 4, rng=rng)
+            pipeline.complete_round(game, tricks)
+        assert game.progression.is_game_complete